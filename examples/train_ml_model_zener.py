@@ -1,16 +1,18 @@
 # examples/train_ml_model_zener.py
 
 import joblib
-import pandas as pd
+import numpy as np
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import mean_squared_error, r2_score
 from sklearn.model_selection import train_test_split
 
-# Load data
-data = pd.read_csv('zener_training_data.csv')
+from semiconductor_sim.surrogates import export_forest, load_dataset
+
+# Load data written by training_data_zener.py
+data = load_dataset('zener_training_data')
 
 # Features and target
-X = data[['doping_p', 'doping_n', 'temperature']]
+X = np.column_stack([data['doping_p'], data['doping_n'], data['temperature']])
 y = data['zener_voltage']
 
 # Train-test split
@@ -33,3 +35,6 @@ print(f"R^2 Score: {r2:.4f}")
 
 # Save the model
 joblib.dump(model, 'zener_voltage_rf_model.pkl')
+
+# Pickle-free export for deployment: loads with NumPy only (no sklearn/joblib)
+export_forest(model, 'zener_voltage_rf_model.npz')
@@ -1,35 +1,24 @@
 # examples/training_data_zener.py
 
-import numpy as np
-import pandas as pd
+from semiconductor_sim.surrogates import ParameterRange, generate_dataset, zener_voltage_target
 
 
-# Generate synthetic data
-def generate_data(num_samples=1000):
-    doping_p = np.random.uniform(1e16, 1e20, num_samples)
-    doping_n = np.random.uniform(1e16, 1e20, num_samples)
-    temperature = np.random.uniform(250, 400, num_samples)
-
-    zener_voltage = (
-        5.0
-        + 0.1 * np.log10(doping_p)
-        - 0.05 * np.log10(doping_n)
-        + 0.01 * temperature
-        + np.random.normal(0, 0.2, num_samples)
-    )
-
-    data = pd.DataFrame(
+def main(num_samples=1000, out_dir='zener_training_data', jobs=1):
+    # Sample doping and temperature, evaluate in chunks and write .npz shards.
+    # Re-running resumes: shards that already exist are skipped.
+    generate_dataset(
+        zener_voltage_target,
         {
-            'doping_p': doping_p,
-            'doping_n': doping_n,
-            'temperature': temperature,
-            'zener_voltage': zener_voltage,
-        }
+            'doping_p': ParameterRange(1e16, 1e20),
+            'doping_n': ParameterRange(1e16, 1e20),
+            'temperature': ParameterRange(250, 400),
+        },
+        n_samples=num_samples,
+        out_dir=out_dir,
+        seed=42,
+        jobs=jobs,
     )
 
-    return data
-
 
-# Save data to CSV
-data = generate_data()
-data.to_csv('zener_training_data.csv', index=False)
+if __name__ == "__main__":
+    main()
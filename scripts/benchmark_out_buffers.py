@@ -0,0 +1,64 @@
+"""Compare repeated device evaluation with and without preallocated `out=` buffers.
+
+Reports wall time per call and the bytes allocated per call (via tracemalloc)
+for a control-loop style workload: the same device evaluated many times on a
+small, fixed voltage vector.
+
+Run: python scripts/benchmark_out_buffers.py [--points N] [--calls N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+
+from semiconductor_sim import LED, PNJunctionDiode, SolarCell
+
+
+def _per_call(fn: Callable[[], object], calls: int) -> tuple[float, float]:
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    elapsed = (time.perf_counter() - start) / calls
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for _ in range(calls):
+        fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, float(peak - before)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=64)
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    v = np.linspace(-0.2, 0.7, args.points)
+    devices = {
+        "PNJunctionDiode": (PNJunctionDiode(1e17, 1e17), 2),
+        "LED": (LED(1e17, 1e17), 2),
+        "SolarCell": (SolarCell(1e17, 1e17), 1),
+    }
+    print(f"{'device':<16}{'mode':<8}{'us/call':>10}{'peak B':>10}")
+    for name, (dev, n_out) in devices.items():
+        bufs = tuple(np.empty_like(v) for _ in range(n_out))
+        modes = {
+            "alloc": lambda dev=dev: dev.iv_characteristic(v),
+            "out": lambda dev=dev, bufs=bufs: dev.iv_characteristic(v, out=bufs),
+        }
+        for mode, fn in modes.items():
+            t, peak = _per_call(fn, args.calls)
+            print(f"{name:<16}{mode:<8}{t * 1e6:>10.2f}{peak:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
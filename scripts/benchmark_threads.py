@@ -0,0 +1,79 @@
+"""Measure ThreadChunkExecutor speedup against thread count.
+
+Times NumPy-bound library paths on large arrays, called directly and through
+`ThreadChunkExecutor` with 1, 2, 4, ... threads, and prints the speedup of
+each over the direct call. Speedups above 1 need several cores: NumPy
+releases the GIL inside ufunc loops, so chunks run truly in parallel.
+
+Run: python scripts/benchmark_threads.py [--points N] [--threads 1,2,4] [--chunk N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from semiconductor_sim import PNJunctionDiode
+from semiconductor_sim.executors import DEFAULT_CHUNK_ELEMENTS, ThreadChunkExecutor
+from semiconductor_sim.materials import get_material
+from semiconductor_sim.models import srh_recombination
+from semiconductor_sim.utils.numerics import safe_expm1
+
+
+def _best_of(fn: Callable[[], object], repeats: int) -> float:
+    fn()  # warm up
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    default_threads = sorted({1, *(2**i for i in range(1, cpus.bit_length())), cpus})
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=10_000_000)
+    parser.add_argument("--threads", default=",".join(map(str, default_threads)))
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK_ELEMENTS)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    v = np.linspace(-0.2, 0.7, args.points)
+    x = np.linspace(-50.0, 50.0, args.points)
+    n = np.geomspace(1e10, 1e18, args.points)
+    T = np.linspace(200.0, 500.0, args.points)
+    si = get_material("Si")
+    diode = PNJunctionDiode(1e17, 1e17)
+    threads = [int(t) for t in args.threads.split(",")]
+
+    workloads: dict[str, tuple[Callable[[], object], Callable[[ThreadChunkExecutor], object]]] = {
+        "safe_expm1": (lambda: safe_expm1(x), lambda ex: ex.map(safe_expm1, x)),
+        "srh_recombination": (
+            lambda: srh_recombination(n, n[::-1]),
+            lambda ex: ex.map(srh_recombination, n, n[::-1]),
+        ),
+        "Material.ni": (lambda: si.ni(T), lambda ex: ex.map(si.ni, T)),
+        "PN iv_characteristic": (
+            lambda: diode.iv_characteristic(v),
+            lambda ex: ex.iv_characteristic(diode, v),
+        ),
+    }
+    print(f"# {args.points} points, chunk {args.chunk}, {cpus} CPUs, NumPy {np.__version__}")
+    print(f"{'workload':<22}{'threads':>8}{'ms':>10}{'speedup':>9}")
+    for name, (direct, chunked) in workloads.items():
+        base = _best_of(direct, args.repeats)
+        print(f"{name:<22}{'direct':>8}{base * 1e3:>10.1f}{1.0:>9.2f}")
+        for t in threads:
+            with ThreadChunkExecutor(t, chunk_size=args.chunk) as ex:
+                elapsed = _best_of(lambda ex=ex, chunked=chunked: chunked(ex), args.repeats)
+            print(f"{'':<22}{t:>8d}{elapsed * 1e3:>10.1f}{base / elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
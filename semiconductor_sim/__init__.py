@@ -1,19 +1,38 @@
 # semiconductor_sim/__init__.py
 
-from .devices import (
-    BJT,
-    LED,
-    PNP,
-    MOSCapacitor,
-    Photodiode,
-    PINDiode,
-    PNJunctionDiode,
-    SchottkyDiode,
-    SolarCell,
-    TunnelDiode,
-    VaractorDiode,
-    ZenerDiode,
-)
+"""Semiconductor device simulations for teaching and batch studies.
+
+Device classes are imported on first access (PEP 562 module `__getattr__`),
+so `import semiconductor_sim` stays cheap and pulling in one device does not
+load the others or any plotting backend.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .devices import (
+        BJT,
+        LED,
+        PNP,
+        LEDPopulation,
+        MOSCapacitor,
+        Photodiode,
+        PhotodiodePopulation,
+        PINDiode,
+        PINDiodePopulation,
+        PNJunctionDiode,
+        PNJunctionPopulation,
+        SchottkyDiode,
+        SchottkyDiodePopulation,
+        SolarCell,
+        SolarCellPopulation,
+        TunnelDiode,
+        VaractorDiode,
+        ZenerDiode,
+    )
 
 __version__ = "1.0.3"
 
@@ -30,4 +49,27 @@ __all__ = [
     "VaractorDiode",
     "ZenerDiode",
     "PNP",
+    "PNJunctionPopulation",
+    "LEDPopulation",
+    "SolarCellPopulation",
+    "PhotodiodePopulation",
+    "PINDiodePopulation",
+    "SchottkyDiodePopulation",
 ]
+
+_SUBPACKAGES = ("devices", "materials", "models", "surrogates", "utils")
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        value = getattr(importlib.import_module(".devices", __name__), name)
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBPACKAGES})
@@ -0,0 +1,232 @@
+"""asyncio-native device evaluation and sweeps.
+
+The coroutines here split work into chunks and run each chunk in an executor
+(the event loop's default thread pool unless one is given), so the loop keeps
+serving other tasks while NumPy evaluates. Between chunks they honour task
+cancellation, and an optional `budget` (seconds of wall time) stops the work
+early and returns what was finished so far::
+
+    from semiconductor_sim import PNJunctionDiode, aio
+
+    result = await aio.iv_characteristic(
+        PNJunctionDiode(1e17, 1e17), np.linspace(-0.2, 0.7, 10_000_000), budget=0.5
+    )
+    if not result.complete:
+        ...  # result.voltage / result.outputs cover the first result.n_done points
+
+    spec = SweepSpec.from_strings("pn", {"doping_p": "1e15:1e18:1000:log"}, "0:0.7:71")
+    async for params, current in aio.iter_sweep(spec):
+        ...
+
+A chunk that is already running when the task is cancelled or the budget
+runs out cannot be interrupted; it finishes in the background and its result
+is dropped, so `chunk_size` bounds the reaction time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections.abc import AsyncIterator, Mapping
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .sweep import (
+    DEFAULT_CHUNK_SIZE as DEFAULT_SWEEP_CHUNK_SIZE,
+    FloatArray,
+    SweepSpec,
+    evaluate_chunk,
+)
+from .utils.precision import call_in_precision, get_precision
+
+# Voltage points per chunk in `iv_characteristic`
+DEFAULT_CHUNK_SIZE = 65536
+
+
+@dataclass(frozen=True)
+class IVResult:
+    """Outputs of `iv_characteristic` for the first `n_done` voltages.
+
+    Attributes:
+        voltage: The evaluated voltages (a prefix of the requested grid).
+        outputs: The device's output arrays, voltage axis last (0-d
+            outputs that do not depend on voltage stay 0-d). When nothing
+            finished, the voltage axis has length zero.
+        complete: False when the time budget stopped the evaluation early.
+    """
+
+    voltage: FloatArray
+    outputs: tuple[npt.NDArray[np.floating], ...]
+    complete: bool
+
+    @property
+    def n_done(self) -> int:
+        return int(self.voltage.size)
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """Rows of a sweep evaluated so far, in product order.
+
+    Attributes:
+        params: Swept parameter name -> values of the finished rows.
+        current: Currents, shape ``(n_done, n_voltages)``.
+        n_sets: Number of rows in the full sweep.
+        complete: False when the time budget stopped the sweep early.
+    """
+
+    params: Mapping[str, FloatArray]
+    current: FloatArray
+    n_sets: int
+    complete: bool
+
+    @property
+    def n_done(self) -> int:
+        return int(self.current.shape[0])
+
+
+class _Deadline:
+    def __init__(self, budget: float | None) -> None:
+        if budget is not None and budget < 0:
+            raise ValueError("budget must be non-negative")
+        self._end = None if budget is None else time.monotonic() + budget
+
+    def remaining(self) -> float | None:
+        return None if self._end is None else self._end - time.monotonic()
+
+    def expired(self) -> bool:
+        left = self.remaining()
+        return left is not None and left <= 0
+
+
+async def _run(
+    executor: Executor | None, deadline: _Deadline, fn: Any, *args: Any
+) -> tuple[bool, Any]:
+    """Run `fn(*args)` in `executor`; ``(False, None)`` if the deadline passes first."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(call_in_precision, get_precision(), fn, *args)
+    future = loop.run_in_executor(executor, call)
+    try:
+        return True, await asyncio.wait_for(future, deadline.remaining())
+    except asyncio.TimeoutError:  # not the builtin TimeoutError before Python 3.11
+        return False, None
+
+
+async def iv_characteristic(
+    device: Any,
+    voltage: npt.ArrayLike,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    budget: float | None = None,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> IVResult:
+    """
+    Evaluate ``device.iv_characteristic`` chunk by chunk without blocking the loop.
+
+    Parameters:
+    - device: any device or device population
+    - voltage: voltage grid (V), flattened
+    - chunk_size: voltages per chunk
+    - budget: seconds of wall time; when exceeded, the finished prefix is
+      returned with `complete=False`
+    - executor: where chunks run (default: the loop's thread pool)
+    - kwargs: passed to `iv_characteristic` (e.g. `n_conc`, `p_conc`)
+
+    Raises:
+    - asyncio.CancelledError when the awaiting task is cancelled
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    deadline = _Deadline(budget)
+    V = np.asarray(voltage, dtype=float).ravel()
+    parts: list[tuple[npt.NDArray[np.floating], ...]] = []
+    done = 0
+    evaluate = functools.partial(device.iv_characteristic, **kwargs)
+    while done < V.size and not deadline.expired():
+        stop = min(done + chunk_size, V.size)
+        finished, outputs = await _run(executor, deadline, evaluate, V[done:stop])
+        if not finished:
+            break
+        parts.append(tuple(np.asarray(o) for o in outputs))
+        done = stop
+    if not parts:
+        # No chunk finished: a one-point probe fixes the number, dtypes and
+        # leading shapes of the outputs, which are returned with zero voltages
+        probe = V[:1] if V.size else np.zeros(1)
+        _, outputs = await _run(executor, _Deadline(None), evaluate, probe)
+        arrays = (np.asarray(o) for o in outputs)
+        parts.append(tuple(a if a.ndim == 0 else a[..., :0] for a in arrays))
+    # Voltage-independent (0-d) outputs, such as the LED emission with scalar
+    # concentrations, are the same for every chunk: keep the first
+    merged = tuple(
+        arrays[0] if arrays[0].ndim == 0 else np.concatenate(arrays, axis=-1)
+        for arrays in zip(*parts, strict=True)
+    )
+    return IVResult(voltage=V[:done], outputs=merged, complete=done == V.size)
+
+
+async def iter_sweep(
+    spec: SweepSpec,
+    *,
+    chunk_size: int = DEFAULT_SWEEP_CHUNK_SIZE,
+    executor: Executor | None = None,
+) -> AsyncIterator[tuple[dict[str, FloatArray], FloatArray]]:
+    """Async counterpart of `semiconductor_sim.sweep.run_sweep`, one chunk per step.
+
+    Pass a `ProcessPoolExecutor` as `executor` to evaluate chunks on other
+    cores; the next chunk is submitted only after the consumer takes the
+    previous one, so cancelling the consumer stops the sweep.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    no_deadline = _Deadline(None)
+    for start in range(0, spec.n_sets, chunk_size):
+        stop = min(start + chunk_size, spec.n_sets)
+        _, chunk = await _run(executor, no_deadline, evaluate_chunk, spec, start, stop)
+        yield chunk
+
+
+async def run_sweep(
+    spec: SweepSpec,
+    *,
+    chunk_size: int = DEFAULT_SWEEP_CHUNK_SIZE,
+    budget: float | None = None,
+    executor: Executor | None = None,
+) -> SweepResult:
+    """
+    Evaluate a sweep and gather its rows, stopping early when `budget` runs out.
+
+    Returns the rows finished in product order; `complete` tells whether the
+    whole sweep was evaluated.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    deadline = _Deadline(budget)
+    chunks: list[tuple[dict[str, FloatArray], FloatArray]] = []
+    for start in range(0, spec.n_sets, chunk_size):
+        if deadline.expired():
+            break
+        stop = min(start + chunk_size, spec.n_sets)
+        finished, chunk = await _run(executor, deadline, evaluate_chunk, spec, start, stop)
+        if not finished:
+            break
+        chunks.append(chunk)
+    n_voltages = int(np.size(spec.voltage))
+    if chunks:
+        params = {k: np.concatenate([p[k] for p, _ in chunks]) for k in spec.params}
+        current = np.concatenate([c for _, c in chunks])
+    else:
+        params = {k: np.empty(0) for k in spec.params}
+        current = np.empty((0, n_voltages))
+    return SweepResult(
+        params=params,
+        current=current,
+        n_sets=spec.n_sets,
+        complete=current.shape[0] == spec.n_sets,
+    )
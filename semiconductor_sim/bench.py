@@ -0,0 +1,279 @@
+"""Throughput benchmarks for device IV characteristics and model functions.
+
+`device_cases` builds one case per concrete class in
+`semiconductor_sim.devices.__all__` (timing `iv_characteristic` on a voltage
+grid) and `model_cases` one per function in `semiconductor_sim.models.__all__`.
+`run_case` times a case at each requested array size and reports seconds per
+call, points per second and the peak memory allocated by one call (traced with
+`tracemalloc`, which also sees NumPy buffers). The time of a one-point call is
+reported as the case's fixed per-call overhead::
+
+    from semiconductor_sim.bench import device_cases, environment, run_case
+
+    print(environment())
+    for case in device_cases():
+        report = run_case(case, [100, 10_000, 1_000_000])
+        print(case.name, report.overhead_s, [r.points_per_second for r in report.results])
+
+Population classes are timed with `min(size, 100)` voltages per member and
+as many members as needed to reach `size` points, so their numbers are
+directly comparable with the scalar devices. Points count every output value
+of a call, so a BJT with five V_BE curves evaluates ``5 * size`` points.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.metadata
+import inspect
+import os
+import platform
+import time
+import tracemalloc
+import warnings
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from . import __version__
+from .sweep import REQUIRED_DEFAULTS
+
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+# Minimum wall time accumulated per (case, size) measurement
+DEFAULT_MIN_TIME = 0.2
+
+# Voltages per member when timing population classes
+_POPULATION_VOLTAGES = 100
+
+# Sample ranges for array arguments of model functions, by parameter name
+_MODEL_ARRAYS: dict[str, tuple[float, float]] = {
+    "n": (1e10, 1e18),
+    "p": (1e10, 1e18),
+    "T": (200.0, 500.0),
+    "C_dc": (1e-12, 1e-10),
+}
+
+# Values for required scalar arguments of model functions
+_MODEL_SCALARS: dict[str, float] = {"f": 1e6}
+
+TABLE_HEADER = f"{'case':<36}{'points':>10}{'time/call':>12}{'points/s':>12}{'peak MiB':>11}"
+
+_THREAD_VARIABLES = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+# setup(size) -> (zero-argument call, points evaluated per call)
+Setup = Callable[[int], tuple[Callable[[], object], int]]
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """A named workload whose `setup(size)` returns a call and its point count."""
+
+    name: str
+    setup: Setup
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Timing of one case at one array size."""
+
+    size: int
+    points: int
+    calls: int
+    seconds_per_call: float
+    peak_bytes: int
+
+    @property
+    def points_per_second(self) -> float:
+        return self.points / self.seconds_per_call if self.seconds_per_call > 0 else float("inf")
+
+
+@dataclass(frozen=True)
+class CaseReport:
+    """Per-call overhead (one-point call) and per-size results of a case."""
+
+    case: str
+    overhead_s: float
+    results: tuple[BenchResult, ...]
+
+
+def environment() -> dict[str, str]:
+    """Fingerprint of the interpreter, NumPy build and CPU resources."""
+    info = {
+        "semiconductor_sim": _package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "blas": "unknown",
+        "simd": "unknown",
+        "cpu_count": str(os.cpu_count()),
+    }
+    if hasattr(os, "sched_getaffinity"):
+        info["cpus_usable"] = str(len(os.sched_getaffinity(0)))
+    try:
+        config = np.show_config(mode="dicts")  # NumPy >= 1.26
+    except TypeError:
+        config = None
+    if config:
+        blas = config.get("Build Dependencies", {}).get("blas", {})
+        info["blas"] = f"{blas.get('name', 'unknown')} {blas.get('version', '')}".strip()
+        simd = config.get("SIMD Extensions", {})
+        info["simd"] = " ".join(simd.get("found") or simd.get("baseline") or []) or "none"
+    for var in _THREAD_VARIABLES:
+        if var in os.environ:
+            info[var] = os.environ[var]
+    return info
+
+
+def _package_version() -> str:
+    """Installed distribution version, else the source tree's `__version__`."""
+    try:
+        return importlib.metadata.version("semiconductor-sim")
+    except importlib.metadata.PackageNotFoundError:
+        return __version__
+
+
+def _device_setup(cls: type) -> Setup:
+    accepted = inspect.signature(cls).parameters
+    kwargs = {k: v for k, v in REQUIRED_DEFAULTS.items() if k in accepted}
+    population = _is_population(cls)
+
+    def setup(size: int) -> tuple[Callable[[], object], int]:
+        if population:
+            n_v = min(size, _POPULATION_VOLTAGES)
+            members = max(size // n_v, 1)
+            # Members differ in doping, or in temperature where there is none
+            params: dict[str, Any] = dict(kwargs)
+            if "doping_p" in accepted:
+                params["doping_p"] = np.geomspace(1e15, 1e18, members)
+            else:
+                params["temperature"] = np.linspace(250.0, 400.0, members)
+            device = cls(**params)
+        else:
+            n_v, members = size, 1
+            device = cls(**kwargs)
+        voltage = np.linspace(-0.2, 0.7, n_v)
+        # Outputs per voltage from a one-point call: population members, or
+        # the V_BE curves of a BJT, all count as evaluated points
+        per_voltage = int(np.size(device.iv_characteristic(voltage[:1])[0]))
+        return (lambda: device.iv_characteristic(voltage)), n_v * per_voltage
+
+    return setup
+
+
+def _is_population(cls: type) -> bool:
+    base = importlib.import_module("semiconductor_sim.devices").DevicePopulation
+    return issubclass(cls, base)
+
+
+def device_cases() -> list[BenchCase]:
+    """One case per concrete device or population class in `devices.__all__`."""
+    devices = importlib.import_module("semiconductor_sim.devices")
+    cases = []
+    for name in devices.__all__:
+        cls = getattr(devices, name)
+        if inspect.isclass(cls) and not inspect.isabstract(cls):
+            cases.append(BenchCase(f"devices.{name}", _device_setup(cls)))
+    return cases
+
+
+def _model_setup(fn: Callable[..., object], arrays: Sequence[str], scalars: Sequence[str]) -> Setup:
+    def setup(size: int) -> tuple[Callable[[], object], int]:
+        kwargs: dict[str, Any] = {k: _MODEL_SCALARS[k] for k in scalars}
+        for k in arrays:
+            low, high = _MODEL_ARRAYS[k]
+            kwargs[k] = np.geomspace(low, high, size)
+        return (lambda: fn(**kwargs)), size
+
+    return setup
+
+
+def model_cases() -> list[BenchCase]:
+    """One case per function in `models.__all__` whose inputs can be synthesized."""
+    models = importlib.import_module("semiconductor_sim.models")
+    cases = []
+    for name in models.__all__:
+        fn = getattr(models, name)
+        if not inspect.isfunction(fn):
+            continue
+        required = [
+            p.name
+            for p in inspect.signature(fn).parameters.values()
+            if p.default is inspect.Parameter.empty
+        ]
+        if not all(p in _MODEL_ARRAYS or p in _MODEL_SCALARS for p in required):
+            continue
+        arrays = [p for p in required if p in _MODEL_ARRAYS]
+        scalars = [p for p in required if p in _MODEL_SCALARS]
+        cases.append(BenchCase(f"models.{name}", _model_setup(fn, arrays, scalars)))
+    return cases
+
+
+def peak_memory(fn: Callable[[], object]) -> int:
+    """Peak bytes allocated (and traced by `tracemalloc`) during one call of `fn`."""
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return max(peak - before, 0)
+
+
+def time_call(fn: Callable[[], object], *, min_time: float = DEFAULT_MIN_TIME) -> tuple[float, int]:
+    """Mean seconds per call and call count, doubling calls until `min_time` elapses."""
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / calls, calls
+        calls *= 2
+
+
+def measure(case: BenchCase, size: int, *, min_time: float = DEFAULT_MIN_TIME) -> BenchResult:
+    """Time `case` at `size` points; the traced first call doubles as warm-up."""
+    fn, points = case.setup(int(size))
+    peak = peak_memory(fn)
+    seconds, calls = time_call(fn, min_time=min_time)
+    return BenchResult(
+        size=int(size), points=points, calls=calls, seconds_per_call=seconds, peak_bytes=peak
+    )
+
+
+def run_case(
+    case: BenchCase, sizes: Iterable[int], *, min_time: float = DEFAULT_MIN_TIME
+) -> CaseReport:
+    """Overhead and results of `case` at each of `sizes`, with warnings silenced."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        overhead = measure(case, 1, min_time=min_time).seconds_per_call
+        results = tuple(measure(case, s, min_time=min_time) for s in sizes)
+    return CaseReport(case=case.name, overhead_s=overhead, results=results)
+
+
+def format_report(report: CaseReport) -> str:
+    """Table rows for one case: overhead first, then one row per size."""
+    lines = [f"{report.case:<36}{'overhead':>10}{_format_seconds(report.overhead_s):>12}"]
+    for r in report.results:
+        lines.append(
+            f"{'':<36}{r.points:>10d}{_format_seconds(r.seconds_per_call):>12}"
+            f"{r.points_per_second:>12.3g}{r.peak_bytes / 2**20:>11.2f}"
+        )
+    return "\n".join(lines)
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
@@ -1,23 +1,39 @@
-"""Minimal CLI to run quick semiconductor_sim demos for learners.
+"""Minimal CLI to run quick semiconductor_sim demos and parameter sweeps.
 
 Usage:
     semisim demo pn
     semisim demo led
+    semisim sweep pn -p doping_p=1e15:1e18:31:log -p temperature=250,300,350 \
+        -V=-0.2:0.7:91 --jobs 4 -o sweep.csv
+    semisim serve --port 8000
+    semisim bench --sizes 1e2,1e4,1e6 --only PNJunction --json bench.json
 
-This avoids any heavy dependencies and prints a short numeric summary.
+Demos avoid any heavy dependencies and print a short numeric summary. Sweeps
+stream chunks to `.csv` (long format: parameters, voltage, current; `-` for
+stdout) or `.npy` (one row per parameter set: parameters, then currents).
+`serve` answers IV requests over HTTP, batching concurrent ones.
+Benchmarks print an environment fingerprint and a throughput table.
 """
 
 from __future__ import annotations
 
 import argparse
-from collections.abc import Sequence
+import json
+import os
+import sys
+from collections.abc import Iterator, Sequence
+from dataclasses import asdict
+from typing import TextIO
 
 import numpy as np
+import numpy.typing as npt
 
-from . import LED, PNJunctionDiode
+from .sweep import DEFAULT_CHUNK_SIZE, DEVICES, SweepSpec, parse_values, run_sweep
 
 
 def demo_pn() -> None:
+    from .devices import PNJunctionDiode
+
     voltage = np.linspace(-0.2, 0.7, 10)
     d = PNJunctionDiode(doping_p=1e17, doping_n=1e17)
     current, recomb = d.iv_characteristic(voltage, n_conc=1e16, p_conc=1e16)
@@ -28,6 +44,8 @@ def demo_pn() -> None:
 
 
 def demo_led() -> None:
+    from .devices import LED
+
     voltage = np.linspace(0.0, 2.0, 10)
     d = LED(doping_p=1e17, doping_n=1e17)
     current, emission = d.iv_characteristic(voltage)
@@ -37,12 +55,223 @@ def demo_led() -> None:
         print(f"{v: .3f}  {i: .3e}  {e: .3e}")
 
 
+SweepChunks = Iterator[tuple[dict[str, npt.NDArray[np.float64]], npt.NDArray[np.float64]]]
+
+
+def _write_csv(fh: TextIO, spec: SweepSpec, chunks: SweepChunks) -> None:
+    fh.write(",".join([*spec.params, "voltage", "current"]) + "\n")
+    V = np.asarray(spec.voltage, dtype=float)
+    for params, current in chunks:
+        n = current.shape[0]
+        columns = [np.repeat(v, V.size) for v in params.values()]
+        table = np.column_stack([*columns, np.tile(V, n), current.ravel()])
+        np.savetxt(fh, table, delimiter=",", fmt="%.10g")
+
+
+def _write_npy(path: str, spec: SweepSpec, chunks: SweepChunks) -> None:
+    n_params = len(spec.params)
+    out = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.float64, shape=(spec.n_sets, n_params + np.size(spec.voltage))
+    )
+    row = 0
+    for params, current in chunks:
+        n = current.shape[0]
+        for j, values in enumerate(params.values()):
+            out[row : row + n, j] = values
+        out[row : row + n, n_params:] = current
+        row += n
+    out.flush()
+    del out
+
+
+def _parse_assignments(
+    parser: argparse.ArgumentParser, items: Sequence[str], option: str
+) -> dict[str, str]:
+    pairs = {}
+    for item in items:
+        name, sep, value = item.partition("=")
+        if not sep or not name or not value:
+            parser.error(f"{option} expects NAME=VALUE, got {item!r}")
+        pairs[name.strip()] = value.strip()
+    return pairs
+
+
+def sweep(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    try:
+        spec = SweepSpec.from_strings(
+            args.device,
+            _parse_assignments(parser, args.param, "--param"),
+            args.voltage,
+            _parse_assignments(parser, args.fixed, "--set"),
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    chunks = run_sweep(spec, chunk_size=args.chunk_size, jobs=jobs)
+    if args.output == "-":
+        try:
+            _write_csv(sys.stdout, spec, chunks)
+        except BrokenPipeError:
+            # The consumer (e.g. `head`) closed the pipe: stop quietly
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return
+    elif args.output.endswith(".npy"):
+        _write_npy(args.output, spec, chunks)
+    else:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            _write_csv(fh, spec, chunks)
+    print(
+        f"sweep: {spec.n_sets} parameter sets x {np.size(spec.voltage)} voltages "
+        f"-> {'stdout' if args.output == '-' else args.output}",
+        file=sys.stderr,
+    )
+
+
+def bench(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    from . import bench as _bench
+
+    try:
+        sizes = (
+            list(_bench.DEFAULT_SIZES)
+            if args.sizes is None
+            else [int(s) for s in parse_values(args.sizes)]
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    if not sizes or min(sizes) < 1:
+        parser.error("--sizes must be positive")
+    cases = [
+        c
+        for c in (*_bench.device_cases(), *_bench.model_cases())
+        if not args.only or any(pattern in c.name for pattern in args.only)
+    ]
+    if not cases:
+        parser.error("no benchmark matches --only")
+    min_time = _bench.DEFAULT_MIN_TIME if args.min_time is None else args.min_time
+    info = _bench.environment()
+    for key, value in info.items():
+        print(f"# {key}: {value}")
+    print(_bench.TABLE_HEADER)
+    reports = []
+    for case in cases:
+        report = _bench.run_case(case, sizes, min_time=min_time)
+        print(_bench.format_report(report), flush=True)
+        reports.append(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump({"environment": info, "cases": [asdict(r) for r in reports]}, fh, indent=2)
+
+
+def serve(args: argparse.Namespace) -> None:
+    from .serve import make_server
+
+    server = make_server(
+        args.host,
+        args.port,
+        window=args.window_ms / 1e3,
+        max_batch=args.max_batch,
+        warm=not args.no_warm,
+        verbose=args.verbose,
+    )
+    print(
+        f"serving on http://{args.host}:{server.server_port} (POST /iv, GET /health, GET /stats)",
+        file=sys.stderr,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="semisim", description="SemiconductorSim CLI demos")
     sub = parser.add_subparsers(dest="command", required=True)
 
     demo = sub.add_parser("demo", help="Run a quick device demo")
     demo.add_argument("device", choices=["pn", "led"], help="Which device demo to run")
+
+    sw = sub.add_parser(
+        "sweep",
+        help="Sweep device parameters over a voltage grid",
+        description="Evaluate the Cartesian product of swept parameters in chunks "
+        "and stream currents to .csv/.npy. VALUES is a comma list or start:stop:num[:log].",
+    )
+    sw.add_argument("device", choices=list(DEVICES), help="Device to sweep")
+    sw.add_argument(
+        "-p",
+        "--param",
+        action="append",
+        default=[],
+        metavar="NAME=VALUES",
+        help="Swept constructor parameter (repeatable, at least one)",
+    )
+    sw.add_argument(
+        "-s",
+        "--set",
+        dest="fixed",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Constant constructor parameter (repeatable)",
+    )
+    sw.add_argument(
+        "-V", "--voltage", default="-0.2:0.7:91", metavar="VALUES", help="Voltage grid (V)"
+    )
+    sw.add_argument("-j", "--jobs", type=int, default=1, help="Worker processes (0: all CPUs)")
+    sw.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Parameter sets per chunk",
+    )
+    sw.add_argument(
+        "-o", "--output", default="-", help="Output .csv or .npy path ('-': CSV on stdout)"
+    )
+
+    sv = sub.add_parser(
+        "serve",
+        help="Serve IV requests over HTTP/JSON",
+        description="Answer POST /iv requests, coalescing concurrent requests for the "
+        "same device and voltage grid into one vectorized batch.",
+    )
+    sv.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    sv.add_argument("--port", type=int, default=8000, help="TCP port (0: any free port)")
+    sv.add_argument(
+        "--window-ms",
+        type=float,
+        default=2.0,
+        help="Milliseconds to wait for more requests before evaluating a batch",
+    )
+    sv.add_argument("--max-batch", type=int, default=1024, help="Largest batch evaluated at once")
+    sv.add_argument("--no-warm", action="store_true", help="Skip warming device caches")
+    sv.add_argument("-v", "--verbose", action="store_true", help="Log every request")
+
+    bn = sub.add_parser(
+        "bench",
+        help="Time device and model throughput",
+        description="Time iv_characteristic of every device and each model function "
+        "at several array sizes; report per-call overhead, points/s and peak memory.",
+    )
+    bn.add_argument(
+        "--sizes",
+        metavar="VALUES",
+        help="Points per call: comma list or start:stop:num[:log] (default 1e2..1e7)",
+    )
+    bn.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Run cases whose name contains PATTERN (repeatable)",
+    )
+    bn.add_argument(
+        "--min-time",
+        type=float,
+        help="Minimum seconds spent timing each size (default 0.2)",
+    )
+    bn.add_argument("--json", metavar="PATH", help="Also write the results as JSON")
     return parser
 
 
@@ -54,6 +283,12 @@ def main(argv: Sequence[str] | None = None) -> int:
             demo_pn()
         elif args.device == "led":
             demo_led()
+    elif args.command == "sweep":
+        sweep(parser, args)
+    elif args.command == "serve":
+        serve(args)
+    elif args.command == "bench":
+        bench(parser, args)
     return 0
 
 
@@ -1,30 +1,91 @@
 # semiconductor_sim/devices/__init__.py
 
-from .base import Device
-from .bjt import BJT, PNP
-from .led import LED
-from .mos_capacitor import MOSCapacitor
-from .photodiode import Photodiode
-from .pin_diode import PINDiode
-from .pn_junction import PNJunctionDiode
-from .schottky import SchottkyDiode
-from .solar_cell import SolarCell
-from .tunnel_diode import TunnelDiode
-from .varactor_diode import VaractorDiode
-from .zener_diode import ZenerDiode
+"""Device models, each imported from its module on first attribute access."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import Device
+    from .bjt import BJT, PNP
+    from .led import LED
+    from .mos_capacitor import MOSCapacitor
+    from .photodiode import Photodiode
+    from .pin_diode import PINDiode
+    from .pn_junction import PNJunctionDiode
+    from .population import (
+        DevicePopulation,
+        LEDPopulation,
+        PhotodiodePopulation,
+        PINDiodePopulation,
+        PNJunctionPopulation,
+        SchottkyDiodePopulation,
+        SolarCellPopulation,
+    )
+    from .schottky import SchottkyDiode
+    from .solar_cell import SolarCell
+    from .tunnel_diode import TunnelDiode
+    from .varactor_diode import VaractorDiode
+    from .zener_diode import ZenerDiode
+
+# Public name -> defining submodule
+_EXPORTS = {
+    "BJT": ".bjt",
+    "PNP": ".bjt",
+    "Device": ".base",
+    "DevicePopulation": ".population",
+    "LED": ".led",
+    "LEDPopulation": ".population",
+    "MOSCapacitor": ".mos_capacitor",
+    "PINDiode": ".pin_diode",
+    "PINDiodePopulation": ".population",
+    "PNJunctionDiode": ".pn_junction",
+    "PNJunctionPopulation": ".population",
+    "Photodiode": ".photodiode",
+    "PhotodiodePopulation": ".population",
+    "SchottkyDiode": ".schottky",
+    "SchottkyDiodePopulation": ".population",
+    "SolarCell": ".solar_cell",
+    "SolarCellPopulation": ".population",
+    "TunnelDiode": ".tunnel_diode",
+    "VaractorDiode": ".varactor_diode",
+    "ZenerDiode": ".zener_diode",
+}
 
 __all__ = [
     "BJT",
     "PNP",
     "Device",
+    "DevicePopulation",
     "LED",
+    "LEDPopulation",
     "MOSCapacitor",
     "PINDiode",
+    "PINDiodePopulation",
     "PNJunctionDiode",
+    "PNJunctionPopulation",
     "Photodiode",
+    "PhotodiodePopulation",
     "SchottkyDiode",
+    "SchottkyDiodePopulation",
     "SolarCell",
+    "SolarCellPopulation",
     "TunnelDiode",
     "VaractorDiode",
     "ZenerDiode",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
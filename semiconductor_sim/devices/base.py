@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from typing import ClassVar
 
 import numpy as np
 import numpy.typing as npt
 
-from semiconductor_sim.utils import DEFAULT_T
+from semiconductor_sim.utils import DEFAULT_T, k_B, q
+from semiconductor_sim.utils.numerics import safe_expm1
+from semiconductor_sim.utils.precision import as_precision, get_precision
 
 
 class Device(ABC):
@@ -14,8 +18,17 @@ class Device(ABC):
 
     Provides common fields and establishes a standard API for IV
     characteristics. Subclasses must implement `iv_characteristic`.
+
+    Subclasses that set `supports_out = True` accept a keyword-only `out`
+    tuple of preallocated arrays (float64, or the compute dtype under
+    `precision`) in `iv_characteristic` and write their results into it
+    without array temporaries: the per-call allocation is a few hundred bytes
+    of Python objects (330 B for a PN diode in
+    `scripts/benchmark_out_buffers.py`) however long the voltage array is.
     """
 
+    supports_out: ClassVar[bool] = False
+
     def __init__(self, area: float = 1e-4, temperature: float = DEFAULT_T) -> None:
         if not np.isfinite(area) or area <= 0:
             raise ValueError("area must be a positive finite value (cm^2)")
@@ -38,6 +51,149 @@ class Device(ABC):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _diode_current_into(
+        voltage_array: npt.ArrayLike,
+        I_s: float,
+        V_T: float,
+        out: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """Write I_s * expm1(V / V_T) into `out` without array temporaries."""
+        np.divide(voltage_array, V_T, out=out)
+        safe_expm1(out, out=out)
+        out *= I_s
+        return out
+
+    def saturation_current_at(
+        self, temperature: float | npt.NDArray[np.floating]
+    ) -> npt.NDArray[np.floating]:
+        """
+        Vectorized saturation current evaluated at `temperature` (K).
+
+        Diode-family devices override this to enable `iv_temperature_grid`.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support temperature-grid evaluation"
+        )
+
+    def _grid_current(
+        self,
+        voltage: npt.NDArray[np.floating],
+        V_T: npt.NDArray[np.floating],
+        I_s: npt.NDArray[np.floating],
+    ) -> npt.NDArray[np.floating]:
+        """Current law used by `iv_temperature_grid`; arguments are broadcastable."""
+        return I_s * safe_expm1(voltage / V_T)
+
+    def iv_temperature_grid(
+        self,
+        voltage_array: npt.NDArray[np.floating],
+        temperatures: npt.NDArray[np.floating],
+    ) -> tuple[npt.NDArray[np.floating], ...]:
+        """
+        Evaluate the I–V curve over a (temperature × voltage) grid in one pass.
+
+        `n_i(T)`, `I_s(T)` and `V_T(T)` are computed as vectors and broadcast
+        against the voltage sweep, so no per-temperature device rebuild is needed.
+        Other device parameters are taken from this instance.
+
+        Parameters:
+            voltage_array: Array of voltage values (V)
+            temperatures: Array of temperatures (K)
+
+        Returns:
+            `(current,)` where current has shape ``(n_temperatures, n_voltages)``.
+        """
+        T = np.asarray(temperatures, dtype=float).ravel()
+        if not np.all(np.isfinite(T)) or np.any(T <= 0):
+            raise ValueError("temperature must be a positive finite value (K)")
+        V = np.asarray(voltage_array, dtype=float).ravel()
+        I_s = np.asarray(self.saturation_current_at(T), dtype=float)
+        V_T = k_B * T / q
+        I = self._grid_current(V[None, :], V_T[:, None], I_s[:, None])
+        return (as_precision(I),)
+
+    def iter_iv(
+        self,
+        voltage_source: Iterable[npt.ArrayLike],
+        *,
+        chunk_size: int = 65536,
+        n_conc: float | None = None,
+        p_conc: float | None = None,
+        copy: bool = False,
+    ) -> Iterator[tuple[npt.NDArray[np.floating], ...]]:
+        """
+        Stream `iv_characteristic` over an iterable of voltage chunks.
+
+        Input chunks of any size (including scalars) are re-packed into a
+        fixed-size buffer of `chunk_size` samples, so memory stays bounded no
+        matter how long the source is. Each yielded tuple mirrors the return
+        value of `iv_characteristic`, with the voltage axis last; 0-d outputs
+        (e.g. LED emission for scalar concentrations) are passed through as-is.
+        Devices with `supports_out` write straight into the reused output
+        buffers.
+
+        Parameters:
+            voltage_source: Iterable or generator of voltage arrays/scalars (V)
+            chunk_size: Number of samples evaluated per step
+            n_conc: Optional scalar electron concentration (cm^-3)
+            p_conc: Optional scalar hole concentration (cm^-3)
+            copy: If False (default), yielded arrays are views into buffers
+                reused by the next step; copy them to keep results around.
+
+        Yields:
+            Tuples of arrays whose last axis has at most `chunk_size` samples.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        # Buffers follow the compute dtype, so float32 streaming halves their memory
+        v_buf = np.empty(chunk_size, dtype=get_precision())
+        # One buffer per output; None marks a 0-d output, which is passed through
+        out_bufs: list[npt.NDArray[np.floating] | None] = []
+
+        def evaluate(n: int) -> tuple[npt.NDArray[np.floating], ...]:
+            writable = [buf for buf in out_bufs if buf is not None]
+            if out_bufs and self.supports_out and not copy and len(writable) == len(out_bufs):
+                targets = tuple(buf[..., :n] for buf in writable)
+                return self.iv_characteristic(  # type: ignore[call-arg]
+                    v_buf[:n], n_conc=n_conc, p_conc=p_conc, out=targets
+                )
+            results = tuple(
+                np.asarray(r)
+                for r in self.iv_characteristic(v_buf[:n], n_conc=n_conc, p_conc=p_conc)
+            )
+            if copy:
+                return tuple(np.array(r) for r in results)
+            if len(out_bufs) != len(results):
+                out_bufs[:] = [
+                    None if r.ndim == 0 else np.empty((*r.shape[:-1], chunk_size), dtype=r.dtype)
+                    for r in results
+                ]
+            views = []
+            for buf, r in zip(out_bufs, results, strict=True):
+                if buf is None:
+                    views.append(r)
+                    continue
+                view = buf[..., :n]
+                view[...] = r
+                views.append(view)
+            return tuple(views)
+
+        fill = 0
+        for chunk in voltage_source:
+            arr = np.asarray(chunk, dtype=float).ravel()
+            pos = 0
+            while pos < arr.size:
+                take = min(chunk_size - fill, arr.size - pos)
+                v_buf[fill : fill + take] = arr[pos : pos + take]
+                fill += take
+                pos += take
+                if fill == chunk_size:
+                    yield evaluate(fill)
+                    fill = 0
+        if fill:
+            yield evaluate(fill)
+
     def __repr__(self) -> str:
         cls = self.__class__.__name__
         return f"{cls}(area={self.area}, temperature={self.temperature})"
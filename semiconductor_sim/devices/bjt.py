@@ -5,7 +5,8 @@ Implements a forward-active Ebers–Moll style collector current with Early effe
     I_C(V_CE, V_BE) = I_S * exp(V_BE / V_T) * (1 + V_CE / V_A)
 
 This simple model generates output characteristics over a sweep of V_CE for
-one or more specified V_BE values.
+one or more specified V_BE values, arbitrary (V_BE × V_CE) grids via `iv_grid`,
+and Gummel-style V_BE sweeps at fixed V_CE via `gummel_characteristic`.
 
 Assumptions:
 - Forward-active region (no explicit saturation modeling beyond non-negativity).
@@ -21,6 +22,7 @@ import numpy.typing as npt
 from semiconductor_sim.materials import Material
 from semiconductor_sim.utils import DEFAULT_T, k_B, q
 from semiconductor_sim.utils.numerics import safe_expm1
+from semiconductor_sim.utils.precision import as_precision
 
 from .base import Device
 
@@ -93,25 +95,55 @@ class BJT(Device):
             where I_C has shape (N_VBE, N_VCE) corresponding to self.vbe_values
             by rows and the provided V_CE array by columns.
         """
-        V_CE = np.asarray(voltage_array, dtype=float).ravel()
-        V_T = k_B * self.temperature / q
+        return self.iv_grid(self.vbe_values, voltage_array)
 
-        # Compute exp(V_BE / V_T) safely to handle small/large values
-        exp_vbe = safe_expm1(self.vbe_values / V_T) + 1.0  # equals exp(V_BE / V_T)
-        # Outer products to form grid over (V_BE, V_CE)
-        term_vbe = exp_vbe[:, None]
+    def _early_factor(self, V_CE: npt.NDArray[np.floating]) -> npt.NDArray[np.floating] | float:
         va = float(self.early_voltage)
-        n_vbe = int(self.vbe_values.size)
-        n_vce = int(V_CE.size)
-        term_early = np.ones((n_vbe, n_vce), dtype=float)
         if np.isfinite(va) and va > 0.0:
-            base = 1.0 + (V_CE / va)
-            term_early[:] = base
+            return 1.0 + (V_CE / va)
+        return 1.0
+
+    def iv_grid(
+        self,
+        vbe_array: npt.ArrayLike,
+        vce_array: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.floating], ...]:
+        """Collector current over an arbitrary (V_BE × V_CE) grid.
 
-        I_C = self.I_s * term_vbe * term_early
-        I_C = np.maximum(I_C, 0.0)
+        The grid is formed by broadcasting a V_BE column against a V_CE row,
+        so only the two 1-D factors and the output array are allocated.
+
+        Parameters:
+            vbe_array: Base–emitter voltages V_BE (V)
+            vce_array: Collector–emitter voltages V_CE (V)
+
+        Returns:
+            (I_C,) with shape (N_VBE, N_VCE).
+        """
+        V_BE = np.asarray(vbe_array, dtype=float).ravel()
+        V_CE = np.asarray(vce_array, dtype=float).ravel()
+        V_T = k_B * self.temperature / q
+
+        # Compute exp(V_BE / V_T) safely to handle small/large values
+        term_vbe = as_precision(self.I_s * (safe_expm1(V_BE / V_T) + 1.0))  # I_S * exp(V_BE / V_T)
+        term_early = np.broadcast_to(as_precision(self._early_factor(V_CE)), V_CE.shape)
+        I_C = np.multiply(term_vbe[:, None], term_early[None, :])
+        np.maximum(I_C, 0.0, out=I_C)
         return (I_C,)
 
+    def gummel_characteristic(
+        self,
+        vbe_array: npt.ArrayLike,
+        vce: float = 0.0,
+    ) -> tuple[npt.NDArray[np.floating], ...]:
+        """Collector current for a V_BE sweep at fixed V_CE (Gummel-plot style).
+
+        Returns:
+            (I_C,) with the shape of the flattened `vbe_array`.
+        """
+        (I_C,) = self.iv_grid(vbe_array, [vce])
+        return (I_C[:, 0],)
+
     def __repr__(self) -> str:
         return (
             f"BJT(doping_p={self.doping_p}, doping_n={self.doping_n}, area={self.area}, "
@@ -180,24 +212,51 @@ class PNP(Device):
             (I_C,)
             where I_C has shape (N_VEB, N_VCE) corresponding to self.veb_values by rows.
         """
-        V_CE = np.asarray(voltage_array, dtype=float).ravel()
-        V_T = k_B * self.temperature / q
+        return self.iv_grid(self.veb_values, voltage_array)
 
-        exp_veb = safe_expm1(self.veb_values / V_T) + 1.0
-        term_veb = exp_veb[:, None]
+    def _early_factor(self, V_CE: npt.NDArray[np.floating]) -> npt.NDArray[np.floating] | float:
         va = float(self.early_voltage)
-        n_veb = int(self.veb_values.size)
-        n_vce = int(V_CE.size)
-        term_early = np.ones((n_veb, n_vce), dtype=float)
         if np.isfinite(va) and va > 0.0:
-            base = 1.0 + ((-V_CE) / va)
-            term_early[:] = base
+            return 1.0 + ((-V_CE) / va)
+        return 1.0
 
-        I_C_mag = self.I_s * term_veb * term_early
-        I_C = -I_C_mag
-        I_C = np.minimum(I_C, 0.0)
+    def iv_grid(
+        self,
+        veb_array: npt.ArrayLike,
+        vce_array: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.floating], ...]:
+        """Collector current over an arbitrary (V_EB × V_CE) grid.
+
+        Broadcasts a V_EB column against a V_CE row; the result is the only
+        full-size array allocated. Forward conduction gives negative I_C.
+
+        Returns:
+            (I_C,) with shape (N_VEB, N_VCE).
+        """
+        V_EB = np.asarray(veb_array, dtype=float).ravel()
+        V_CE = np.asarray(vce_array, dtype=float).ravel()
+        V_T = k_B * self.temperature / q
+
+        term_veb = as_precision(self.I_s * (safe_expm1(V_EB / V_T) + 1.0))
+        term_early = np.broadcast_to(as_precision(self._early_factor(V_CE)), V_CE.shape)
+        I_C = np.multiply(term_veb[:, None], term_early[None, :])
+        np.negative(I_C, out=I_C)
+        np.minimum(I_C, 0.0, out=I_C)
         return (I_C,)
 
+    def gummel_characteristic(
+        self,
+        veb_array: npt.ArrayLike,
+        vce: float = 0.0,
+    ) -> tuple[npt.NDArray[np.floating], ...]:
+        """Collector current for a V_EB sweep at fixed V_CE (Gummel-plot style).
+
+        Returns:
+            (I_C,) with the shape of the flattened `veb_array`.
+        """
+        (I_C,) = self.iv_grid(veb_array, [vce])
+        return (I_C[:, 0],)
+
     def __repr__(self) -> str:
         return (
             f"PNP(doping_p={self.doping_p}, doping_n={self.doping_n}, area={self.area}, "
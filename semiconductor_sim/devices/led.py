@@ -2,13 +2,12 @@
 
 import numpy as np
 import numpy.typing as npt
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 from semiconductor_sim.materials import Material
 from semiconductor_sim.models import radiative_recombination, srh_recombination
 from semiconductor_sim.utils import DEFAULT_T, k_B, q
 from semiconductor_sim.utils.numerics import safe_expm1
+from semiconductor_sim.utils.precision import as_precision
 
 from .base import Device
 
@@ -23,6 +22,8 @@ class LED(Device):
     - Units: cm, cm^2, cm^3, K; q in C, k_B in J/K
     """
 
+    supports_out = True
+
     def __init__(
         self,
         doping_p: float,
@@ -69,23 +70,32 @@ class LED(Device):
         Returns:
             float: The saturation current in amperes.
         """
+        return float(self.saturation_current_at(self.temperature))
+
+    def saturation_current_at(
+        self, temperature: float | npt.NDArray[np.floating]
+    ) -> npt.NDArray[np.floating]:
+        """Vectorized saturation current I_s(T) for an array of temperatures (K)."""
+        T = np.asarray(temperature, dtype=float)
         if self.material is not None:
-            n_i = float(np.asarray(self.material.ni(self.temperature)))
+            n_i = np.asarray(self.material.ni(T), dtype=float)
         else:
-            n_i = 1.5e10 * (self.temperature / DEFAULT_T) ** 1.5
+            n_i = 1.5e10 * (T / DEFAULT_T) ** 1.5
         I_s = (
             q
             * self.area
             * n_i**2
             * ((self.D_p / (self.L_p * self.doping_n)) + (self.D_n / (self.L_n * self.doping_p)))
         )
-        return float(I_s)
+        return np.asarray(I_s, dtype=float)
 
     def iv_characteristic(
         self,
         voltage_array: npt.NDArray[np.floating],
         n_conc: float | npt.NDArray[np.floating] | None = None,
         p_conc: float | npt.NDArray[np.floating] | None = None,
+        *,
+        out: tuple[npt.NDArray[np.float64], ...] | None = None,
     ) -> tuple[npt.NDArray[np.floating], ...]:
         """
         Calculate current and optical emission across `voltage_array`.
@@ -95,6 +105,8 @@ class LED(Device):
             n_conc: Electron concentration (cm^-3). If provided with `p_conc`,
                 SRH and radiative recombination are computed and emission includes radiative term.
             p_conc: Hole concentration (cm^-3).
+            out: Optional preallocated float64 arrays shaped like `voltage_array`,
+                one per returned value; filled in place and returned.
 
                 Returns:
                         - If both `n_conc` and `p_conc` are provided:
@@ -102,7 +114,13 @@ class LED(Device):
                         - Else: `(I, emission)` where both are arrays.
         """
         V_T = k_B * self.temperature / q  # Thermal voltage
-        I = self.I_s * safe_expm1(voltage_array / V_T)
+        has_conc = n_conc is not None and p_conc is not None
+        if out is not None:
+            self._diode_current_into(voltage_array, self.I_s, V_T, out[0])
+            if not has_conc:
+                out[1].fill(0.0)
+                return out[0], out[1]
+        I = self.I_s * safe_expm1(voltage_array / V_T) if out is None else out[0]
 
         if n_conc is not None and p_conc is not None:
             R_SRH = srh_recombination(
@@ -123,10 +141,14 @@ class LED(Device):
             R_rad = np.zeros_like(voltage_array)
 
         emission = self.efficiency * R_rad * self.area  # Simplified emission calculation
-        I = np.asarray(I)
-        emission = np.asarray(emission)
-        if n_conc is not None and p_conc is not None:
-            R_SRH = np.broadcast_to(R_SRH, np.shape(voltage_array))
+        if out is not None:
+            out[1][...] = emission
+            out[2][...] = R_SRH
+            return out[0], out[1], out[2]
+        I = as_precision(I)
+        emission = as_precision(emission)
+        if has_conc:
+            R_SRH = np.broadcast_to(as_precision(R_SRH), np.shape(voltage_array))
             return I, emission, R_SRH
         return I, emission
 
@@ -146,6 +168,9 @@ class LED(Device):
             emission: Emission intensities (arb. units)
             recombination: Recombination rates (cm^-3 s^-1)
         """
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         fig = make_subplots(
             rows=2,
             cols=1,
@@ -1,12 +1,12 @@
 """MOS capacitor device model."""
 
-import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
 
 from semiconductor_sim.models import srh_recombination
 from semiconductor_sim.utils import DEFAULT_T, epsilon_0, k_B, q
 from semiconductor_sim.utils.plotting import apply_basic_style, use_headless_backend
+from semiconductor_sim.utils.precision import as_precision
 
 from .base import Device
 
@@ -90,7 +90,7 @@ class MOSCapacitor(Device):
         else:
             R_SRH = np.zeros_like(voltage_array)
 
-        return np.asarray(I, dtype=float), np.asarray(R_SRH, dtype=float)
+        return as_precision(I), as_precision(R_SRH)
 
     def plot_capacitance_vs_voltage(self, voltage: npt.NDArray[np.floating]) -> None:
         """Plot the capacitance-voltage (C-V) characteristics.
@@ -98,6 +98,8 @@ class MOSCapacitor(Device):
         Computes capacitance internally from the provided voltage array.
         """
         capacitance = self.capacitance(voltage)
+        import matplotlib.pyplot as plt
+
         use_headless_backend("Agg")
         apply_basic_style()
         plt.figure(figsize=(8, 6))
@@ -116,6 +118,8 @@ class MOSCapacitor(Device):
         recombination: npt.NDArray[np.floating] | None = None,
     ) -> None:
         """Plot the IV characteristics and optionally the recombination rate."""
+        import matplotlib.pyplot as plt
+
         use_headless_backend("Agg")
         apply_basic_style()
         fig, ax1 = plt.subplots(figsize=(8, 6))
@@ -16,11 +16,14 @@ import numpy.typing as npt
 from semiconductor_sim.materials import Material
 from semiconductor_sim.utils import DEFAULT_T, k_B, q
 from semiconductor_sim.utils.numerics import safe_expm1
+from semiconductor_sim.utils.precision import as_precision
 
 from .base import Device
 
 
 class Photodiode(Device):
+    supports_out = True
+
     def __init__(
         self,
         doping_p: float,
@@ -49,20 +52,33 @@ class Photodiode(Device):
         self.responsivity_A_per_W = float(responsivity_A_per_W)
         self.material = material
 
-    def _intrinsic_density(self) -> float:
-        if self.material is not None:
-            return float(np.asarray(self.material.ni(self.temperature)))
-        return float(1.5e10 * (self.temperature / DEFAULT_T) ** 1.5)
-
     def _dark_saturation_current(self) -> float:
+        return float(self.saturation_current_at(self.temperature))
+
+    def saturation_current_at(
+        self, temperature: float | npt.NDArray[np.floating]
+    ) -> npt.NDArray[np.floating]:
+        """Vectorized dark saturation current I_s(T) for an array of temperatures (K)."""
+        T = np.asarray(temperature, dtype=float)
+        if self.material is not None:
+            n_i = np.asarray(self.material.ni(T), dtype=float)
+        else:
+            n_i = 1.5e10 * (T / DEFAULT_T) ** 1.5
         # Representative transport constants (consistent with PNJunction/SolarCell)
         D_p, D_n = 10.0, 25.0
         L_p, L_n = 5e-4, 5e-4
-        n_i = self._intrinsic_density()
         I_s = (
             q * self.area * n_i**2 * ((D_p / (L_p * self.doping_n)) + (D_n / (L_n * self.doping_p)))
         )
-        return float(I_s)
+        return np.asarray(I_s, dtype=float)
+
+    def _grid_current(
+        self,
+        voltage: npt.NDArray[np.floating],
+        V_T: npt.NDArray[np.floating],
+        I_s: npt.NDArray[np.floating],
+    ) -> npt.NDArray[np.floating]:
+        return -self._photocurrent() + I_s * safe_expm1(voltage / V_T)
 
     def _photocurrent(self) -> float:
         # I_ph = Responsivity * IncidentPower; IncidentPower = irradiance * area
@@ -73,14 +89,22 @@ class Photodiode(Device):
         voltage_array: npt.NDArray[np.floating],
         n_conc: float | npt.NDArray[np.floating] | None = None,
         p_conc: float | npt.NDArray[np.floating] | None = None,
+        *,
+        out: tuple[npt.NDArray[np.float64]] | None = None,
     ) -> tuple[npt.NDArray[np.floating], ...]:
         """Return the illuminated I–V curve as a tuple with current array.
 
+        Pass a preallocated float64 array as `out=(current,)` to fill it in place.
+
         Returns:
             (current_array,)
         """
         V_T = k_B * self.temperature / q
         I_s = self._dark_saturation_current()
         I_ph = self._photocurrent()
+        if out is not None:
+            I_out = self._diode_current_into(voltage_array, I_s, V_T, out[0])
+            I_out -= I_ph
+            return (I_out,)
         I = -I_ph + I_s * safe_expm1(voltage_array / V_T)
-        return (np.asarray(I, dtype=float),)
+        return (as_precision(I),)
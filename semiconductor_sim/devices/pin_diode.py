@@ -6,6 +6,12 @@ from numpy.typing import NDArray
 from semiconductor_sim.materials import Material
 from semiconductor_sim.utils import DEFAULT_T, k_B, q
 from semiconductor_sim.utils.numerics import safe_expm1
+from semiconductor_sim.utils.precision import as_precision
+from semiconductor_sim.utils.solvers import (
+    NewtonResult,
+    is_monotonic,
+    solve_diode_series_resistance,
+)
 
 from .base import Device
 
@@ -59,11 +65,6 @@ class PINDiode(Device):
             else None
         )
 
-    def _intrinsic_density(self) -> float:
-        if self.material is not None:
-            return float(np.asarray(self.material.ni(self.temperature)))
-        return float(1.5e10 * (self.temperature / DEFAULT_T) ** 1.5)
-
     def saturation_current(self) -> float:
         """Effective saturation current: diffusion at edges + SRH generation in i-region.
 
@@ -73,7 +74,17 @@ class PINDiode(Device):
         SRH generation current (i-region, reverse-dominated term):
             I_gen ≈ q A n_i W_i / (2 τ_eff)
         """
-        n_i = self._intrinsic_density()
+        return float(self.saturation_current_at(self.temperature))
+
+    def saturation_current_at(
+        self, temperature: float | NDArray[np.floating]
+    ) -> NDArray[np.floating]:
+        """Vectorized effective saturation current I_s(T) for an array of temperatures (K)."""
+        T = np.asarray(temperature, dtype=float)
+        if self.material is not None:
+            n_i = np.asarray(self.material.ni(T), dtype=float)
+        else:
+            n_i = 1.5e10 * (T / DEFAULT_T) ** 1.5
         Is_pn = (
             q
             * self.area
@@ -82,7 +93,45 @@ class PINDiode(Device):
         )
         tau_eff = max(min(self.tau_n, self.tau_p), 1e-15)
         Is_gen = q * self.area * n_i * self.intrinsic_width_cm / (2.0 * tau_eff)
-        return float(Is_pn + Is_gen)
+        return np.asarray(Is_pn + Is_gen, dtype=float)
+
+    def _grid_current(
+        self,
+        voltage: NDArray[np.floating],
+        V_T: NDArray[np.floating],
+        I_s: NDArray[np.floating],
+    ) -> NDArray[np.floating]:
+        if self.series_resistance_ohm is not None:
+            return as_precision(
+                solve_diode_series_resistance(
+                    voltage,
+                    I_s,
+                    V_T,
+                    self.series_resistance_ohm,
+                    continuation=is_monotonic(voltage),
+                ).x
+            )
+        return I_s * safe_expm1(voltage / V_T)
+
+    def solve_series_resistance(
+        self, voltage_array: NDArray[np.floating], *, continuation: bool | None = None
+    ) -> NewtonResult:
+        """Solve I = Is*expm1((V - I*Rs)/Vt) for every bias point.
+
+        Uses the shared vectorized Newton solver; the returned `NewtonResult`
+        carries the current in `x` plus per-point iteration counts. Sorted
+        sweeps are warm-started by continuation; `continuation=None` enables
+        it automatically when `voltage_array` is monotonic.
+        """
+        if self.series_resistance_ohm is None:
+            raise ValueError("series_resistance_ohm is not set")
+        V = np.asarray(voltage_array, dtype=float)
+        Vt = k_B * self.temperature / q
+        if continuation is None:
+            continuation = is_monotonic(V)
+        return solve_diode_series_resistance(
+            V, self.saturation_current(), Vt, self.series_resistance_ohm, continuation=continuation
+        )
 
     def iv_characteristic(
         self,
@@ -96,21 +145,6 @@ class PINDiode(Device):
 
         if self.series_resistance_ohm is None:
             I = Is * safe_expm1(V / Vt)
-            return (I,)
-
-        # Solve I = Is*expm1((V - I*Rs)/Vt) with simple Newton iterations
-        Rs = float(self.series_resistance_ohm)
-        I_out = np.zeros_like(V)
-        for i, v in enumerate(V):
-            Ii = Is * safe_expm1(v / Vt)
-            for _ in range(50):
-                f = Ii - Is * safe_expm1((v - Ii * Rs) / Vt)
-                # derivative of safe_expm1(x) is exp(x)
-                exp_term = np.exp((v - Ii * Rs) / Vt)
-                df = 1.0 - Is * (-Rs / Vt) * exp_term
-                step = f / df
-                Ii = Ii - step
-                if abs(step) < max(1e-18, 1e-6 * max(1.0, abs(Ii))):
-                    break
-            I_out[i] = Ii
-        return (I_out,)
+            return (as_precision(I),)
+
+        return (as_precision(self.solve_series_resistance(V).x),)
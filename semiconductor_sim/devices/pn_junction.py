@@ -1,6 +1,5 @@
 """PN Junction diode device model."""
 
-import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
 
@@ -9,6 +8,7 @@ from semiconductor_sim.models import srh_recombination
 from semiconductor_sim.utils import DEFAULT_T, k_B, q
 from semiconductor_sim.utils.numerics import safe_expm1
 from semiconductor_sim.utils.plotting import apply_basic_style, use_headless_backend
+from semiconductor_sim.utils.precision import as_precision
 
 from .base import Device
 
@@ -23,6 +23,8 @@ class PNJunctionDiode(Device):
     - Units: cm, cm^2, cm^3, K; q in C, k_B in J/K
     """
 
+    supports_out = True
+
     def __init__(
         self,
         doping_p: float,
@@ -62,24 +64,33 @@ class PNJunctionDiode(Device):
 
     def calculate_saturation_current(self) -> float:
         """Calculate the saturation current (I_s) considering temperature."""
+        return float(self.saturation_current_at(self.temperature))
+
+    def saturation_current_at(
+        self, temperature: float | npt.NDArray[np.floating]
+    ) -> npt.NDArray[np.floating]:
+        """Vectorized saturation current I_s(T) for an array of temperatures (K)."""
+        T = np.asarray(temperature, dtype=float)
         # Intrinsic carrier concentration with temperature dependence
         if self.material is not None:
-            n_i = float(np.asarray(self.material.ni(self.temperature)))
+            n_i = np.asarray(self.material.ni(T), dtype=float)
         else:
-            n_i = 1.5e10 * (self.temperature / DEFAULT_T) ** 1.5
+            n_i = 1.5e10 * (T / DEFAULT_T) ** 1.5
         I_s = (
             q
             * self.area
             * n_i**2
             * ((self.D_p / (self.L_p * self.doping_n)) + (self.D_n / (self.L_n * self.doping_p)))
         )
-        return float(I_s)
+        return np.asarray(I_s, dtype=float)
 
     def iv_characteristic(
         self,
         voltage_array: npt.NDArray[np.floating],
         n_conc: float | npt.NDArray[np.floating] | None = None,
         p_conc: float | npt.NDArray[np.floating] | None = None,
+        *,
+        out: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]] | None = None,
     ) -> tuple[npt.NDArray[np.floating], npt.NDArray[np.floating]]:
         """
         Calculate the current for a given array of voltages, including SRH recombination.
@@ -88,11 +99,24 @@ class PNJunctionDiode(Device):
             voltage_array: Array of voltage values (V)
             n_conc: Electron concentration (cm^-3)
             p_conc: Hole concentration (cm^-3)
+            out: Optional preallocated `(current, recombination)` float64 arrays
+                shaped like `voltage_array`; filled in place and returned.
 
         Returns:
             Tuple of `(current_array, recombination_array)` matching the shape of `voltage_array`.
         """
         V_T = k_B * self.temperature / q  # Thermal voltage
+        if out is not None:
+            I_out, R_out = out
+            self._diode_current_into(voltage_array, self.I_s, V_T, I_out)
+            R_out[...] = (
+                srh_recombination(
+                    n_conc, p_conc, temperature=self.temperature, tau_n=self.tau_n, tau_p=self.tau_p
+                )
+                if n_conc is not None and p_conc is not None
+                else 0.0
+            )
+            return I_out, R_out
         I = self.I_s * safe_expm1(voltage_array / V_T)
 
         if n_conc is not None and p_conc is not None:
@@ -102,7 +126,7 @@ class PNJunctionDiode(Device):
             R_SRH = np.broadcast_to(R_SRH, np.shape(voltage_array))
         else:
             R_SRH = np.zeros_like(voltage_array)
-        return np.asarray(I, dtype=float), np.asarray(R_SRH, dtype=float)
+        return as_precision(I), as_precision(R_SRH)
 
     def __repr__(self) -> str:
         return (
@@ -118,6 +142,8 @@ class PNJunctionDiode(Device):
         recombination: npt.NDArray[np.floating] | None = None,
     ) -> None:
         """Plot the IV characteristics and optionally the recombination rate."""
+        import matplotlib.pyplot as plt
+
         use_headless_backend("Agg")
         apply_basic_style()
         fig, ax1 = plt.subplots(figsize=(8, 6))
@@ -0,0 +1,608 @@
+"""Batched device populations (teaching-simple, vectorized).
+
+A population holds N parameter sets for one device family as 1-D arrays and
+evaluates all of them against a shared voltage sweep in a single broadcasted
+NumPy expression. Results have shape ``(N, n_voltages)``: row ``i`` matches
+what the corresponding scalar device would return for the same parameters.
+
+Validation runs once over the whole batch instead of once per object.
+
+Populations exist for the PN junction, LED, solar cell, photodiode, PIN and
+Schottky diodes. PIN and Schottky members with series resistance are solved
+together by the shared vectorized Newton solver. The BJT returns a
+``(V_BE, V_CE)`` grid per device and the Zener diode's breakdown voltage
+comes from an ML model, so neither fits the ``(N, n_voltages)`` layout.
+The tunnel, varactor and MOS capacitor models are closed-form and would
+broadcast the same way, but have no population class yet;
+`semiconductor_sim.sweep` evaluates them one device at a time.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from semiconductor_sim.materials import Material, MaterialTable
+from semiconductor_sim.models import radiative_recombination, srh_recombination
+from semiconductor_sim.utils import DEFAULT_T, k_B, q
+from semiconductor_sim.utils.numerics import lambertw_exp, safe_expm1
+from semiconductor_sim.utils.precision import as_precision
+from semiconductor_sim.utils.solvers import is_monotonic, solve_diode_series_resistance
+
+from .schottky import BARRIER_MAX_EV, BARRIER_MIN_EV, IDEALITY_MAX, IDEALITY_MIN
+from .solar_cell import _single_diode
+
+FloatArray: TypeAlias = npt.NDArray[np.float64]
+ArrayLike: TypeAlias = float | npt.ArrayLike
+
+
+def _with_series_resistance(
+    ideal: npt.NDArray[np.floating],
+    voltage_row: FloatArray,
+    I_s: FloatArray,
+    V_th: FloatArray,
+    R_s: FloatArray,
+) -> npt.NDArray[np.floating]:
+    """Replace the rows of `ideal` whose `R_s > 0` by the series-resistance solution.
+
+    All members with series resistance are solved together by the shared
+    vectorized Newton solver (warm-started along sorted sweeps, as for the
+    scalar devices); the others keep their closed-form ideal current.
+    """
+    rows = R_s > 0
+    if not np.any(rows):
+        return ideal
+    current = np.array(ideal, dtype=float)
+    current[rows] = solve_diode_series_resistance(
+        voltage_row,
+        I_s[rows, None],
+        V_th[rows, None],
+        R_s[rows, None],
+        continuation=is_monotonic(voltage_row),
+    ).x
+    return as_precision(current)
+
+
+def _broadcast_params(**params: ArrayLike) -> dict[str, FloatArray]:
+    """Broadcast scalar/array parameters to a common contiguous 1-D float shape."""
+    arrays = [np.atleast_1d(np.asarray(v, dtype=float)) for v in params.values()]
+    try:
+        shaped = np.broadcast_arrays(*arrays)
+    except ValueError as exc:
+        raise ValueError("population parameters must broadcast to a common shape") from exc
+    if shaped[0].ndim != 1:
+        raise ValueError("population parameters must be scalars or 1-D arrays")
+    return {k: np.ascontiguousarray(a) for k, a in zip(params, shaped, strict=True)}
+
+
+class DevicePopulation(ABC):
+    """
+    Abstract base class for batched device populations.
+
+    Mirrors :class:`~semiconductor_sim.devices.base.Device` but every parameter
+    is a 1-D array of length ``size``. Subclasses must implement
+    `iv_characteristic` returning arrays of shape ``(size, n_voltages)``.
+    """
+
+    area: FloatArray
+    temperature: FloatArray
+
+    def __init__(self, **params: ArrayLike) -> None:
+        arrays = _broadcast_params(**params)
+        area = arrays["area"]
+        temperature = arrays["temperature"]
+        if not np.all(np.isfinite(area)) or np.any(area <= 0):
+            raise ValueError("area must be a positive finite value (cm^2)")
+        if not np.all(np.isfinite(temperature)) or np.any(temperature <= 0):
+            raise ValueError("temperature must be a positive finite value (K)")
+        for name, arr in arrays.items():
+            setattr(self, name, arr)
+        self.size = int(area.size)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def thermal_voltage(self) -> FloatArray:
+        """Thermal voltage V_T = k_B T / q for each member (V)."""
+        return k_B * self.temperature / q
+
+    @staticmethod
+    def _voltage_row(voltage_array: npt.ArrayLike) -> FloatArray:
+        return np.asarray(voltage_array, dtype=float).ravel()[None, :]
+
+    @abstractmethod
+    def iv_characteristic(
+        self,
+        voltage_array: npt.NDArray[np.floating],
+        n_conc: float | npt.NDArray[np.floating] | None = None,
+        p_conc: float | npt.NDArray[np.floating] | None = None,
+    ) -> tuple[npt.NDArray[np.floating], ...]:
+        """
+        Compute current vs. voltage for every member. The first element of the
+        returned tuple is the ``(size, n_voltages)`` current array.
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={self.size})"
+
+
+class _DiffusionDiodePopulation(DevicePopulation):
+    """Shared ideal-diode machinery: I_s = q A n_i^2 [Dp/(Lp Nd) + Dn/(Ln Na)]."""
+
+    doping_p: FloatArray
+    doping_n: FloatArray
+    D_n: FloatArray
+    D_p: FloatArray
+    L_n: FloatArray
+    L_p: FloatArray
+    material_index: npt.NDArray[np.intp] | None
+
+    def __init__(
+        self,
+        material: Material | MaterialTable | None = None,
+        material_index: npt.ArrayLike | None = None,
+        **params: ArrayLike,
+    ) -> None:
+        is_table = isinstance(material, MaterialTable)
+        if is_table and material_index is None:
+            raise ValueError("material_index is required when material is a MaterialTable")
+        if not is_table and material_index is not None:
+            raise ValueError("material_index requires material to be a MaterialTable")
+        if is_table:
+            # Broadcast together with the other parameters, then restore integers
+            params["material_index"] = material_index  # type: ignore[assignment]
+        super().__init__(**params)
+        self.material = material
+        if isinstance(material, MaterialTable):
+            idx_f = np.asarray(self.material_index, dtype=float)
+            idx = idx_f.astype(np.intp)
+            if np.any(idx != idx_f) or np.any(idx < 0) or np.any(idx >= len(material)):
+                raise ValueError(f"material_index must hold valid row indices of {material!r}")
+            self.material_index = idx
+        else:
+            self.material_index = None
+        self.I_s = self.calculate_saturation_current()
+
+    def _intrinsic_density(self) -> FloatArray:
+        if isinstance(self.material, MaterialTable):
+            return self.material.ni(self.temperature, self.material_index)
+        if self.material is not None:
+            return np.asarray(self.material.ni(self.temperature), dtype=float)
+        return 1.5e10 * (self.temperature / DEFAULT_T) ** 1.5
+
+    def calculate_saturation_current(self) -> FloatArray:
+        """Calculate the saturation current (I_s) of every member."""
+        n_i = self._intrinsic_density()
+        return (
+            q
+            * self.area
+            * n_i**2
+            * ((self.D_p / (self.L_p * self.doping_n)) + (self.D_n / (self.L_n * self.doping_p)))
+        )
+
+    def _diode_current(self, voltage_array: npt.ArrayLike) -> FloatArray:
+        V = as_precision(self._voltage_row(voltage_array))
+        return as_precision(self.I_s[:, None]) * safe_expm1(
+            V / as_precision(self.thermal_voltage[:, None])
+        )
+
+    def _srh(
+        self,
+        shape: tuple[int, ...],
+        n_conc: float | npt.NDArray[np.floating],
+        p_conc: float | npt.NDArray[np.floating],
+        tau_n: float | FloatArray,
+        tau_p: float | FloatArray,
+    ) -> FloatArray:
+        R = srh_recombination(
+            np.asarray(n_conc, dtype=float),
+            np.asarray(p_conc, dtype=float),
+            temperature=self.temperature[:, None],  # type: ignore[arg-type]
+            tau_n=tau_n,  # type: ignore[arg-type]
+            tau_p=tau_p,  # type: ignore[arg-type]
+        )
+        return np.broadcast_to(as_precision(R), shape)
+
+
+class PNJunctionPopulation(_DiffusionDiodePopulation):
+    """Batch of :class:`~semiconductor_sim.devices.pn_junction.PNJunctionDiode` models.
+
+    Every constructor argument except `material` may be a scalar or a 1-D array;
+    all arrays broadcast to a common length N. To mix materials in one batch,
+    pass a `MaterialTable` as `material` and per-member rows as `material_index`.
+    """
+
+    tau_n: FloatArray
+    tau_p: FloatArray
+
+    def __init__(
+        self,
+        doping_p: ArrayLike,
+        doping_n: ArrayLike,
+        *,
+        area: ArrayLike = 1e-4,
+        temperature: ArrayLike = DEFAULT_T,
+        tau_n: ArrayLike = 1e-6,
+        tau_p: ArrayLike = 1e-6,
+        D_n: ArrayLike = 25.0,
+        D_p: ArrayLike = 10.0,
+        L_n: ArrayLike = 5e-4,
+        L_p: ArrayLike = 5e-4,
+        material: Material | MaterialTable | None = None,
+        material_index: npt.ArrayLike | None = None,
+    ) -> None:
+        super().__init__(
+            material=material,
+            material_index=material_index,
+            doping_p=doping_p,
+            doping_n=doping_n,
+            area=area,
+            temperature=temperature,
+            tau_n=tau_n,
+            tau_p=tau_p,
+            D_n=D_n,
+            D_p=D_p,
+            L_n=L_n,
+            L_p=L_p,
+        )
+
+    def iv_characteristic(
+        self,
+        voltage_array: npt.NDArray[np.floating],
+        n_conc: float | npt.NDArray[np.floating] | None = None,
+        p_conc: float | npt.NDArray[np.floating] | None = None,
+    ) -> tuple[npt.NDArray[np.floating], npt.NDArray[np.floating]]:
+        """
+        Calculate currents for every member over a shared voltage sweep.
+
+        Returns:
+            Tuple of `(current, recombination)`, each of shape ``(N, n_voltages)``.
+        """
+        I = self._diode_current(voltage_array)
+        if n_conc is not None and p_conc is not None:
+            R_SRH = self._srh(I.shape, n_conc, p_conc, self.tau_n[:, None], self.tau_p[:, None])
+        else:
+            R_SRH = np.zeros_like(I)
+        return I, R_SRH
+
+
+class LEDPopulation(_DiffusionDiodePopulation):
+    """Batch of :class:`~semiconductor_sim.devices.led.LED` models."""
+
+    efficiency: FloatArray
+    B: FloatArray
+
+    def __init__(
+        self,
+        doping_p: ArrayLike,
+        doping_n: ArrayLike,
+        *,
+        area: ArrayLike = 1e-4,
+        efficiency: ArrayLike = 0.1,
+        temperature: ArrayLike = DEFAULT_T,
+        B: ArrayLike = 1e-10,
+        D_n: ArrayLike = 25.0,
+        D_p: ArrayLike = 10.0,
+        L_n: ArrayLike = 5e-4,
+        L_p: ArrayLike = 5e-4,
+        material: Material | MaterialTable | None = None,
+        material_index: npt.ArrayLike | None = None,
+    ) -> None:
+        eff = np.asarray(efficiency, dtype=float)
+        if np.any(eff < 0.0) or np.any(eff > 1.0) or not np.all(np.isfinite(eff)):
+            raise ValueError("efficiency must be between 0 and 1")
+        super().__init__(
+            material=material,
+            material_index=material_index,
+            doping_p=doping_p,
+            doping_n=doping_n,
+            area=area,
+            efficiency=efficiency,
+            temperature=temperature,
+            B=B,
+            D_n=D_n,
+            D_p=D_p,
+            L_n=L_n,
+            L_p=L_p,
+        )
+
+    def iv_characteristic(
+        self,
+        voltage_array: npt.NDArray[np.floating],
+        n_conc: float | npt.NDArray[np.floating] | None = None,
+        p_conc: float | npt.NDArray[np.floating] | None = None,
+    ) -> tuple[npt.NDArray[np.floating], ...]:
+        """
+        Calculate current and optical emission for every member.
+
+        Returns:
+            - If both `n_conc` and `p_conc` are provided: `(I, emission, R_SRH)`.
+            - Else: `(I, emission)`. All arrays have shape ``(N, n_voltages)``.
+        """
+        I = self._diode_current(voltage_array)
+        if n_conc is None or p_conc is None:
+            return I, np.zeros_like(I)
+
+        R_SRH = self._srh(I.shape, n_conc, p_conc, 1e-6, 1e-6)
+        R_rad = radiative_recombination(
+            np.asarray(n_conc, dtype=float),
+            np.asarray(p_conc, dtype=float),
+            B=self.B[:, None],  # type: ignore[arg-type]
+        )
+        emission = as_precision(self.efficiency[:, None] * R_rad * self.area[:, None])
+        return I, np.broadcast_to(emission, I.shape), R_SRH
+
+
+class SolarCellPopulation(_DiffusionDiodePopulation):
+    """Batch of :class:`~semiconductor_sim.devices.solar_cell.SolarCell` models.
+
+    `series_resistance_ohm`, `shunt_resistance_ohm` and `ideality` may differ
+    per member; a zero series resistance or an infinite (or `None`) shunt
+    resistance means none. Non-ideal members share one vectorized Lambert W
+    evaluation of the single-diode equation.
+    """
+
+    light_intensity: FloatArray
+    series_resistance_ohm: FloatArray
+    shunt_resistance_ohm: FloatArray
+    ideality: FloatArray
+
+    def __init__(
+        self,
+        doping_p: ArrayLike,
+        doping_n: ArrayLike,
+        *,
+        area: ArrayLike = 1e-4,
+        light_intensity: ArrayLike = 1.0,
+        temperature: ArrayLike = DEFAULT_T,
+        series_resistance_ohm: ArrayLike | None = None,
+        shunt_resistance_ohm: ArrayLike | None = None,
+        ideality: ArrayLike = 1.0,
+        material: Material | MaterialTable | None = None,
+        material_index: npt.ArrayLike | None = None,
+    ) -> None:
+        n = np.asarray(ideality, dtype=float)
+        if not np.all(np.isfinite(n)) or np.any(n <= 0):
+            raise ValueError("ideality must be a positive finite value")
+        Rsh = np.asarray(
+            np.inf if shunt_resistance_ohm is None else shunt_resistance_ohm, dtype=float
+        )
+        if np.any(np.isfinite(Rsh) & (Rsh <= 0)):
+            raise ValueError("shunt_resistance_ohm must be > 0")
+        Rsh = np.where(np.isfinite(Rsh), Rsh, np.inf)
+        super().__init__(
+            material=material,
+            material_index=material_index,
+            doping_p=doping_p,
+            doping_n=doping_n,
+            area=area,
+            light_intensity=light_intensity,
+            temperature=temperature,
+            series_resistance_ohm=0.0 if series_resistance_ohm is None else series_resistance_ohm,
+            shunt_resistance_ohm=Rsh,
+            ideality=n,
+            D_n=25.0,
+            D_p=10.0,
+            L_n=5e-4,
+            L_p=5e-4,
+        )
+        self.series_resistance_ohm = np.maximum(self.series_resistance_ohm, 0.0)
+        self.I_sc = q * self.area * self.light_intensity * 1e12
+        self.V_oc = self.calculate_open_circuit_voltage()
+
+    @property
+    def is_ideal(self) -> bool:
+        """True when no member has R_s/R_sh set or an ideality factor other than 1."""
+        return bool(
+            np.all(self.series_resistance_ohm == 0)
+            and np.all(np.isinf(self.shunt_resistance_ohm))
+            and np.all(self.ideality == 1.0)
+        )
+
+    def calculate_open_circuit_voltage(self) -> FloatArray:
+        """Open-circuit voltage of every member; a finite R_sh uses Lambert W."""
+        a = self.ideality * self.thermal_voltage
+        I_s = np.maximum(self.I_s, 1e-30)
+        V_oc = a * np.log(self.I_sc / I_s + 1)
+        shunted = np.isfinite(self.shunt_resistance_ohm)
+        if np.any(shunted):
+            Rsh = np.where(shunted, self.shunt_resistance_ohm, 1.0)
+            log_theta = np.log(I_s * Rsh / a) + (self.I_sc + I_s) * Rsh / a
+            V_sh = Rsh * (self.I_sc + I_s) - a * lambertw_exp(log_theta)
+            V_oc = np.where(shunted, V_sh, V_oc)
+        return np.asarray(V_oc, dtype=float)
+
+    def iv_characteristic(
+        self,
+        voltage_array: npt.NDArray[np.floating],
+        n_conc: float | npt.NDArray[np.floating] | None = None,
+        p_conc: float | npt.NDArray[np.floating] | None = None,
+    ) -> tuple[npt.NDArray[np.floating], ...]:
+        """Return `(current,)` under illumination with shape ``(N, n_voltages)``."""
+        if self.is_ideal:
+            return (as_precision(self.I_sc[:, None]) - self._diode_current(voltage_array),)
+        current = _single_diode(
+            self._voltage_row(voltage_array),
+            self.thermal_voltage[:, None],
+            self.I_s[:, None],
+            self.I_sc[:, None],
+            ideality=self.ideality[:, None],
+            R_s=self.series_resistance_ohm[:, None],
+            G_sh=1.0 / self.shunt_resistance_ohm[:, None],
+        )
+        return (as_precision(current),)
+
+
+class PhotodiodePopulation(_DiffusionDiodePopulation):
+    """Batch of :class:`~semiconductor_sim.devices.photodiode.Photodiode` models."""
+
+    irradiance_W_per_cm2: FloatArray
+    responsivity_A_per_W: FloatArray
+
+    def __init__(
+        self,
+        doping_p: ArrayLike,
+        doping_n: ArrayLike,
+        *,
+        area: ArrayLike = 1e-4,
+        irradiance_W_per_cm2: ArrayLike = 1e-3,
+        responsivity_A_per_W: ArrayLike = 0.5,
+        temperature: ArrayLike = DEFAULT_T,
+        material: Material | MaterialTable | None = None,
+        material_index: npt.ArrayLike | None = None,
+    ) -> None:
+        super().__init__(
+            material=material,
+            material_index=material_index,
+            doping_p=doping_p,
+            doping_n=doping_n,
+            area=area,
+            irradiance_W_per_cm2=irradiance_W_per_cm2,
+            responsivity_A_per_W=responsivity_A_per_W,
+            temperature=temperature,
+            D_n=25.0,
+            D_p=10.0,
+            L_n=5e-4,
+            L_p=5e-4,
+        )
+        self.I_ph = self.responsivity_A_per_W * self.irradiance_W_per_cm2 * self.area
+
+    def iv_characteristic(
+        self,
+        voltage_array: npt.NDArray[np.floating],
+        n_conc: float | npt.NDArray[np.floating] | None = None,
+        p_conc: float | npt.NDArray[np.floating] | None = None,
+    ) -> tuple[npt.NDArray[np.floating], ...]:
+        """Return `(current,)` for the illuminated I–V with shape ``(N, n_voltages)``."""
+        return (self._diode_current(voltage_array) - as_precision(self.I_ph[:, None]),)
+
+
+class PINDiodePopulation(_DiffusionDiodePopulation):
+    """Batch of :class:`~semiconductor_sim.devices.pin_diode.PINDiode` models.
+
+    `series_resistance_ohm` may differ per member; members with a value of
+    zero (or `None` for all) follow the ideal diode law.
+    """
+
+    intrinsic_width_cm: FloatArray
+    tau_n: FloatArray
+    tau_p: FloatArray
+    series_resistance_ohm: FloatArray
+
+    def __init__(
+        self,
+        doping_p: ArrayLike,
+        doping_n: ArrayLike,
+        *,
+        intrinsic_width_cm: ArrayLike = 1e-4,
+        area: ArrayLike = 1e-4,
+        temperature: ArrayLike = DEFAULT_T,
+        D_n: ArrayLike = 25.0,
+        D_p: ArrayLike = 10.0,
+        L_n: ArrayLike = 5e-4,
+        L_p: ArrayLike = 5e-4,
+        tau_n: ArrayLike = 1e-6,
+        tau_p: ArrayLike = 1e-6,
+        series_resistance_ohm: ArrayLike | None = None,
+        material: Material | MaterialTable | None = None,
+        material_index: npt.ArrayLike | None = None,
+    ) -> None:
+        if np.any(np.asarray(intrinsic_width_cm, dtype=float) <= 0):
+            raise ValueError("intrinsic_width_cm must be > 0")
+        super().__init__(
+            material=material,
+            material_index=material_index,
+            doping_p=doping_p,
+            doping_n=doping_n,
+            intrinsic_width_cm=intrinsic_width_cm,
+            area=area,
+            temperature=temperature,
+            D_n=D_n,
+            D_p=D_p,
+            L_n=L_n,
+            L_p=L_p,
+            tau_n=tau_n,
+            tau_p=tau_p,
+            series_resistance_ohm=0.0 if series_resistance_ohm is None else series_resistance_ohm,
+        )
+
+    def calculate_saturation_current(self) -> FloatArray:
+        """Edge diffusion plus SRH generation in the intrinsic region, per member."""
+        n_i = self._intrinsic_density()
+        tau_eff = np.maximum(np.minimum(self.tau_n, self.tau_p), 1e-15)
+        I_gen = q * self.area * n_i * self.intrinsic_width_cm / (2.0 * tau_eff)
+        return super().calculate_saturation_current() + I_gen
+
+    def iv_characteristic(
+        self,
+        voltage_array: npt.NDArray[np.floating],
+        n_conc: float | npt.NDArray[np.floating] | None = None,
+        p_conc: float | npt.NDArray[np.floating] | None = None,
+    ) -> tuple[npt.NDArray[np.floating], ...]:
+        """Return `(current,)` with shape ``(N, n_voltages)``."""
+        V = self._voltage_row(voltage_array)
+        ideal = self._diode_current(V)
+        return (
+            _with_series_resistance(
+                ideal, V, self.I_s, self.thermal_voltage, self.series_resistance_ohm
+            ),
+        )
+
+
+class SchottkyDiodePopulation(DevicePopulation):
+    """Batch of :class:`~semiconductor_sim.devices.schottky.SchottkyDiode` models.
+
+    I_s = A A** T^2 exp(-Φ_B / kT) for every member; `series_resistance_ohm`
+    may differ per member, with zero (or `None` for all) meaning none.
+    """
+
+    barrier_height_eV: FloatArray
+    ideality: FloatArray
+    A_star: FloatArray
+    series_resistance_ohm: FloatArray
+
+    def __init__(
+        self,
+        barrier_height_eV: ArrayLike = 0.7,
+        ideality: ArrayLike = 1.1,
+        *,
+        area: ArrayLike = 1e-4,
+        temperature: ArrayLike = 300.0,
+        A_star: ArrayLike = 120.0,
+        series_resistance_ohm: ArrayLike | None = None,
+    ) -> None:
+        phi = np.asarray(barrier_height_eV, dtype=float)
+        if np.any(phi < BARRIER_MIN_EV) or np.any(phi > BARRIER_MAX_EV):
+            raise ValueError(f"barrier_height_eV out of range [{BARRIER_MIN_EV}, {BARRIER_MAX_EV}]")
+        n = np.asarray(ideality, dtype=float)
+        if np.any(n < IDEALITY_MIN) or np.any(n > IDEALITY_MAX):
+            raise ValueError(f"ideality should be in [{IDEALITY_MIN}, {IDEALITY_MAX}]")
+        super().__init__(
+            barrier_height_eV=barrier_height_eV,
+            ideality=ideality,
+            area=area,
+            temperature=temperature,
+            A_star=A_star,
+            series_resistance_ohm=0.0 if series_resistance_ohm is None else series_resistance_ohm,
+        )
+        kT_eV = 8.617333262145e-5 * self.temperature
+        self.I_s = (
+            self.area * self.A_star * self.temperature**2 * np.exp(-self.barrier_height_eV / kT_eV)
+        )
+
+    def iv_characteristic(
+        self,
+        voltage_array: npt.NDArray[np.floating],
+        n_conc: float | npt.NDArray[np.floating] | None = None,
+        p_conc: float | npt.NDArray[np.floating] | None = None,
+    ) -> tuple[npt.NDArray[np.floating], ...]:
+        """Return `(current,)` with shape ``(N, n_voltages)``."""
+        V = self._voltage_row(voltage_array)
+        n_Vt = self.ideality * self.thermal_voltage
+        ideal = as_precision(self.I_s[:, None] * (np.exp(V / n_Vt[:, None]) - 1.0))
+        return (_with_series_resistance(ideal, V, self.I_s, n_Vt, self.series_resistance_ohm),)
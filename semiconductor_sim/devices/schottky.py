@@ -5,6 +5,12 @@ from numpy.typing import NDArray
 
 from semiconductor_sim.devices.base import Device
 from semiconductor_sim.utils.constants import k_B, q
+from semiconductor_sim.utils.precision import as_precision
+from semiconductor_sim.utils.solvers import (
+    NewtonResult,
+    is_monotonic,
+    solve_diode_series_resistance,
+)
 
 BARRIER_MIN_EV = 0.1
 BARRIER_MAX_EV = 2.0
@@ -48,10 +54,58 @@ class SchottkyDiode(Device):
         )
 
     def saturation_current(self) -> float:
-        T = self.temperature
+        return float(self.saturation_current_at(self.temperature))
+
+    def saturation_current_at(
+        self, temperature: float | NDArray[np.floating]
+    ) -> NDArray[np.floating]:
+        """Vectorized thermionic saturation current I_s(T) for an array of temperatures (K)."""
+        T = np.asarray(temperature, dtype=float)
         kT_eV = 8.617333262145e-5 * T
         pref = self.area * self.A_star * (T**2)
-        return float(pref * np.exp(-self.barrier_height_eV / kT_eV))
+        return np.asarray(pref * np.exp(-self.barrier_height_eV / kT_eV), dtype=float)
+
+    def _grid_current(
+        self,
+        voltage: NDArray[np.floating],
+        V_T: NDArray[np.floating],
+        I_s: NDArray[np.floating],
+    ) -> NDArray[np.floating]:
+        if self.series_resistance_ohm is not None:
+            return as_precision(
+                solve_diode_series_resistance(
+                    voltage,
+                    I_s,
+                    self.ideality * V_T,
+                    self.series_resistance_ohm,
+                    continuation=is_monotonic(voltage),
+                ).x
+            )
+        return I_s * (np.exp(voltage / (self.ideality * V_T)) - 1.0)
+
+    def solve_series_resistance(
+        self, voltage_array: NDArray[np.floating], *, continuation: bool | None = None
+    ) -> NewtonResult:
+        """Solve I = Is * (exp(q(V - I*Rs)/(n kT)) - 1) for every bias point.
+
+        Uses the shared vectorized Newton solver; the returned `NewtonResult`
+        carries the current in `x` plus per-point iteration counts. Sorted
+        sweeps are warm-started by continuation; `continuation=None` enables
+        it automatically when `voltage_array` is monotonic.
+        """
+        if self.series_resistance_ohm is None:
+            raise ValueError("series_resistance_ohm is not set")
+        V = np.asarray(voltage_array, dtype=float)
+        n_Vt = self.ideality * k_B * self.temperature / q
+        if continuation is None:
+            continuation = is_monotonic(V)
+        return solve_diode_series_resistance(
+            V,
+            self.saturation_current(),
+            n_Vt,
+            float(self.series_resistance_ohm),
+            continuation=continuation,
+        )
 
     def iv_characteristic(
         self, voltage_array: NDArray[np.floating], n_conc=None, p_conc=None
@@ -62,20 +116,6 @@ class SchottkyDiode(Device):
         T = self.temperature
         if self.series_resistance_ohm is None:
             I = Is * (np.exp(q * V / (n * k_B * T)) - 1.0)
-            return (I,)
+            return (as_precision(I),)
 
-        # Solve I = Is * (exp(q(V - I*Rs)/(n kT)) - 1) using Newton's method
-        Rs = float(self.series_resistance_ohm)
-        a = q / (n * k_B * T)
-        I_out = np.zeros_like(V)
-        for i, v in enumerate(V):
-            Ii = Is * (np.exp(a * v) - 1.0)
-            for _ in range(50):
-                f = Ii - Is * (np.exp(a * (v - Ii * Rs)) - 1.0)
-                df = 1.0 - Is * (-a * Rs) * np.exp(a * (v - Ii * Rs))
-                step = f / df
-                Ii = Ii - step
-                if abs(step) < max(1e-18, 1e-6 * max(1.0, abs(Ii))):
-                    break
-            I_out[i] = Ii
-        return (I_out,)
+        return (as_precision(self.solve_series_resistance(V).x),)
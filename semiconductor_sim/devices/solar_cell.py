@@ -1,18 +1,57 @@
 """Solar cell device model."""
 
-import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
 
 from semiconductor_sim.materials import Material
 from semiconductor_sim.utils import DEFAULT_T, k_B, q
-from semiconductor_sim.utils.numerics import safe_expm1
+from semiconductor_sim.utils.numerics import lambertw_exp, safe_expm1
 from semiconductor_sim.utils.plotting import apply_basic_style, use_headless_backend
+from semiconductor_sim.utils.precision import as_precision
 
 from .base import Device
 
 
+def _single_diode(
+    voltage: npt.ArrayLike,
+    V_T: npt.ArrayLike,
+    I_s: npt.ArrayLike,
+    I_sc: npt.ArrayLike,
+    *,
+    ideality: npt.ArrayLike = 1.0,
+    R_s: npt.ArrayLike = 0.0,
+    G_sh: npt.ArrayLike = 0.0,
+) -> npt.NDArray[np.floating]:
+    """
+    Explicit single-diode current; all arguments broadcast elementwise.
+
+    ``R_s = 0`` means no series resistance and ``G_sh = 1/R_sh = 0`` no shunt,
+    so one call evaluates a mix of ideal and non-ideal cells.
+    """
+    V = np.asarray(voltage, dtype=float)
+    a = np.asarray(ideality, dtype=float) * np.asarray(V_T, dtype=float)
+    Is = np.asarray(I_s, dtype=float)
+    Isc = np.asarray(I_sc, dtype=float)
+    Rs = np.asarray(R_s, dtype=float)
+    G = np.asarray(G_sh, dtype=float)
+    with_rs = Rs > 0
+    I_ideal = np.asarray(Isc - Is * safe_expm1(V / a) - V * G, dtype=float)
+    if not np.any(with_rs):
+        return I_ideal
+
+    # Lambert W closed form (Jain & Kapoor), written with G_sh = 1/R_sh so that
+    # R_sh -> inf is the G_sh = 0 limit. theta is formed in the log domain.
+    Rs_pos = np.where(with_rs, Rs, 1.0)
+    k = 1.0 + Rs_pos * G
+    I_tot = Isc + Is
+    log_theta = np.log(Rs_pos * Is / (a * k)) + (Rs_pos * I_tot + V) / (a * k)
+    I_lw = (I_tot - V * G) / k - (a / Rs_pos) * lambertw_exp(log_theta)
+    return np.where(with_rs, I_lw, I_ideal)
+
+
 class SolarCell(Device):
+    supports_out = True
+
     def __init__(
         self,
         doping_p: float,
@@ -21,22 +60,52 @@ class SolarCell(Device):
         light_intensity: float = 1.0,
         temperature: float = DEFAULT_T,
         material: Material | None = None,
+        *,
+        series_resistance_ohm: float | None = None,
+        shunt_resistance_ohm: float | None = None,
+        ideality: float = 1.0,
     ) -> None:
         """
         Initialize the Solar Cell device.
 
+        With the defaults the cell is ideal: I = I_sc - I_s (exp(V/V_T) - 1).
+        Setting `series_resistance_ohm`, `shunt_resistance_ohm` or `ideality`
+        switches to the single-diode model
+
+            I = I_sc - I_s (exp((V + I R_s)/(n V_T)) - 1) - (V + I R_s)/R_sh
+
+        which is solved explicitly with the Lambert W function.
+
         Parameters:
             doping_p (float): Acceptor concentration in p-region (cm^-3)
             doping_n (float): Donor concentration in n-region (cm^-3)
             area (float): Cross-sectional area of the solar cell (cm^2)
             light_intensity (float): Incident light intensity (arbitrary units)
             temperature (float): Temperature in Kelvin
+            series_resistance_ohm (float | None): Series resistance R_s (ohm)
+            shunt_resistance_ohm (float | None): Shunt resistance R_sh (ohm)
+            ideality (float): Diode ideality factor n (> 0)
         """
         super().__init__(area=area, temperature=temperature)
+        if not np.isfinite(ideality) or ideality <= 0:
+            raise ValueError("ideality must be a positive finite value")
         self.doping_p = doping_p
         self.doping_n = doping_n
         self.light_intensity = light_intensity
         self.material = material
+        self.series_resistance_ohm = (
+            float(series_resistance_ohm)
+            if series_resistance_ohm is not None and series_resistance_ohm > 0
+            else None
+        )
+        self.shunt_resistance_ohm = (
+            float(shunt_resistance_ohm)
+            if shunt_resistance_ohm is not None and np.isfinite(shunt_resistance_ohm)
+            else None
+        )
+        if self.shunt_resistance_ohm is not None and self.shunt_resistance_ohm <= 0:
+            raise ValueError("shunt_resistance_ohm must be > 0")
+        self.ideality = float(ideality)
         self.I_s = self.calculate_dark_saturation_current()
         self.I_sc = self.calculate_short_circuit_current()
         self.V_oc = self.calculate_open_circuit_voltage()
@@ -52,49 +121,123 @@ class SolarCell(Device):
     def calculate_open_circuit_voltage(self) -> float:
         """
         Calculate the open-circuit voltage (V_oc) using the diode equation.
+
+        No current flows through R_s at open circuit; a finite R_sh is handled
+        with the closed-form Lambert W solution.
         """
-        V_T = k_B * self.temperature / q
-        V_oc = V_T * np.log((self.I_sc / max(self.I_s, 1e-30)) + 1)
+        a = self.ideality * k_B * self.temperature / q
+        I_s = max(self.I_s, 1e-30)
+        if self.shunt_resistance_ohm is None:
+            V_oc = a * np.log((self.I_sc / I_s) + 1)
+            return float(V_oc)
+        # I_sc + I_s = I_s exp(V/a) + V/R_sh  =>  V = R_sh (I_sc + I_s) - a W(theta)
+        Rsh = self.shunt_resistance_ohm
+        log_theta = np.log(I_s * Rsh / a) + (self.I_sc + I_s) * Rsh / a
+        V_oc = Rsh * (self.I_sc + I_s) - a * lambertw_exp(log_theta)
         return float(V_oc)
 
+    @property
+    def is_ideal(self) -> bool:
+        """True when no R_s/R_sh is set and the ideality factor is 1."""
+        return (
+            self.series_resistance_ohm is None
+            and self.shunt_resistance_ohm is None
+            and self.ideality == 1.0
+        )
+
     def calculate_dark_saturation_current(self) -> float:
         """Calculate dark saturation current using material (if provided)."""
+        return float(self.saturation_current_at(self.temperature))
+
+    def saturation_current_at(
+        self, temperature: float | npt.NDArray[np.floating]
+    ) -> npt.NDArray[np.floating]:
+        """Vectorized dark saturation current I_s(T) for an array of temperatures (K)."""
+        T = np.asarray(temperature, dtype=float)
         if self.material is not None:
-            n_i = float(np.asarray(self.material.ni(self.temperature)))
+            n_i = np.asarray(self.material.ni(T), dtype=float)
         else:
-            n_i = 1.5e10 * (self.temperature / DEFAULT_T) ** 1.5
+            n_i = 1.5e10 * (T / DEFAULT_T) ** 1.5
         # Use representative transport constants as in PNJunction/LED for I_s form
         D_p, D_n = 10.0, 25.0
         L_p, L_n = 5e-4, 5e-4
         I_s = (
             q * self.area * n_i**2 * ((D_p / (L_p * self.doping_n)) + (D_n / (L_n * self.doping_p)))
         )
-        return float(I_s)
+        return np.asarray(I_s, dtype=float)
+
+    def _grid_current(
+        self,
+        voltage: npt.NDArray[np.floating],
+        V_T: npt.NDArray[np.floating],
+        I_s: npt.NDArray[np.floating],
+    ) -> npt.NDArray[np.floating]:
+        return self._single_diode_current(voltage, V_T, I_s)
+
+    def _single_diode_current(
+        self,
+        voltage: npt.NDArray[np.floating],
+        V_T: npt.NDArray[np.floating] | float,
+        I_s: npt.NDArray[np.floating] | float,
+    ) -> npt.NDArray[np.floating]:
+        """Explicit single-diode current; arguments are broadcastable."""
+        if self.is_ideal:
+            return self.I_sc - I_s * safe_expm1(voltage / V_T)
+        return _single_diode(
+            voltage,
+            V_T,
+            I_s,
+            self.I_sc,
+            ideality=self.ideality,
+            R_s=self.series_resistance_ohm or 0.0,
+            G_sh=0.0 if self.shunt_resistance_ohm is None else 1.0 / self.shunt_resistance_ohm,
+        )
 
     def iv_characteristic(
         self,
         voltage_array: npt.NDArray[np.floating],
         n_conc: npt.NDArray[np.floating] | float | None = None,
         p_conc: npt.NDArray[np.floating] | float | None = None,
+        *,
+        out: tuple[npt.NDArray[np.float64]] | None = None,
     ) -> tuple[npt.NDArray[np.floating], ...]:
         """
         Calculate the current for a given array of voltages under illumination.
 
         Parameters:
             voltage_array: Array of voltage values (V)
+            out: Optional preallocated `(current,)` float64 array shaped like
+                `voltage_array`; filled in place and returned. Only the ideal
+                model avoids array temporaries; the single-diode mode copies
+                into it.
 
         Returns:
             Tuple containing one element:
             - current_array: Array of current values (A)
         """
-        I = self.I_sc - self.I_s * safe_expm1(voltage_array / (k_B * self.temperature / q))
-        return (np.asarray(I, dtype=float),)
+        if out is not None:
+            I_out = out[0]
+            if self.is_ideal:
+                self._diode_current_into(voltage_array, self.I_s, k_B * self.temperature / q, I_out)
+                np.subtract(self.I_sc, I_out, out=I_out)
+            else:
+                V = np.asarray(voltage_array, dtype=float)
+                I_out[...] = self._single_diode_current(V, k_B * self.temperature / q, self.I_s)
+            return (I_out,)
+        if self.is_ideal:
+            I = self.I_sc - self.I_s * safe_expm1(voltage_array / (k_B * self.temperature / q))
+            return (as_precision(I),)
+        V = np.asarray(voltage_array, dtype=float)
+        I_sd = self._single_diode_current(V, k_B * self.temperature / q, self.I_s)
+        return (as_precision(I_sd),)
 
     def __repr__(self) -> str:
         return (
             f"SolarCell(doping_p={self.doping_p}, doping_n={self.doping_n}, area={self.area}, "
             f"light_intensity={self.light_intensity}, temperature={self.temperature}, "
-            f"I_s={self.I_s}, material={self.material.symbol if self.material else None})"
+            f"I_s={self.I_s}, series_resistance_ohm={self.series_resistance_ohm}, "
+            f"shunt_resistance_ohm={self.shunt_resistance_ohm}, ideality={self.ideality}, "
+            f"material={self.material.symbol if self.material else None})"
         )
 
     def plot_iv_characteristic(
@@ -109,6 +252,8 @@ class SolarCell(Device):
             voltage: Voltage values (V)
             current: Current values (A)
         """
+        import matplotlib.pyplot as plt
+
         use_headless_backend("Agg")
         apply_basic_style()
         plt.figure(figsize=(8, 6))
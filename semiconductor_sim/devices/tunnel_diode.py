@@ -1,6 +1,5 @@
 """Tunnel diode device model."""
 
-import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
 
@@ -8,11 +7,14 @@ from semiconductor_sim.models import srh_recombination
 from semiconductor_sim.utils import DEFAULT_T, k_B, q
 from semiconductor_sim.utils.numerics import safe_expm1
 from semiconductor_sim.utils.plotting import apply_basic_style, use_headless_backend
+from semiconductor_sim.utils.precision import as_precision
 
 from .base import Device
 
 
 class TunnelDiode(Device):
+    supports_out = True
+
     def __init__(
         self,
         doping_p: float,
@@ -43,23 +45,32 @@ class TunnelDiode(Device):
 
     def calculate_saturation_current(self) -> float:
         """Calculate the saturation current (I_s) considering temperature."""
+        return float(self.saturation_current_at(self.temperature))
+
+    def saturation_current_at(
+        self, temperature: float | npt.NDArray[np.floating]
+    ) -> npt.NDArray[np.floating]:
+        """Vectorized saturation current I_s(T) for an array of temperatures (K)."""
+        T = np.asarray(temperature, dtype=float)
         # High doping concentrations lead to high I_s
         D_n = 30  # Electron diffusion coefficient (cm^2/s)
         D_p = 12  # Hole diffusion coefficient (cm^2/s)
         L_n = 1e-4  # Electron diffusion length (cm)
         L_p = 1e-4  # Hole diffusion length (cm)
-        n_i = 1e10 * (self.temperature / DEFAULT_T) ** 1.5  # Intrinsic carrier concentration
+        n_i = 1e10 * (T / DEFAULT_T) ** 1.5  # Intrinsic carrier concentration
 
         I_s = (
             q * self.area * n_i**2 * ((D_p / (L_p * self.doping_n)) + (D_n / (L_n * self.doping_p)))
         )
-        return float(I_s)
+        return np.asarray(I_s, dtype=float)
 
     def iv_characteristic(
         self,
         voltage_array: npt.NDArray[np.floating],
         n_conc: float | npt.NDArray[np.floating] | None = None,
         p_conc: float | npt.NDArray[np.floating] | None = None,
+        *,
+        out: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]] | None = None,
     ) -> tuple[npt.NDArray[np.floating], npt.NDArray[np.floating]]:
         """
         Calculate the current for a given array of voltages, including SRH recombination.
@@ -68,11 +79,24 @@ class TunnelDiode(Device):
             voltage_array: Array of voltage values (V)
             n_conc: Electron concentration (cm^-3)
             p_conc: Hole concentration (cm^-3)
+            out: Optional preallocated `(current, recombination)` float64 arrays
+                shaped like `voltage_array`; filled in place and returned.
 
         Returns:
             Tuple of `(current_array, recombination_array)` with shape matching `voltage_array`.
         """
         V_T = k_B * self.temperature / q  # Thermal voltage
+        if out is not None:
+            I_out, R_out = out
+            self._diode_current_into(voltage_array, self.I_s, V_T, I_out)
+            R_out[...] = (
+                srh_recombination(
+                    n_conc, p_conc, temperature=self.temperature, tau_n=self.tau_n, tau_p=self.tau_p
+                )
+                if n_conc is not None and p_conc is not None
+                else 0.0
+            )
+            return I_out, R_out
         # Use a simplified exponential IV to ensure correct sign in reverse bias
         I = self.I_s * safe_expm1(voltage_array / V_T)
 
@@ -84,7 +108,7 @@ class TunnelDiode(Device):
         else:
             R_SRH = np.zeros_like(voltage_array)
 
-        return np.asarray(I), np.asarray(R_SRH)
+        return as_precision(I), as_precision(R_SRH)
 
     def plot_iv_characteristic(
         self,
@@ -93,6 +117,8 @@ class TunnelDiode(Device):
         recombination: npt.NDArray[np.floating] | None = None,
     ) -> None:
         """Plot the IV characteristics and optionally the recombination rate."""
+        import matplotlib.pyplot as plt
+
         use_headless_backend("Agg")
         apply_basic_style()
         fig, ax1 = plt.subplots(figsize=(8, 6))
@@ -1,9 +1,10 @@
 # semiconductor_sim/devices/zener_diode.py
 
 import os
+import threading
+import warnings
+from typing import Any
 
-import joblib
-import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
 
@@ -11,11 +12,126 @@ from semiconductor_sim.models import srh_recombination
 from semiconductor_sim.utils import DEFAULT_T, k_B, q
 from semiconductor_sim.utils.numerics import safe_expm1
 from semiconductor_sim.utils.plotting import apply_basic_style, use_headless_backend
+from semiconductor_sim.utils.precision import as_precision
 
 from .base import Device
 
+MODEL_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'models', 'zener_voltage_rf_model.pkl'
+)
+# Pickle-free export of the same forest (see `surrogates.export_forest`);
+# preferred over MODEL_PATH when present
+COMPACT_MODEL_PATH = os.path.splitext(MODEL_PATH)[0] + '.npz'
+
+# Process-wide cache of loaded models keyed by absolute path (None for the
+# default location); a cached None records that no file was found, so the
+# filesystem is checked only once.
+_model_cache: dict[str | None, Any] = {}
+_model_lock = threading.Lock()
+_missing_warned = False
+
+# Marks a ZenerDiode whose model has not been resolved yet
+_UNSET: Any = object()
+
+
+def get_zener_model(path: str | None = None) -> Any:
+    """
+    Return the Zener-voltage ML model, loading it on first use.
+
+    The model is loaded at most once per process and path and shared by every
+    `ZenerDiode`. A `.npz` file is read as a NumPy `TreeEnsemble` (no
+    scikit-learn, no pickle); any other file is unpickled with `joblib`, which
+    (with scikit-learn, via the pickle) is only imported here. A missing file
+    yields None and a single warning.
+
+    Parameters:
+        path (str | None): Model file; defaults to `COMPACT_MODEL_PATH` if it
+            exists, else `MODEL_PATH`
+
+    Returns:
+        The fitted regressor, or None if the file does not exist
+    """
+    global _missing_warned  # noqa: PLW0603
+    key = None if path is None else os.path.abspath(path)
+    with _model_lock:
+        if key in _model_cache:
+            return _model_cache[key]
+        if key is None:
+            exists = [p for p in (COMPACT_MODEL_PATH, MODEL_PATH) if os.path.exists(p)]
+            file = exists[0] if exists else None
+        else:
+            file = key if os.path.exists(key) else None
+        if file is not None and file.endswith('.npz'):
+            from semiconductor_sim.surrogates.forest import load_forest
+
+            model = load_forest(file)
+        elif file is not None:
+            import joblib
+
+            model = joblib.load(file)
+        else:
+            model = None
+            if not _missing_warned:
+                _missing_warned = True
+                warnings.warn(
+                    "ML model for Zener voltage not found. Using default value.",
+                    stacklevel=2,
+                )
+        _model_cache[key] = model
+        return model
+
+
+def clear_zener_model_cache() -> None:
+    """Drop cached models (e.g. after retraining) and re-arm the missing-model warning."""
+    global _missing_warned  # noqa: PLW0603
+    with _model_lock:
+        _model_cache.clear()
+        _missing_warned = False
+
+
+def predict_zener_voltages(
+    doping_p: npt.ArrayLike,
+    doping_n: npt.ArrayLike,
+    temperature: npt.ArrayLike,
+    *,
+    model: Any = _UNSET,
+    zener_voltage: npt.ArrayLike = 5.0,
+) -> npt.NDArray[np.float64]:
+    """
+    Predict Zener breakdown voltages for many parameter sets in one model call.
+
+    The inputs broadcast together; duplicate (doping_p, doping_n, temperature)
+    rows are collapsed before the model runs, so grids that repeat parameter
+    sets pay for each distinct row once.
+
+    Parameters:
+        doping_p: Acceptor concentrations in the p-region (cm^-3)
+        doping_n: Donor concentrations in the n-region (cm^-3)
+        temperature: Temperatures (K)
+        model: Regressor with a `predict` method; defaults to `get_zener_model()`
+        zener_voltage: Fallback voltage (V), broadcast when there is no model
+
+    Returns:
+        Breakdown voltages (V) with the broadcast shape of the inputs
+    """
+    if model is _UNSET:
+        model = get_zener_model()
+    p, n, T = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (doping_p, doping_n, temperature))
+    )
+    if model is None:
+        return np.broadcast_to(np.asarray(zener_voltage, dtype=float), p.shape).copy()
+    if p.size == 0:
+        return np.empty(p.shape)
+    features = np.column_stack([p.ravel(), n.ravel(), T.ravel()])
+    rows, inverse = np.unique(features, axis=0, return_inverse=True)
+    predicted = np.asarray(model.predict(rows), dtype=float)
+    return predicted[inverse.reshape(-1)].reshape(p.shape)
+
 
 class ZenerDiode(Device):
+    _prediction_key: tuple[Any, ...] | None
+
     def __init__(
         self,
         doping_p,
@@ -45,7 +161,21 @@ class ZenerDiode(Device):
         self.tau_n = tau_n
         self.tau_p = tau_p
         self.I_s = self.calculate_saturation_current()
-        self.model = self.load_ml_model()
+        self._model = _UNSET
+        # (model, doping_p, doping_n, temperature) of the memoized prediction
+        self._prediction_key = None
+        self._prediction = zener_voltage
+
+    @property
+    def model(self) -> Any:
+        """The Zener-voltage ML model, resolved from the shared cache on first access."""
+        if self._model is _UNSET:
+            self._model = self.load_ml_model()
+        return self._model
+
+    @model.setter
+    def model(self, value: Any) -> None:
+        self._model = value
 
     def calculate_saturation_current(self):
         """
@@ -65,30 +195,32 @@ class ZenerDiode(Device):
     def load_ml_model(self):
         """
         Load the pre-trained ML model for predicting Zener voltage.
+
+        Returns the process-wide cached instance (see `get_zener_model`).
         """
-        model_path = os.path.join(
-            os.path.dirname(__file__), '..', '..', 'models', 'zener_voltage_rf_model.pkl'
-        )
-        if os.path.exists(model_path):
-            model = joblib.load(model_path)
-            return model
-        else:
-            print("ML model for Zener voltage not found. Using default value.")
-            return None
+        return get_zener_model()
 
     def predict_zener_voltage(self):
         """
         Predict the Zener voltage using the ML model.
 
+        The prediction is memoized for the current doping, temperature and
+        model, so repeated IV evaluations run the model once.
+
         Returns:
             predicted_zener_voltage (float): Predicted Zener voltage (V)
         """
-        if self.model:
-            input_features = np.array([[self.doping_p, self.doping_n, self.temperature]])
-            predicted_zener_voltage = self.model.predict(input_features)[0]
-            return predicted_zener_voltage
-        else:
+        model = self.model
+        if model is None:
             return self.zener_voltage
+        key = (model, self.doping_p, self.doping_n, self.temperature)
+        cached = self._prediction_key
+        if cached is None or cached[0] is not model or cached[1:] != key[1:]:
+            self._prediction = float(
+                predict_zener_voltages(self.doping_p, self.doping_n, self.temperature, model=model)
+            )
+            self._prediction_key = key
+        return self._prediction
 
     def iv_characteristic(
         self,
@@ -130,7 +262,7 @@ class ZenerDiode(Device):
         else:
             R_SRH = np.zeros_like(voltage_array)
 
-        return np.asarray(I, dtype=float), np.asarray(R_SRH, dtype=float)
+        return as_precision(I), as_precision(R_SRH)
 
     def plot_iv_characteristic(
         self,
@@ -146,6 +278,8 @@ class ZenerDiode(Device):
             current: Current values (A)
             recombination: Recombination rates (cm^-3 s^-1)
         """
+        import matplotlib.pyplot as plt
+
         use_headless_backend("Agg")
         apply_basic_style()
         fig, ax1 = plt.subplots(figsize=(8, 6))
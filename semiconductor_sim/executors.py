@@ -0,0 +1,354 @@
+"""Executors that spread device evaluation over several cores.
+
+`ThreadChunkExecutor` splits large arrays into cache-sized chunks and
+evaluates them on a thread pool. NumPy releases the GIL inside its ufunc
+loops, so vectorized paths (`safe_expm1`, `srh_recombination`, `Material.ni`,
+`iv_characteristic`) run concurrently without process start-up or pickling.
+Each chunk writes straight into a preallocated slice of the output::
+
+    with ThreadChunkExecutor(threads=8) as executor:
+        current, _ = executor.iv_characteristic(diode, np.linspace(-0.2, 0.7, 10_000_000))
+        ni = executor.map(get_material("Si").ni, temperatures)
+
+`SharedMemorySweepExecutor` keeps a `ProcessPoolExecutor` of persistent
+workers. Each worker imports the device classes, loads the Zener model and
+evaluates every device type once when it starts, so the first real chunk
+pays no warm-up cost. For each sweep the parent allocates one
+`multiprocessing.shared_memory` block for the ``(n_sets, n_voltages)``
+current array. Workers receive compact records (the chunk's parameter values
+as an ``(n, n_params)`` float64 array, the voltage grid and constant
+arguments), never device objects, and write their rows straight into the
+shared block. Only a row count travels back, and the parent's result array
+is a view of the block, so nothing is copied while assembling it::
+
+    with SharedMemorySweepExecutor(jobs=8) as executor:
+        for spec in specs:
+            with executor.run(spec) as result:
+                np.save(f"{spec.device}.npy", result.current)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import inspect
+import multiprocessing
+import os
+import threading
+import warnings
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .sweep import (
+    DEFAULT_CHUNK_SIZE,
+    DEVICES,
+    REQUIRED_DEFAULTS,
+    FloatArray,
+    SweepSpec,
+    _device_class,
+    evaluate_rows,
+)
+from .utils.precision import call_in_precision, get_precision
+
+# Voltage grid used to warm up each device type in a new worker
+_WARM_VOLTAGE = np.linspace(-0.2, 0.7, 8)
+
+# Elements per chunk in `ThreadChunkExecutor` (512 KiB per float64 array):
+# large enough to amortize per-call overhead, small enough that an
+# expression's temporaries stay cache-resident. Fastest of 4Ki..256Ki in
+# scripts/benchmark_threads.py, even on one thread
+DEFAULT_CHUNK_ELEMENTS = 65_536
+
+# Seconds workers wait for each other to finish warming up
+_STARTUP_TIMEOUT = 120.0
+
+
+@dataclass(frozen=True)
+class _ChunkRecord:
+    """Everything a worker needs for one chunk; pickles to a few hundred bytes."""
+
+    shm_name: str
+    shape: tuple[int, int]
+    start: int
+    device: str
+    names: tuple[str, ...]
+    records: FloatArray  # (n_rows, n_params) parameter values
+    voltage: FloatArray
+    kwargs: tuple[tuple[str, Any], ...]
+
+
+def _init_worker(devices: tuple[str, ...], ready: Any) -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for key in devices:
+            cls = _device_class(DEVICES[key][0])
+            accepted = inspect.signature(cls).parameters
+            kwargs = {k: v for k, v in REQUIRED_DEFAULTS.items() if k in accepted}
+            cls(**kwargs).iv_characteristic(_WARM_VOLTAGE)
+    with contextlib.suppress(threading.BrokenBarrierError):
+        ready.wait(_STARTUP_TIMEOUT)
+
+
+def _evaluate_into(chunk: _ChunkRecord) -> int:
+    params = {name: chunk.records[:, j] for j, name in enumerate(chunk.names)}
+    current = evaluate_rows(chunk.device, params, chunk.voltage, dict(chunk.kwargs))
+    n = int(current.shape[0])
+    # Attaching per chunk keeps no mapping alive after the parent unlinks the block
+    shm = SharedMemory(name=chunk.shm_name)
+    try:
+        out = np.ndarray(chunk.shape, dtype=np.float64, buffer=shm.buf)
+        out[chunk.start : chunk.start + n] = current
+        del out  # release the buffer export before closing
+    finally:
+        shm.close()
+    return n
+
+
+def _noop() -> None:
+    return None
+
+
+class SharedSweepResult:
+    """Sweep output whose `current` array lives in shared memory.
+
+    `current` (shape ``(n_sets, n_voltages)``) is a view of the shared block
+    and is valid until `close`; copy it (``np.array(result.current)``) to
+    keep it longer. Use the result as a context manager, or call `close`,
+    to release the block.
+    """
+
+    def __init__(
+        self, params: dict[str, FloatArray], current: FloatArray, shm: SharedMemory
+    ) -> None:
+        self.params = params
+        self.current = current
+        self._shm = shm
+
+    def close(self) -> None:
+        del self.current
+        self._shm.close()
+
+    def __enter__(self) -> SharedSweepResult:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class SharedMemorySweepExecutor:
+    """Persistent, pre-warmed process pool evaluating sweeps into shared memory.
+
+    Parameters:
+    - jobs: worker processes (default: CPU count)
+    - warm: device keys (see `semiconductor_sim.sweep.DEVICES`) each worker
+      evaluates once at start-up
+    - mp_context: multiprocessing context for the pool
+    """
+
+    def __init__(
+        self,
+        jobs: int | None = None,
+        *,
+        warm: Iterable[str] = tuple(DEVICES),
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        self.jobs = jobs or os.cpu_count() or 1
+        devices = tuple(warm)
+        unknown = [d for d in devices if d not in DEVICES]
+        if unknown:
+            raise ValueError(f"unknown device(s) {unknown}; choose from {', '.join(DEVICES)}")
+        context = mp_context or multiprocessing.get_context()
+        # Workers must share the parent's tracker, which then forgets each
+        # block when the parent unlinks it; started later, every forked
+        # worker would run its own tracker and report the blocks as leaked
+        resource_tracker.ensure_running()
+        ready = context.Barrier(self.jobs)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.jobs,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(devices, ready),
+        )
+        # One task per worker starts them all now (the pool may otherwise
+        # spawn them on demand); the barrier holds each until all are warm
+        for f in [self._pool.submit(_noop) for _ in range(self.jobs)]:
+            f.result()
+
+    def run(self, spec: SweepSpec, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> SharedSweepResult:
+        """Evaluate `spec` on the workers and return its rows in product order."""
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        params = spec.rows(0, spec.n_sets)
+        voltage = np.asarray(spec.voltage, dtype=float)
+        shape = (spec.n_sets, int(voltage.size))
+        names = tuple(params)
+        records = np.stack([params[k] for k in names], axis=1)
+        kwargs = tuple(spec.constructor_kwargs().items())
+        shm = SharedMemory(create=True, size=max(shape[0] * shape[1], 1) * 8)
+        futures = []
+        try:
+            for start in range(0, spec.n_sets, chunk_size):
+                chunk = _ChunkRecord(
+                    shm_name=shm.name,
+                    shape=shape,
+                    start=start,
+                    device=spec.device,
+                    names=names,
+                    records=records[start : start + chunk_size],
+                    voltage=voltage,
+                    kwargs=kwargs,
+                )
+                futures.append(self._pool.submit(_evaluate_into, chunk))
+            for f in futures:
+                f.result()
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            shm.close()
+            shm.unlink()
+            raise
+        # Workers are done writing: drop the name, keep the mapping
+        shm.unlink()
+        current = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        return SharedSweepResult(params, current, shm)
+
+    def close(self) -> None:
+        self._pool.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> SharedMemorySweepExecutor:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _as_tuple(result: Any) -> tuple[npt.NDArray[Any], ...]:
+    return (
+        tuple(np.asarray(r) for r in result) if isinstance(result, tuple) else (np.asarray(result),)
+    )
+
+
+class ThreadChunkExecutor:
+    """Thread pool evaluating NumPy-bound work on cache-sized chunks.
+
+    Parameters:
+    - threads: worker threads (default: CPU count)
+    - chunk_size: elements per chunk along the split axis
+
+    Inputs no longer than one chunk are evaluated directly in the calling
+    thread. Functions must be safe to call from several threads at once,
+    which holds for the library's devices and models.
+    """
+
+    def __init__(
+        self, threads: int | None = None, *, chunk_size: int = DEFAULT_CHUNK_ELEMENTS
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.threads = threads or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="semisim")
+
+    def map(
+        self, fn: Callable[..., Any], *arrays: npt.ArrayLike, **kwargs: Any
+    ) -> npt.NDArray[Any] | tuple[npt.NDArray[Any], ...]:
+        """
+        Evaluate an elementwise `fn(*arrays, **kwargs)` chunk by chunk.
+
+        `arrays` are broadcast together and split along their flattened
+        size; `kwargs` are passed unchanged to every call. Returns what `fn`
+        returns (an array or a tuple of arrays) with the broadcast shape.
+        """
+        inputs = [np.asarray(a) for a in arrays]
+        shape = np.broadcast_shapes(*(a.shape for a in inputs))
+        n = int(np.prod(shape))
+        if n <= self.chunk_size:
+            return fn(*inputs, **kwargs)  # type: ignore[no-any-return]
+        # Scalars stay scalars; arrays are flattened (copying only if broadcast)
+        flat = [a if a.ndim == 0 else np.broadcast_to(a, shape).reshape(-1) for a in inputs]
+
+        def evaluate(sl: slice) -> Any:
+            return fn(*(a if a.ndim == 0 else a[sl] for a in flat), **kwargs)
+
+        results, returns_tuple = self._run(evaluate, n)
+        outputs = tuple(o if o.ndim == 0 else o.reshape(*o.shape[:-1], *shape) for o in results)
+        return outputs if returns_tuple else outputs[0]
+
+    def iv_characteristic(
+        self, device: Any, voltage: npt.ArrayLike, **kwargs: Any
+    ) -> tuple[npt.NDArray[Any], ...]:
+        """`device.iv_characteristic` over a flattened voltage grid, split into chunks.
+
+        Works for single devices and populations; outputs keep the voltage
+        axis last (0-d outputs stay 0-d), as from the direct call.
+        """
+        V = np.asarray(voltage, dtype=float).ravel()
+        if V.size <= self.chunk_size:
+            return _as_tuple(device.iv_characteristic(V, **kwargs))
+        return self._run(lambda sl: device.iv_characteristic(V[sl], **kwargs), V.size)[0]
+
+    def _run(
+        self, evaluate: Callable[[slice], Any], n: int
+    ) -> tuple[tuple[npt.NDArray[Any], ...], bool]:
+        """Outputs of all chunks (split axis last) and whether `evaluate` returns tuples."""
+        bounds = [slice(s, min(s + self.chunk_size, n)) for s in range(0, n, self.chunk_size)]
+        # The first chunk, evaluated here, fixes the number, dtypes and leading shape of outputs.
+        # 0-d outputs do not depend on the split axis and are passed through as they are
+        result = evaluate(bounds[0])
+        first = _as_tuple(result)
+        outputs = tuple(
+            r if r.ndim == 0 else np.empty((*r.shape[:-1], n), dtype=r.dtype) for r in first
+        )
+        for out, r in zip(outputs, first, strict=True):
+            if out.ndim:
+                out[..., bounds[0]] = r
+
+        def work(sl: slice) -> None:
+            for out, r in zip(outputs, _as_tuple(evaluate(sl)), strict=True):
+                if out.ndim:
+                    out[..., sl] = r
+
+        dtype = get_precision()
+        futures: list[Future[None]] = [
+            self._pool.submit(call_in_precision, dtype, work, sl) for sl in bounds[1:]
+        ]
+        try:
+            for f in futures:
+                f.result()
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            raise
+        return outputs, isinstance(result, tuple)
+
+    def close(self) -> None:
+        self._pool.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> ThreadChunkExecutor:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
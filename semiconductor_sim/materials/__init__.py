@@ -1,7 +1,24 @@
-from .registry import Material, get_material, list_materials, materials
+from .alloys import Alloy, AlloyParameters, AlloyProperties, get_alloy, list_alloys
+from .registry import (
+    IntrinsicDensityTable,
+    Material,
+    clear_material_cache,
+    get_material,
+    list_materials,
+    materials,
+)
+from .table import MaterialTable
 
 __all__ = [
+    "Alloy",
+    "AlloyParameters",
+    "AlloyProperties",
+    "get_alloy",
+    "list_alloys",
     "Material",
+    "MaterialTable",
+    "IntrinsicDensityTable",
+    "clear_material_cache",
     "get_material",
     "list_materials",
     "materials",
@@ -0,0 +1,215 @@
+"""Composition-parameterized alloy materials.
+
+An `Alloy` interpolates between two end-point materials with composition
+x ∈ [0, 1] (x = 0 is the host, x = 1 the guest):
+
+- Varshni alpha/beta and the Nc/Nv prefactors follow Vegard's law (linear in x)
+- The 0 K band gap adds a bowing term: Eg0(x) = (1-x) Eg0_host + x Eg0_guest
+  - b(x) x (1-x), with b(x) = Eg0_bowing_eV + Eg0_bowing_slope_eV * x
+
+All properties take arrays of x and T and evaluate them in one broadcasted
+expression, so composition sweeps never build per-point `Material` objects.
+`Alloy.grid` returns (n_x, n_T) grids and memoizes recent ones.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple, TypeAlias
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .registry import _KB_EV_PER_K, Material, get_material
+from .table import MaterialTable
+
+FloatArray: TypeAlias = NDArray[np.float64]
+
+# Number of (alloy, x grid, T grid) results kept by `Alloy.grid`
+GRID_CACHE_SIZE = 32
+
+
+class AlloyParameters(NamedTuple):
+    """Interpolated material parameters at one or more compositions."""
+
+    Eg0_eV: FloatArray
+    varshni_alpha_eV_per_K: FloatArray
+    varshni_beta_K: FloatArray
+    Nc_prefactor_cm3: FloatArray
+    Nv_prefactor_cm3: FloatArray
+
+
+class AlloyProperties(NamedTuple):
+    """Band gap (eV), effective DOS and intrinsic density (cm^-3) arrays."""
+
+    Eg: FloatArray
+    Nc: FloatArray
+    Nv: FloatArray
+    ni: FloatArray
+
+
+def _composition(x: float | NDArray[np.floating]) -> FloatArray:
+    x_arr = np.asarray(x, dtype=float)
+    if not np.all(np.isfinite(x_arr)) or np.any((x_arr < 0.0) | (x_arr > 1.0)):
+        raise ValueError("alloy composition x must lie in [0, 1]")
+    return x_arr
+
+
+def _evaluate(params: AlloyParameters, T: FloatArray) -> AlloyProperties:
+    """Same formulas as `Material`, on broadcastable parameter and T arrays."""
+    Eg = params.Eg0_eV - (params.varshni_alpha_eV_per_K * T**2) / (T + params.varshni_beta_K)
+    T_15 = T**1.5
+    Nc = params.Nc_prefactor_cm3 * T_15
+    Nv = params.Nv_prefactor_cm3 * T_15
+    ni = np.sqrt(Nc * Nv) * np.exp(-Eg / (2.0 * _KB_EV_PER_K * T))
+    return AlloyProperties(Eg=Eg, Nc=Nc, Nv=Nv, ni=ni)
+
+
+@dataclass(frozen=True)
+class Alloy:
+    name: str
+    symbol: str
+    host: Material
+    guest: Material
+    Eg0_bowing_eV: float = 0.0
+    Eg0_bowing_slope_eV: float = 0.0
+
+    def parameters(self, x: float | NDArray[np.floating]) -> AlloyParameters:
+        """Vegard/bowing-interpolated parameters, shaped like `x`."""
+        x_arr = _composition(x)
+        h, g = self.host, self.guest
+
+        def vegard(a: float, b: float) -> FloatArray:
+            return a + (b - a) * x_arr
+
+        bowing = (self.Eg0_bowing_eV + self.Eg0_bowing_slope_eV * x_arr) * x_arr * (1.0 - x_arr)
+        return AlloyParameters(
+            Eg0_eV=vegard(h.Eg0_eV, g.Eg0_eV) - bowing,
+            varshni_alpha_eV_per_K=vegard(h.varshni_alpha_eV_per_K, g.varshni_alpha_eV_per_K),
+            varshni_beta_K=vegard(h.varshni_beta_K, g.varshni_beta_K),
+            Nc_prefactor_cm3=vegard(h.Nc_prefactor_cm3, g.Nc_prefactor_cm3),
+            Nv_prefactor_cm3=vegard(h.Nv_prefactor_cm3, g.Nv_prefactor_cm3),
+        )
+
+    def properties(
+        self, x: float | NDArray[np.floating], T: float | NDArray[np.floating]
+    ) -> AlloyProperties:
+        """Eg, Nc, Nv and ni with `x` and `T` broadcast elementwise."""
+        return _evaluate(self.parameters(x), np.asarray(T, dtype=float))
+
+    def Eg(self, x: float | NDArray[np.floating], T: float | NDArray[np.floating]) -> FloatArray:
+        return self.properties(x, T).Eg
+
+    def Nc(self, x: float | NDArray[np.floating], T: float | NDArray[np.floating]) -> FloatArray:
+        return self.properties(x, T).Nc
+
+    def Nv(self, x: float | NDArray[np.floating], T: float | NDArray[np.floating]) -> FloatArray:
+        return self.properties(x, T).Nv
+
+    def ni(self, x: float | NDArray[np.floating], T: float | NDArray[np.floating]) -> FloatArray:
+        return self.properties(x, T).ni
+
+    def grid(
+        self, x: float | NDArray[np.floating], T: float | NDArray[np.floating]
+    ) -> AlloyProperties:
+        """(n_x, n_T) property grids over flattened `x` and `T`.
+
+        Results are memoized per (alloy, x values, T values) and returned as
+        read-only arrays, so optimization loops that revisit the same grids
+        pay for them once.
+        """
+        x_arr = np.ascontiguousarray(_composition(x).ravel())
+        T_arr = np.ascontiguousarray(np.asarray(T, dtype=float).ravel())
+        return _cached_grid(self, x_arr.tobytes(), T_arr.tobytes())
+
+    def at(self, x: float) -> Material:
+        """A `Material` at fixed composition, for use with scalar devices."""
+        return _material_at(self, float(x))
+
+    def table(self, x: float | NDArray[np.floating]) -> MaterialTable:
+        """A `MaterialTable` with one row per composition in flattened `x`.
+
+        Pass it with `material_index=np.arange(x.size)` to a device population
+        to sweep composition in a single batch.
+        """
+        x_flat = _composition(x).ravel()
+        return MaterialTable.from_parameters(
+            [f"{self.symbol}(x={v:g})" for v in x_flat],
+            **self.parameters(x_flat)._asdict(),
+        )
+
+
+@lru_cache(maxsize=GRID_CACHE_SIZE)
+def _cached_grid(alloy: Alloy, x_bytes: bytes, T_bytes: bytes) -> AlloyProperties:
+    x = np.frombuffer(x_bytes, dtype=float)
+    T = np.frombuffer(T_bytes, dtype=float)
+    params = AlloyParameters(*(p[:, None] for p in alloy.parameters(x)))
+    props = _evaluate(params, T[None, :])
+    for arr in props:
+        arr.setflags(write=False)
+    return props
+
+
+@lru_cache(maxsize=256)
+def _material_at(alloy: Alloy, x: float) -> Material:
+    p = alloy.parameters(x)
+    return Material(
+        name=f"{alloy.name} (x={x:g})",
+        symbol=f"{alloy.symbol}(x={x:g})",
+        Eg0_eV=float(p.Eg0_eV),
+        varshni_alpha_eV_per_K=float(p.varshni_alpha_eV_per_K),
+        varshni_beta_K=float(p.varshni_beta_K),
+        Nc_prefactor_cm3=float(p.Nc_prefactor_cm3),
+        Nv_prefactor_cm3=float(p.Nv_prefactor_cm3),
+    )
+
+
+# Γ-valley parameters of AlAs, used only as the x = 1 endpoint of
+# Al_xGa_{1-x}As (Vurgaftman et al., JAP 89, 5815 (2001)). Real AlAs is
+# indirect (X valley, about 2.2 eV), so this is not a registry material.
+# Nc, Nv from the Ioffe AlGaAs masses at x = 1: 2.5e19 (m*/m0)^{3/2} at 300K.
+_ALAS_GAMMA = Material(
+    name="Aluminium Arsenide (Γ-valley endpoint)",
+    symbol="AlAs(Γ)",
+    Eg0_eV=3.099,
+    varshni_alpha_eV_per_K=8.85e-4,
+    varshni_beta_K=530.0,
+    Nc_prefactor_cm3=2.5e19 * 0.146**1.5 / (300.0**1.5),
+    Nv_prefactor_cm3=2.5e19 * 0.76**1.5 / (300.0**1.5),
+)
+
+alloys: dict[str, Alloy] = {
+    # Al_xGa_{1-x}As, Γ valley (direct gap, accurate for x below ~0.45 where the
+    # X valley takes over). Composition-dependent bowing b = -0.127 + 1.310 x
+    # from Vurgaftman et al., JAP 89, 5815 (2001).
+    "AlGaAs": Alloy(
+        name="Aluminium Gallium Arsenide",
+        symbol="AlGaAs",
+        host=get_material("GaAs"),
+        guest=_ALAS_GAMMA,
+        Eg0_bowing_eV=-0.127,
+        Eg0_bowing_slope_eV=1.310,
+    ),
+    # Si_{1-x}Ge_x, X-like indirect gap (valid for x below ~0.85). The bowing
+    # matches the x^2 coefficient of the Ioffe fit Eg = 1.155 - 0.43x + 0.0206x^2.
+    "SiGe": Alloy(
+        name="Silicon Germanium",
+        symbol="SiGe",
+        host=get_material("Si"),
+        guest=get_material("Ge"),
+        Eg0_bowing_eV=0.0206,
+    ),
+}
+
+
+def get_alloy(key: str) -> Alloy:
+    a = alloys.get(key)
+    if a is None:
+        raise KeyError(f"Unknown alloy key: {key}. Available: {', '.join(alloys)}")
+    return a
+
+
+def list_alloys() -> Iterable[str]:
+    return alloys.keys()
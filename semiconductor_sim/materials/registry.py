@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from dataclasses import dataclass
-from typing import TypeAlias, cast
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import NamedTuple, TypeAlias, cast
 
 import numpy as np
 from numpy.typing import NDArray
@@ -12,6 +13,20 @@ from semiconductor_sim.models.bandgap import temperature_dependent_bandgap
 FloatArray: TypeAlias = NDArray[np.float64]
 
 
+# k_B in eV/K
+_KB_EV_PER_K = 8.617333262145e-5
+
+# Maximum number of (material, temperature) entries kept by the scalar memo
+SCALAR_CACHE_SIZE = 1024
+
+
+class _ScalarProperties(NamedTuple):
+    Eg: float
+    Nc: float
+    Nv: float
+    ni: float
+
+
 @dataclass(frozen=True)
 class Material:
     name: str
@@ -22,41 +37,163 @@ class Material:
     Nc_prefactor_cm3: float
     Nv_prefactor_cm3: float
 
+    # Scalar temperatures are served from a bounded LRU memo keyed by
+    # (material, T), so constructing many devices at a handful of temperatures
+    # evaluates each property once. Arrays are always computed directly.
+
     def Eg(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
+        if np.ndim(T) == 0:
+            return _scalar_properties(self, float(T)).Eg
+        return self._Eg(T)
+
+    def Nc(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
+        if np.ndim(T) == 0:
+            return _scalar_properties(self, float(T)).Nc
+        return self._Nc(T)
+
+    def Nv(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
+        if np.ndim(T) == 0:
+            return _scalar_properties(self, float(T)).Nv
+        return self._Nv(T)
+
+    def ni(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
+        if np.ndim(T) == 0:
+            return _scalar_properties(self, float(T)).ni
+        return self._ni(T)
+
+    def ni_table(
+        self,
+        T_min: float,
+        T_max: float,
+        *,
+        rtol: float = 1e-6,
+        max_points: int = 1 << 16,
+    ) -> IntrinsicDensityTable:
+        """Return a (cached) interpolation table for `ni` on [T_min, T_max].
+
+        See `IntrinsicDensityTable`; the table is refined until its relative
+        error is at most `rtol`.
+        """
+        return _build_ni_table(self, float(T_min), float(T_max), float(rtol), int(max_points))
+
+    def _Eg(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
         return temperature_dependent_bandgap(
             T,
             E_g0=self.Eg0_eV,
             alpha=self.varshni_alpha_eV_per_K,
-            beta=int(self.varshni_beta_K),
+            beta=self.varshni_beta_K,
         )
 
-    def Nc(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
+    def _Nc(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
         T_arr = cast(FloatArray, np.asarray(T, dtype=float))
         Nc_arr = self.Nc_prefactor_cm3 * T_arr**1.5
         if np.ndim(Nc_arr) == 0:
             return float(Nc_arr)
         return Nc_arr
 
-    def Nv(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
+    def _Nv(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
         T_arr = cast(FloatArray, np.asarray(T, dtype=float))
         Nv_arr = self.Nv_prefactor_cm3 * T_arr**1.5
         if np.ndim(Nv_arr) == 0:
             return float(Nv_arr)
         return Nv_arr
 
-    def ni(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
+    def _ni(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
         T_arr = cast(FloatArray, np.asarray(T, dtype=float))
-        Nc = cast(FloatArray, np.asarray(self.Nc(T_arr), dtype=float))
-        Nv = cast(FloatArray, np.asarray(self.Nv(T_arr), dtype=float))
-        Eg_eV = cast(FloatArray, np.asarray(self.Eg(T_arr), dtype=float))
-        # k_B/q in V/K; using eV units, k_B_eV_per_K ~ 8.617333262145e-5
-        kB_eV_per_K = 8.617333262145e-5
-        ni_arr = cast(FloatArray, np.sqrt(Nc * Nv) * np.exp(-Eg_eV / (2.0 * kB_eV_per_K * T_arr)))
+        Nc = cast(FloatArray, np.asarray(self._Nc(T_arr), dtype=float))
+        Nv = cast(FloatArray, np.asarray(self._Nv(T_arr), dtype=float))
+        Eg_eV = cast(FloatArray, np.asarray(self._Eg(T_arr), dtype=float))
+        ni_arr = cast(FloatArray, np.sqrt(Nc * Nv) * np.exp(-Eg_eV / (2.0 * _KB_EV_PER_K * T_arr)))
         if np.ndim(ni_arr) == 0:
             return float(ni_arr)
         return ni_arr
 
 
+@lru_cache(maxsize=SCALAR_CACHE_SIZE)
+def _scalar_properties(material: Material, T: float) -> _ScalarProperties:
+    return _ScalarProperties(
+        Eg=float(material._Eg(T)),
+        Nc=float(material._Nc(T)),
+        Nv=float(material._Nv(T)),
+        ni=float(material._ni(T)),
+    )
+
+
+def clear_material_cache() -> None:
+    """Drop all memoized scalar properties and interpolation tables."""
+    _scalar_properties.cache_clear()
+    _build_ni_table.cache_clear()
+
+
+@dataclass(frozen=True, eq=False)
+class IntrinsicDensityTable:
+    """Precomputed log-space lookup table for a material's `ni(T)`.
+
+    ln(ni) is nearly linear in 1/T (ni ~ T^{3/2} exp(-Eg / 2kT)), so the table
+    stores ln(ni) on a uniform 1/T grid and interpolates linearly. The grid is
+    doubled until the error measured at every cell midpoint, where the linear
+    interpolation error of a smooth function peaks, is within `rtol`; the
+    achieved bound is kept in `max_rel_error`. Temperatures outside
+    [T_min, T_max] fall back to the exact formula.
+    """
+
+    material: Material
+    T_min: float
+    T_max: float
+    inv_T: FloatArray
+    log_ni: FloatArray
+    max_rel_error: float
+    _slope: FloatArray = field(init=False, repr=False)
+    _cells_per_inv_K: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Uniform grid: the cell index is computed directly instead of searched
+        object.__setattr__(self, "_slope", np.diff(self.log_ni))
+        span = float(self.inv_T[-1] - self.inv_T[0])
+        object.__setattr__(self, "_cells_per_inv_K", (self.inv_T.size - 1) / span)
+
+    def __call__(self, T: float | NDArray[np.floating]) -> float | NDArray[np.floating]:
+        T_arr = cast(FloatArray, np.asarray(T, dtype=float))
+        pos = np.divide(self._cells_per_inv_K, T_arr.reshape(-1))
+        pos -= self.inv_T[0] * self._cells_per_inv_K
+        idx = pos.astype(np.intp)
+        np.clip(idx, 0, self._slope.size - 1, out=idx)
+        pos -= idx
+        ni_arr = np.take(self._slope, idx)
+        ni_arr *= pos
+        ni_arr += np.take(self.log_ni, idx)
+        np.exp(ni_arr, out=ni_arr)
+        ni_arr = ni_arr.reshape(T_arr.shape)
+        outside = (T_arr < self.T_min) | (T_arr > self.T_max)
+        if np.any(outside):
+            ni_arr = np.where(outside, self.material._ni(T_arr), ni_arr)
+        if np.ndim(ni_arr) == 0:
+            return float(ni_arr)
+        return ni_arr
+
+
+@lru_cache(maxsize=32)
+def _build_ni_table(
+    material: Material, T_min: float, T_max: float, rtol: float, max_points: int
+) -> IntrinsicDensityTable:
+    if not (0.0 < T_min < T_max) or not np.isfinite(T_max):
+        raise ValueError("ni_table requires 0 < T_min < T_max < inf")
+    if rtol <= 0.0:
+        raise ValueError("rtol must be > 0")
+    n = 33
+    while True:
+        inv_T = np.linspace(1.0 / T_max, 1.0 / T_min, n)
+        log_ni = np.log(np.asarray(material._ni(1.0 / inv_T), dtype=float))
+        mid = 0.5 * (inv_T[1:] + inv_T[:-1])
+        exact = np.log(np.asarray(material._ni(1.0 / mid), dtype=float))
+        err = float(np.max(np.abs(np.expm1(np.interp(mid, inv_T, log_ni) - exact))))
+        if err <= rtol:
+            return IntrinsicDensityTable(material, T_min, T_max, inv_T, log_ni, err)
+        n = 2 * n - 1
+        if n > max_points:
+            raise ValueError(f"ni_table could not reach rtol={rtol:g} within {max_points} points")
+
+
 # Prefactors Nc = A T^{3/2}, Nv = B T^{3/2} at 300 K yield ~ A*300^{3/2}
 # Ioffe provides concise formulas:
 # Si: Eg(T) = 1.17 - 4.73e-4 T^2/(T+636); Nc = 6.2e15 T^{3/2}; Nv = 3.5e15 T^{3/2}
@@ -0,0 +1,153 @@
+"""Structure-of-arrays view of several materials for vectorized evaluation.
+
+`MaterialTable` packs the scalar fields of many `Material` entries into NumPy
+arrays so that band gap, effective densities of states and intrinsic density
+are computed for every material and temperature in one broadcasted call::
+
+    table = MaterialTable.from_registry(["Si", "Ge", "GaAs"])
+    ni = table.ni(np.linspace(250.0, 400.0, 151))  # shape (3, 151)
+
+With an `index` array each element picks its own material instead, which is
+how device populations mix materials in one batch.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import TypeAlias
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .registry import _KB_EV_PER_K, Material, get_material, materials
+
+FloatArray: TypeAlias = NDArray[np.float64]
+IntArray: TypeAlias = NDArray[np.intp]
+IndexLike: TypeAlias = NDArray[np.integer] | Sequence[int] | int | None
+
+
+class MaterialTable:
+    """Compiled parameter arrays for a fixed sequence of materials.
+
+    Attributes:
+        materials: The source `Material` entries, in table order (empty for
+            tables built with `from_parameters`).
+        symbols: Their symbols; `index` maps symbols to rows.
+        Eg0_eV, varshni_alpha_eV_per_K, varshni_beta_K, Nc_prefactor_cm3,
+        Nv_prefactor_cm3: Per-material parameter arrays of length `len(table)`.
+    """
+
+    def __init__(self, materials: Iterable[Material]) -> None:
+        mats = tuple(materials)
+        if not mats:
+            raise ValueError("MaterialTable requires at least one material")
+        self.materials: tuple[Material, ...] = mats
+        self.symbols = tuple(m.symbol for m in mats)
+        self.Eg0_eV = np.array([m.Eg0_eV for m in mats], dtype=float)
+        self.varshni_alpha_eV_per_K = np.array([m.varshni_alpha_eV_per_K for m in mats])
+        self.varshni_beta_K = np.array([m.varshni_beta_K for m in mats], dtype=float)
+        self.Nc_prefactor_cm3 = np.array([m.Nc_prefactor_cm3 for m in mats], dtype=float)
+        self.Nv_prefactor_cm3 = np.array([m.Nv_prefactor_cm3 for m in mats], dtype=float)
+
+    @classmethod
+    def from_parameters(
+        cls,
+        symbols: Sequence[str],
+        *,
+        Eg0_eV: NDArray[np.floating],
+        varshni_alpha_eV_per_K: NDArray[np.floating],
+        varshni_beta_K: NDArray[np.floating],
+        Nc_prefactor_cm3: NDArray[np.floating],
+        Nv_prefactor_cm3: NDArray[np.floating],
+    ) -> MaterialTable:
+        """Build a table straight from parameter arrays (no `Material` objects).
+
+        The `materials` attribute of such a table is empty.
+        """
+        columns = [
+            np.array(a, dtype=float).ravel()
+            for a in (
+                Eg0_eV,
+                varshni_alpha_eV_per_K,
+                varshni_beta_K,
+                Nc_prefactor_cm3,
+                Nv_prefactor_cm3,
+            )
+        ]
+        if len(symbols) == 0 or any(c.size != len(symbols) for c in columns):
+            raise ValueError("parameter arrays must be non-empty and match len(symbols)")
+        table = cls.__new__(cls)
+        table.materials = ()
+        table.symbols = tuple(symbols)
+        (
+            table.Eg0_eV,
+            table.varshni_alpha_eV_per_K,
+            table.varshni_beta_K,
+            table.Nc_prefactor_cm3,
+            table.Nv_prefactor_cm3,
+        ) = columns
+        return table
+
+    @classmethod
+    def from_registry(cls, keys: Iterable[str] | None = None) -> MaterialTable:
+        """Build a table from registry keys (default: every registered material)."""
+        return cls(get_material(k) for k in (materials if keys is None else keys))
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def index(self, symbols: str | Iterable[str]) -> IntArray:
+        """Row indices for one symbol or an iterable of symbols."""
+        lookup = {s: i for i, s in enumerate(self.symbols)}
+        keys = [symbols] if isinstance(symbols, str) else list(symbols)
+        missing = [k for k in keys if k not in lookup]
+        if missing:
+            raise KeyError(f"Unknown material(s) {missing}. Available: {', '.join(self.symbols)}")
+        return np.array([lookup[k] for k in keys], dtype=np.intp)
+
+    def _broadcast(
+        self, T: float | NDArray[np.floating], index: IndexLike
+    ) -> tuple[FloatArray, IntArray | tuple[slice, None]]:
+        """Temperatures and the row selector shaped for one broadcasted expression.
+
+        Without `index`, T is flattened to a row and parameters become a column,
+        giving (n_materials, n_T). With `index`, both broadcast elementwise.
+        """
+        T_arr = np.asarray(T, dtype=float)
+        if index is None:
+            return T_arr.reshape(1, -1), (slice(None), None)
+        idx = np.asarray(index, dtype=np.intp)
+        if idx.size and (idx.min() < 0 or idx.max() >= len(self)):
+            raise IndexError(f"material index out of range for table of {len(self)}")
+        return T_arr, idx
+
+    def _Eg(self, T_b: FloatArray, sel: IntArray | tuple[slice, None]) -> FloatArray:
+        Eg: FloatArray = self.Eg0_eV[sel] - (self.varshni_alpha_eV_per_K[sel] * T_b**2) / (
+            T_b + self.varshni_beta_K[sel]
+        )
+        return Eg
+
+    def Eg(self, T: float | NDArray[np.floating], index: IndexLike = None) -> FloatArray:
+        """Varshni band gap (eV): (n_materials, n_T), or elementwise with `index`."""
+        return self._Eg(*self._broadcast(T, index))
+
+    def Nc(self, T: float | NDArray[np.floating], index: IndexLike = None) -> FloatArray:
+        """Conduction-band effective DOS (cm^-3), shaped like `Eg`."""
+        T_b, sel = self._broadcast(T, index)
+        return self.Nc_prefactor_cm3[sel] * T_b**1.5
+
+    def Nv(self, T: float | NDArray[np.floating], index: IndexLike = None) -> FloatArray:
+        """Valence-band effective DOS (cm^-3), shaped like `Eg`."""
+        T_b, sel = self._broadcast(T, index)
+        return self.Nv_prefactor_cm3[sel] * T_b**1.5
+
+    def ni(self, T: float | NDArray[np.floating], index: IndexLike = None) -> FloatArray:
+        """Intrinsic carrier density (cm^-3), shaped like `Eg`."""
+        T_b, sel = self._broadcast(T, index)
+        T_15 = T_b**1.5
+        Nc = self.Nc_prefactor_cm3[sel] * T_15
+        Nv = self.Nv_prefactor_cm3[sel] * T_15
+        return np.sqrt(Nc * Nv) * np.exp(-self._Eg(T_b, sel) / (2.0 * _KB_EV_PER_K * T_b))
+
+    def __repr__(self) -> str:
+        return f"MaterialTable({', '.join(self.symbols)})"
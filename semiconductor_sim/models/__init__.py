@@ -4,10 +4,12 @@ from .auger_recombination import auger_recombination
 from .bandgap import temperature_dependent_bandgap
 from .high_frequency import high_frequency_capacitance
 from .radiative_recombination import radiative_recombination
-from .recombination import srh_recombination
+from .recombination import RecombinationComponents, srh_recombination, total_recombination
 
 __all__ = [
     'srh_recombination',
+    'total_recombination',
+    'RecombinationComponents',
     'radiative_recombination',
     'auger_recombination',
     'temperature_dependent_bandgap',
@@ -0,0 +1,404 @@
+"""Local HTTP/JSON simulation server with request micro-batching.
+
+`make_server` returns a stdlib `ThreadingHTTPServer` that answers IV requests::
+
+    POST /iv
+    {"device": "pn", "params": {"doping_p": 1e17, "temperature": 310},
+     "voltage": "-0.2:0.7:91", "material": "Si", "format": "json"}
+
+``voltage`` is a list of numbers or a `semiconductor_sim.sweep.parse_values`
+string; ``material`` (optional) is a registry key; ``format`` is ``"json"``
+(default, ``{"voltage": [...], "current": [...]}``) or ``"npy"`` for an
+``application/x-npy`` body holding the current as float32 (``"dtype":
+"float64"`` keeps full precision). ``GET /health`` and ``GET /stats`` report
+the server state.
+
+Handler threads do not evaluate anything themselves. They hand each request
+to a `MicroBatcher`, whose single worker thread collects the requests that
+arrive within a short window (2 ms by default) and groups those for the same
+device, material, parameter names and voltage grid. Each group is evaluated
+with one call: device types with a batched population class (pn, led, solar,
+photodiode, pin, schottky) evaluate the whole group in one broadcasted
+`iv_characteristic`, the others reuse warm device instances from an LRU
+cache. Device classes, the Zener ML model and material properties are warmed
+up at start-up.
+"""
+
+from __future__ import annotations
+
+import inspect
+import io
+import json
+import queue
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import numpy as np
+
+from .materials import Material, get_material, list_materials
+from .sweep import DEVICES, REQUIRED_DEFAULTS, FloatArray, _device_class, parse_values
+
+# Seconds the batcher waits for more requests after the first one arrives
+DEFAULT_WINDOW = 0.002
+
+# Upper bound on requests evaluated together
+DEFAULT_MAX_BATCH = 1024
+
+# Warm device instances kept for device types without a population class
+DEVICE_CACHE_SIZE = 1024
+
+# Seconds a handler waits for its batch before answering 503
+REQUEST_TIMEOUT = 30.0
+
+# Largest accepted request body (bytes)
+MAX_BODY_BYTES = 1 << 20
+
+# Largest voltage grid per request; with DEFAULT_MAX_BATCH requests sharing a
+# grid the stacked float64 result stays within 128 MiB
+MAX_VOLTAGE_POINTS = 1 << 14
+
+NPY_CONTENT_TYPE = "application/x-npy"
+
+_FORMATS = {"json": np.float64, "npy": np.float32}
+_DTYPES = {"float32": np.float32, "float64": np.float64}
+
+# Voltage grid used to warm up each device type
+_WARM_VOLTAGE = np.linspace(-0.2, 0.7, 8)
+
+
+@dataclass(frozen=True, eq=False)
+class IVRequest:
+    """One parsed IV request: a device type, its scalar parameters and a grid."""
+
+    device: str
+    params: tuple[tuple[str, float], ...]
+    voltage: FloatArray
+    material: str | None = None
+
+    @classmethod
+    def from_json(cls, payload: Mapping[str, Any]) -> IVRequest:
+        """Validate a decoded request body.
+
+        Raises:
+        - ValueError for unknown devices or parameters and malformed values
+        """
+        device = payload.get("device")
+        if device not in DEVICES:
+            raise ValueError(f"unknown device {device!r}; choose from {', '.join(DEVICES)}")
+        raw = payload.get("params") or {}
+        if not isinstance(raw, Mapping):
+            raise ValueError("params must be an object of name: number")
+        accepted = inspect.signature(_device_class(DEVICES[device][0])).parameters
+        unknown = sorted(k for k in raw if k not in accepted or k == "material")
+        if unknown:
+            raise ValueError(f"{DEVICES[device][0]} has no numeric parameter(s) {unknown}")
+        try:
+            params = tuple(sorted((k, float(v)) for k, v in raw.items()))
+        except (TypeError, ValueError) as exc:
+            raise ValueError("params values must be numbers") from exc
+        voltage = payload.get("voltage")
+        if isinstance(voltage, str):
+            # Ranges are size-checked before the grid is built
+            grid = parse_values(voltage, max_points=MAX_VOLTAGE_POINTS)
+        else:
+            try:
+                grid = np.asarray(voltage, dtype=float).ravel()
+            except (TypeError, ValueError) as exc:
+                raise ValueError(
+                    "voltage must be a list of numbers or start:stop:num[:log]"
+                ) from exc
+        if grid.size > MAX_VOLTAGE_POINTS:
+            raise ValueError(
+                f"voltage has {grid.size} values; at most {MAX_VOLTAGE_POINTS} are allowed"
+            )
+        if grid.size == 0 or not np.all(np.isfinite(grid)):
+            raise ValueError("voltage needs at least one finite value")
+        material = payload.get("material")
+        if material is not None:
+            if "material" not in accepted:
+                raise ValueError(f"{DEVICES[device][0]} does not take a material")
+            _material(str(material))
+        return cls(device, params, grid, None if material is None else str(material))
+
+    @property
+    def group_key(self) -> tuple[Any, ...]:
+        """Requests with equal keys are evaluated in one batch."""
+        names = tuple(k for k, _ in self.params)
+        return (self.device, self.material, names, self.voltage.tobytes())
+
+
+def _material(key: str) -> Material:
+    try:
+        return get_material(key)
+    except KeyError as exc:
+        raise ValueError(str(exc.args[0])) from exc
+
+
+@lru_cache(maxsize=DEVICE_CACHE_SIZE)
+def _device(device: str, params: tuple[tuple[str, float], ...], material: str | None) -> Any:
+    cls = _device_class(DEVICES[device][0])
+    return cls(**_constructor_kwargs(cls, dict(params), material), **dict(params))
+
+
+def _constructor_kwargs(
+    cls: type, params: Mapping[str, Any], material: str | None
+) -> dict[str, Any]:
+    accepted = inspect.signature(cls).parameters
+    kwargs: dict[str, Any] = {
+        k: v for k, v in REQUIRED_DEFAULTS.items() if k in accepted and k not in params
+    }
+    if material is not None:
+        kwargs["material"] = _material(material)
+    return kwargs
+
+
+def evaluate_batch(requests: Sequence[IVRequest]) -> FloatArray:
+    """
+    Currents, shape ``(len(requests), n_voltages)``, of requests sharing a group key.
+
+    Uses the device type's population class in one call when it accepts all
+    parameters, otherwise evaluates cached device instances one by one.
+    """
+    first = requests[0]
+    names = [k for k, _ in first.params]
+    population = DEVICES[first.device][1]
+    if population is not None:
+        pop_cls = _device_class(population)
+        if all(k in inspect.signature(pop_cls).parameters for k in names):
+            columns = {k: np.array([r.params[i][1] for r in requests]) for i, k in enumerate(names)}
+            kwargs = _constructor_kwargs(pop_cls, columns, first.material)
+            current = pop_cls(**kwargs, **columns).iv_characteristic(first.voltage)[0]
+            # Without swept parameters the population has a single member
+            current = np.asarray(current, dtype=float).reshape(-1, first.voltage.size)
+            return np.broadcast_to(current, (len(requests), first.voltage.size))
+    out = np.empty((len(requests), first.voltage.size))
+    for i, r in enumerate(requests):
+        out[i] = _device(r.device, r.params, r.material).iv_characteristic(r.voltage)[0]
+    return out
+
+
+def warm_caches() -> None:
+    """Import every device type, load the Zener model and fill material caches."""
+    for key in list_materials():
+        get_material(key).ni(300.0)
+    for device in DEVICES:
+        evaluate_batch([IVRequest(device, (), _WARM_VOLTAGE)])
+
+
+@dataclass
+class BatchStats:
+    requests: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+
+
+class MicroBatcher:
+    """Coalesces requests submitted within `window` seconds into grouped batches.
+
+    `submit` may be called from any thread and returns a `Future` resolving
+    to the request's current array. A single worker thread evaluates the
+    batches, so NumPy work is never interleaved between requests.
+    """
+
+    def __init__(self, *, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        if window < 0 or max_batch < 1:
+            raise ValueError("window must be >= 0 and max_batch >= 1")
+        self.window = window
+        self.max_batch = max_batch
+        self.stats = BatchStats()
+        self._queue: queue.SimpleQueue[tuple[IVRequest, Future[FloatArray]] | None] = (
+            queue.SimpleQueue()
+        )
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name="semisim-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, request: IVRequest) -> Future[FloatArray]:
+        future: Future[FloatArray] = Future()
+        self._queue.put((request, future))
+        return future
+
+    def close(self) -> None:
+        """Stop the worker after it finishes the requests already queued."""
+        self._queue.put(None)
+        self._worker.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            items = [item]
+            stop = False
+            deadline = time.monotonic() + self.window
+            while len(items) < self.max_batch:
+                try:
+                    nxt = self._queue.get(timeout=max(deadline - time.monotonic(), 0.0))
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                items.append(nxt)
+            groups: dict[tuple[Any, ...], list[tuple[IVRequest, Future[FloatArray]]]] = defaultdict(
+                list
+            )
+            for request, future in items:
+                groups[request.group_key].append((request, future))
+            for group in groups.values():
+                self._evaluate(group)
+            if stop:
+                return
+
+    def _evaluate(self, group: list[tuple[IVRequest, Future[FloatArray]]]) -> None:
+        with self._lock:
+            self.stats.requests += len(group)
+            self.stats.batches += 1
+            self.stats.largest_batch = max(self.stats.largest_batch, len(group))
+        try:
+            currents = evaluate_batch([r for r, _ in group])
+        except Exception as exc:
+            if len(group) == 1:
+                group[0][1].set_exception(exc)
+                return
+            # One invalid request must not fail the rest: retry them individually
+            for single in group:
+                self._evaluate([single])
+            return
+        for (_, future), current in zip(group, currents, strict=True):
+            future.set_result(current)
+
+
+class SimulationServer(ThreadingHTTPServer):
+    """`ThreadingHTTPServer` whose handlers share one `MicroBatcher`."""
+
+    daemon_threads = True
+    # Listen backlog; the socketserver default of 5 resets bursts of clients
+    request_queue_size = 256
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        *,
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        verbose: bool = False,
+    ):
+        super().__init__(address, _Handler)
+        self.batcher = MicroBatcher(window=window, max_batch=max_batch)
+        self.verbose = verbose
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.batcher.close()
+
+
+def _option(payload: Mapping[str, Any], key: str, options: Mapping[str, Any]) -> str | None:
+    """Validated name in ``payload[key]`` (None when absent)."""
+    name = payload.get(key)
+    if name is not None and (not isinstance(name, str) or name not in options):
+        raise ValueError(f"{key} must be one of {sorted(options)}")
+    return name
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: SimulationServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json({"status": "ok", "devices": list(DEVICES)})
+        elif self.path == "/stats":
+            stats = self.server.batcher.stats
+            self._send_json(
+                {
+                    "requests": stats.requests,
+                    "batches": stats.batches,
+                    "largest_batch": stats.largest_batch,
+                    "device_cache": _device.cache_info()._asdict(),
+                }
+            )
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"no route {self.path}")
+
+    def do_POST(self) -> None:
+        if self.path != "/iv":
+            self._send_error(HTTPStatus.NOT_FOUND, f"no route {self.path}")
+            return
+        # The body is not read on these errors, so the connection cannot be reused
+        raw_length = self.headers.get("Content-Length") or "0"
+        length = int(raw_length) if raw_length.isdigit() else -1
+        if length < 0:
+            self.close_connection = True
+            self._send_error(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+            return
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request body too large")
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(payload, dict):
+                raise ValueError("request body must be a JSON object")
+            fmt = _option(payload, "format", _FORMATS) or "json"
+            dtype_name = _option(payload, "dtype", _DTYPES)
+            dtype = _DTYPES[dtype_name] if dtype_name else _FORMATS[fmt]
+            request = IVRequest.from_json(payload)
+            current = self.server.batcher.submit(request).result(timeout=REQUEST_TIMEOUT)
+        except ValueError as exc:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(exc))
+            return
+        except FutureTimeoutError:  # not the builtin TimeoutError before Python 3.11
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, "evaluation timed out")
+            return
+        except Exception as exc:
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(exc).__name__}: {exc}")
+            return
+        if fmt == "npy":
+            buf = io.BytesIO()
+            np.save(buf, current.astype(dtype), allow_pickle=False)
+            self._send(HTTPStatus.OK, buf.getvalue(), NPY_CONTENT_TYPE)
+        else:
+            self._send_json(
+                {"voltage": request.voltage.tolist(), "current": current.astype(dtype).tolist()}
+            )
+
+    def _send_json(self, body: Any, status: HTTPStatus = HTTPStatus.OK) -> None:
+        self._send(status, json.dumps(body).encode(), "application/json")
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json({"error": message}, status)
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    *,
+    window: float = DEFAULT_WINDOW,
+    max_batch: int = DEFAULT_MAX_BATCH,
+    warm: bool = True,
+    verbose: bool = False,
+) -> SimulationServer:
+    """Create (but do not start) a server; call `serve_forever()` on the result."""
+    if warm:
+        warm_caches()
+    return SimulationServer((host, port), window=window, max_batch=max_batch, verbose=verbose)
@@ -0,0 +1,39 @@
+# semiconductor_sim/surrogates/__init__.py
+
+from .dataset import (
+    DatasetManifest,
+    ParameterRange,
+    PopulationIV,
+    generate_dataset,
+    iter_shards,
+    load_dataset,
+    read_manifest,
+    zener_voltage_target,
+)
+from .forest import TreeEnsemble, export_forest, load_forest
+from .spline import (
+    SplineSurrogate,
+    ValidationReport,
+    fit_iv_surrogate,
+    load_surrogate,
+    validate_surrogate,
+)
+
+__all__ = [
+    "DatasetManifest",
+    "ParameterRange",
+    "PopulationIV",
+    "SplineSurrogate",
+    "TreeEnsemble",
+    "ValidationReport",
+    "export_forest",
+    "fit_iv_surrogate",
+    "generate_dataset",
+    "iter_shards",
+    "load_dataset",
+    "load_forest",
+    "load_surrogate",
+    "read_manifest",
+    "validate_surrogate",
+    "zener_voltage_target",
+]
@@ -0,0 +1,317 @@
+"""Chunked, parallel, resumable training-data generation for device surrogates.
+
+`generate_dataset` samples a declared parameter space and evaluates a target
+(e.g. a device population's IV curve) in vectorized chunks. Each chunk is an
+independent job with its own random stream,
+``SeedSequence(seed, spawn_key=(chunk,))``, so the dataset is identical for
+any number of worker processes and for interrupted-then-resumed runs.
+
+Workers write their chunk straight to ``shard_XXXXX.npz`` (via a temporary
+file and an atomic rename) and return only its name, so no large arrays
+travel back through the process pool. A ``manifest.json`` records the
+configuration; re-running with the same configuration skips finished shards::
+
+    from semiconductor_sim.devices import PNJunctionPopulation
+    from semiconductor_sim.surrogates.dataset import (
+        ParameterRange, PopulationIV, generate_dataset, load_dataset,
+    )
+
+    generate_dataset(
+        PopulationIV(PNJunctionPopulation, np.linspace(0.0, 0.7, 71), doping_n=1e17),
+        {"doping_p": ParameterRange(1e15, 1e19, log=True),
+         "temperature": ParameterRange(250.0, 400.0)},
+        n_samples=10_000_000, out_dir="pn_dataset", jobs=8,
+    )
+    data = load_dataset("pn_dataset")  # {"doping_p": ..., "current": ...}
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray: TypeAlias = npt.NDArray[np.float64]
+Columns: TypeAlias = dict[str, FloatArray]
+
+# target(params, rng) -> output columns; must be picklable for jobs > 1
+Target: TypeAlias = Callable[[Columns, np.random.Generator], Mapping[str, npt.ArrayLike]]
+
+DEFAULT_CHUNK_SIZE = 100_000
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass(frozen=True)
+class ParameterRange:
+    """Sampling range of one parameter: uniform, or log-uniform with `log=True`."""
+
+    low: float
+    high: float
+    log: bool = False
+
+    def __post_init__(self) -> None:
+        if not (np.isfinite(self.low) and np.isfinite(self.high) and self.low <= self.high):
+            raise ValueError("ParameterRange requires finite low <= high")
+        if self.log and self.low <= 0:
+            raise ValueError("log-uniform ranges require low > 0")
+
+    def sample(self, rng: np.random.Generator, n: int) -> FloatArray:
+        if self.log:
+            return np.exp(rng.uniform(np.log(self.low), np.log(self.high), n))
+        return rng.uniform(self.low, self.high, n)
+
+
+@dataclass(frozen=True)
+class PopulationIV:
+    """Target evaluating a device population's current over a fixed voltage grid.
+
+    Sampled parameters, together with the fixed keyword arguments, are passed
+    to the `population` constructor (e.g. `PNJunctionPopulation`); the output
+    column ``"current"`` has shape ``(chunk, n_voltages)``.
+    """
+
+    population: type
+    voltage: tuple[float, ...]
+    fixed: tuple[tuple[str, Any], ...]
+
+    def __init__(self, population: type, voltage: npt.ArrayLike, **fixed: Any) -> None:
+        object.__setattr__(self, "population", population)
+        object.__setattr__(
+            self, "voltage", tuple(float(v) for v in np.asarray(voltage, dtype=float).ravel())
+        )
+        object.__setattr__(self, "fixed", tuple(sorted(fixed.items())))
+
+    def __call__(self, params: Columns, rng: np.random.Generator) -> dict[str, FloatArray]:
+        device = self.population(**dict(self.fixed), **params)
+        current = device.iv_characteristic(np.asarray(self.voltage))[0]
+        return {"current": np.asarray(current, dtype=float)}
+
+    def __repr__(self) -> str:
+        fixed = "".join(f", {k}={v!r}" for k, v in self.fixed)
+        return f"PopulationIV({self.population.__name__}, n_voltages={len(self.voltage)}{fixed})"
+
+
+def zener_voltage_target(
+    params: Columns, rng: np.random.Generator, noise_std: float = 0.2
+) -> dict[str, FloatArray]:
+    """Synthetic Zener breakdown voltage used to train the example ML model.
+
+    Expects ``doping_p``, ``doping_n`` (cm^-3) and ``temperature`` (K) and adds
+    Gaussian noise of `noise_std` volts from the chunk's random stream.
+    """
+    doping_p, doping_n, temperature = params["doping_p"], params["doping_n"], params["temperature"]
+    zener_voltage = (
+        5.0
+        + 0.1 * np.log10(doping_p)
+        - 0.05 * np.log10(doping_n)
+        + 0.01 * temperature
+        + rng.normal(0.0, noise_std, doping_p.shape)
+    )
+    return {"zener_voltage": zener_voltage}
+
+
+@dataclass(frozen=True)
+class DatasetManifest:
+    """Configuration of a generated dataset, stored as ``manifest.json``.
+
+    `target` names the target callable and `target_config` holds the values
+    that define it (for `PopulationIV`: the population class, a SHA-256 of
+    the voltage grid and the fixed arguments), so resuming with a different
+    grid or different fixed arguments is detected.
+    """
+
+    target: str
+    ranges: dict[str, dict[str, Any]]
+    n_samples: int
+    chunk_size: int
+    seed: int
+    target_config: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def n_chunks(self) -> int:
+        return -(-self.n_samples // self.chunk_size)
+
+    def shard_names(self) -> list[str]:
+        return [_shard_name(i) for i in range(self.n_chunks)]
+
+
+def _shard_name(chunk: int) -> str:
+    return f"shard_{chunk:05d}.npz"
+
+
+def _run_chunk(
+    target: Target,
+    ranges: Mapping[str, ParameterRange],
+    out_dir: str,
+    chunk: tuple[int, int],
+    seed: int,
+) -> str:
+    index, n = chunk
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+    params = {name: r.sample(rng, n) for name, r in ranges.items()}
+    outputs = {k: np.asarray(v) for k, v in target(params, rng).items()}
+    overlap = params.keys() & outputs.keys()
+    if overlap:
+        raise ValueError(f"target outputs collide with parameter names: {sorted(overlap)}")
+    columns: dict[str, Any] = {**params, **outputs}
+    name = _shard_name(index)
+    tmp = os.path.join(out_dir, f".{name}.tmp.npz")
+    np.savez(tmp, **columns)
+    os.replace(tmp, os.path.join(out_dir, name))
+    return name
+
+
+def generate_dataset(
+    target: Target,
+    ranges: Mapping[str, ParameterRange | tuple[float, float]],
+    n_samples: int,
+    out_dir: str | os.PathLike[str],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = 0,
+    jobs: int = 1,
+) -> DatasetManifest:
+    """
+    Sample `ranges`, evaluate `target` chunk by chunk and write `.npz` shards.
+
+    Parameters:
+    - target: callable `(params, rng) -> {name: array}` evaluated once per chunk
+      on arrays of length `chunk_size` (module-level function or picklable
+      object such as `PopulationIV` when `jobs > 1`)
+    - ranges: parameter name -> `ParameterRange` or `(low, high)` tuple
+    - n_samples: total number of samples
+    - out_dir: output directory (created if needed)
+    - chunk_size: samples per shard
+    - seed: root seed; chunk `i` draws from `SeedSequence(seed, spawn_key=(i,))`
+    - jobs: worker processes (1 runs in the calling process)
+
+    Returns:
+    - DatasetManifest describing the dataset
+
+    Raises:
+    - ValueError if `out_dir` holds a dataset with a different configuration
+    """
+    if n_samples <= 0 or chunk_size <= 0:
+        raise ValueError("n_samples and chunk_size must be positive")
+    spaces = {
+        k: r if isinstance(r, ParameterRange) else ParameterRange(*r) for k, r in ranges.items()
+    }
+    name, config = _describe(target)
+    manifest = DatasetManifest(
+        target=name,
+        ranges={k: asdict(r) for k, r in spaces.items()},
+        n_samples=int(n_samples),
+        chunk_size=int(chunk_size),
+        seed=int(seed),
+        target_config=config,
+    )
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    manifest_path = out / MANIFEST_NAME
+    text = json.dumps(asdict(manifest), indent=2)
+    if manifest_path.exists():
+        # Compare in JSON form, where tuples have become lists
+        if json.loads(manifest_path.read_text()) != json.loads(text):
+            raise ValueError(f"{out} holds a dataset with a different configuration")
+    else:
+        manifest_path.write_text(text)
+
+    pending = [
+        (i, min(chunk_size, n_samples - i * chunk_size))
+        for i, name in enumerate(manifest.shard_names())
+        if not (out / name).exists()
+    ]
+    args = [(target, spaces, str(out), chunk, manifest.seed) for chunk in pending]
+    if jobs <= 1 or len(pending) <= 1:
+        for a in args:
+            _run_chunk(*a)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for f in [pool.submit(_run_chunk, *a) for a in args]:
+                f.result()
+    return manifest
+
+
+def _qualname(obj: Any) -> str:
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def _digest(values: npt.ArrayLike) -> str:
+    return hashlib.sha256(np.ascontiguousarray(values, dtype=float).tobytes()).hexdigest()
+
+
+def _config_value(value: Any) -> Any:
+    """JSON-serializable identity of a target argument, built from its value."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, list | tuple | np.ndarray):
+        arr = np.asarray(value)
+        if arr.dtype.kind in "biuf":
+            return {"shape": list(arr.shape), "sha256": _digest(arr)}
+        return [_config_value(v) for v in value]
+    if isinstance(value, Mapping):
+        return {str(k): _config_value(v) for k, v in sorted(value.items())}
+    return _object_config(value)
+
+
+def _object_config(value: Any) -> Any:
+    # Dataclasses by their fields; functions, classes and other objects by name
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = {f.name: _config_value(getattr(value, f.name)) for f in dataclasses.fields(value)}
+        return {"type": _qualname(type(value)), **fields}
+    return _qualname(value if hasattr(value, "__qualname__") else type(value))
+
+
+def _describe(target: Any) -> tuple[str, dict[str, Any]]:
+    # Identity of the target for manifest comparison on resume. Built from
+    # values only: reprs of partials and lambdas embed memory addresses
+    if isinstance(target, PopulationIV):
+        return _qualname(PopulationIV), {
+            "population": _qualname(target.population),
+            "n_voltages": len(target.voltage),
+            "voltage_sha256": _digest(target.voltage),
+            "fixed": {k: _config_value(v) for k, v in target.fixed},
+        }
+    if isinstance(target, functools.partial):
+        name, config = _describe(target.func)
+        return name, {
+            **config,
+            "args": [_config_value(a) for a in target.args],
+            "keywords": {k: _config_value(v) for k, v in sorted(target.keywords.items())},
+        }
+    return _qualname(target if hasattr(target, "__qualname__") else type(target)), {}
+
+
+def read_manifest(out_dir: str | os.PathLike[str]) -> DatasetManifest:
+    """Read the manifest of a dataset directory."""
+    return DatasetManifest(**json.loads((Path(out_dir) / MANIFEST_NAME).read_text()))
+
+
+def iter_shards(out_dir: str | os.PathLike[str]) -> Iterator[dict[str, npt.NDArray[Any]]]:
+    """Yield each shard's columns in chunk order, one shard in memory at a time.
+
+    Raises:
+    - FileNotFoundError if a shard is missing (generation not finished)
+    """
+    out = Path(out_dir)
+    for name in read_manifest(out).shard_names():
+        with np.load(out / name, allow_pickle=False) as data:
+            yield {k: data[k] for k in data.files}
+
+
+def load_dataset(out_dir: str | os.PathLike[str]) -> dict[str, npt.NDArray[Any]]:
+    """Concatenate all shards into one array per column."""
+    shards = list(iter_shards(out_dir))
+    return {k: np.concatenate([s[k] for s in shards]) for k in shards[0]}
@@ -0,0 +1,348 @@
+"""Tensor-product spline surrogates of device IV characteristics.
+
+`fit_iv_surrogate` samples a device's `iv_characteristic` on a regular grid
+over declared parameter ranges (log-spaced for `ParameterRange(log=True)`)
+times the voltage grid, and interpolates it with a tensor-product B-spline.
+Evaluating the spline costs (degree + 1)^d coefficient reads per point,
+independent of how expensive the device model is, which keeps sliders and
+optimizer loops interactive::
+
+    from semiconductor_sim import PNJunctionDiode
+    from semiconductor_sim.surrogates import ParameterRange, fit_iv_surrogate
+
+    sur = fit_iv_surrogate(
+        PNJunctionDiode,
+        {"doping_p": ParameterRange(1e15, 1e18, log=True),
+         "temperature": ParameterRange(250.0, 400.0)},
+        voltage=np.linspace(0.0, 0.7, 36),
+        doping_n=1e17,
+    )
+    print(sur.validation)          # error on random off-grid points
+    I = sur(np.linspace(0, 0.7, 500), doping_p=3e16, temperature=310.0)
+    sur.save("pn_surrogate.npz")   # knots + coefficients, no pickle
+
+Diode currents span many decades, so by default the spline is fitted to
+``asinh(I / scale)``, which is linear near zero and logarithmic for
+|I| >> scale.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from .dataset import ParameterRange
+
+if TYPE_CHECKING:
+    from scipy.interpolate import NdBSpline
+
+FloatArray: TypeAlias = npt.NDArray[np.float64]
+Transform: TypeAlias = Literal["linear", "asinh"]
+
+# Relative errors are only reported where |I| exceeds this fraction of max |I|
+# (near zero crossings a pointwise ratio is meaningless)
+REL_ERROR_FLOOR = 1e-6
+
+# Default asinh scale as a fraction of the largest training |I|
+DEFAULT_ASINH_SCALE = 1e-15
+
+FORMAT_VERSION = 1
+
+
+class ValidationReport(NamedTuple):
+    """Surrogate error on random points drawn from the declared ranges.
+
+    Attributes:
+        n_points: Number of (parameter set, voltage) points compared.
+        max_abs_error: Largest absolute error.
+        rms_abs_error: Root-mean-square absolute error.
+        max_rel_error: Largest pointwise relative error, over points with
+            |I| >= REL_ERROR_FLOOR * max |I|.
+    """
+
+    n_points: int
+    max_abs_error: float
+    rms_abs_error: float
+    max_rel_error: float
+
+
+@dataclass(frozen=True, eq=False)
+class SplineSurrogate:
+    """Tensor-product B-spline over (parameters..., voltage).
+
+    Attributes:
+        names: Parameter names, in axis order (voltage is the last axis).
+        log_axes: Whether each parameter axis is interpolated in log10.
+        lows, highs: Declared parameter ranges.
+        knots: Knot vector per axis (parameters, then voltage), in the
+            interpolation coordinates.
+        coefficients: Spline coefficients, one axis per knot vector.
+        degree: Spline degree on every axis.
+        transform: Output transform, "linear" or "asinh".
+        scale: Scale of the asinh transform (unused for "linear").
+        validation: Error report from `fit_iv_surrogate`, if any.
+    """
+
+    names: tuple[str, ...]
+    log_axes: tuple[bool, ...]
+    lows: FloatArray
+    highs: FloatArray
+    knots: tuple[FloatArray, ...]
+    coefficients: FloatArray
+    degree: int
+    transform: Transform
+    scale: float
+    validation: ValidationReport | None = None
+
+    @cached_property
+    def _spline(self) -> NdBSpline:
+        from scipy.interpolate import NdBSpline
+
+        return NdBSpline(self.knots, self.coefficients, self.degree, extrapolate=False)
+
+    @property
+    def voltage_range(self) -> tuple[float, float]:
+        t = self.knots[-1]
+        return float(t[0]), float(t[-1])
+
+    def predict(self, X: npt.ArrayLike) -> FloatArray:
+        """
+        Evaluate at rows of `X` = (parameters in `names` order..., voltage).
+
+        Points outside the declared ranges return NaN.
+        """
+        X_arr = np.array(X, dtype=float, ndmin=2)
+        if X_arr.shape[-1] != len(self.names) + 1:
+            raise ValueError(f"X must have {len(self.names) + 1} columns: {self.names} + voltage")
+        for i, is_log in enumerate(self.log_axes):
+            if is_log:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    X_arr[..., i] = np.log10(X_arr[..., i])
+        y: FloatArray = self._spline(X_arr)
+        if self.transform == "asinh":
+            y = self.scale * np.sinh(y)
+        return y
+
+    def __call__(self, voltage: npt.ArrayLike, **params: npt.ArrayLike) -> FloatArray:
+        """Current at `voltage` for the given parameters, all broadcast together."""
+        missing = set(self.names) - params.keys()
+        extra = params.keys() - set(self.names)
+        if missing or extra:
+            raise TypeError(f"expected parameters {self.names}, got {tuple(params)}")
+        arrays = np.broadcast_arrays(
+            *(np.asarray(params[n], dtype=float) for n in self.names),
+            np.asarray(voltage, dtype=float),
+        )
+        shape = arrays[0].shape
+        X = np.stack([a.ravel() for a in arrays], axis=-1)
+        return self.predict(X).reshape(shape)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write knots and coefficients to an `.npz` file (no pickled objects)."""
+        arrays: dict[str, Any] = {f"knots_{i}": t for i, t in enumerate(self.knots)}
+        report = np.array(self.validation if self.validation is not None else [], dtype=float)
+        np.savez(
+            path,
+            format_version=np.array(FORMAT_VERSION),
+            names=np.array(self.names, dtype=str),
+            log_axes=np.array(self.log_axes, dtype=bool),
+            lows=self.lows,
+            highs=self.highs,
+            coefficients=self.coefficients,
+            degree=np.array(self.degree),
+            transform=np.array(self.transform),
+            scale=np.array(self.scale),
+            validation=report,
+            **arrays,
+        )
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> SplineSurrogate:
+        """Read a surrogate written by `save`."""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["format_version"]) != FORMAT_VERSION:
+                raise ValueError("unsupported surrogate format version")
+            names = tuple(str(n) for n in data["names"])
+            report = data["validation"]
+            return cls(
+                names=names,
+                log_axes=tuple(bool(b) for b in data["log_axes"]),
+                lows=data["lows"],
+                highs=data["highs"],
+                knots=tuple(data[f"knots_{i}"] for i in range(len(names) + 1)),
+                coefficients=data["coefficients"],
+                degree=int(data["degree"]),
+                transform=str(data["transform"]),  # type: ignore[arg-type]
+                scale=float(data["scale"]),
+                validation=ValidationReport(int(report[0]), *map(float, report[1:]))
+                if report.size
+                else None,
+            )
+
+
+def _axis(r: ParameterRange, n: int) -> tuple[FloatArray, FloatArray]:
+    """Sample points in parameter units and in interpolation coordinates."""
+    if r.log:
+        coords = np.linspace(np.log10(r.low), np.log10(r.high), n)
+        return 10.0**coords, coords
+    coords = np.linspace(r.low, r.high, n)
+    return coords, coords
+
+
+def _evaluate_grid(
+    device: Callable[..., Any],
+    names: tuple[str, ...],
+    values: list[FloatArray],
+    voltage: FloatArray,
+    *,
+    output: int,
+    fixed: Mapping[str, Any],
+) -> FloatArray:
+    """Device current for every parameter combination (rows) over `voltage`."""
+    rows = []
+    for combo in itertools.product(*values):
+        params = dict(zip(names, (float(v) for v in combo), strict=True))
+        result = device(**fixed, **params).iv_characteristic(voltage)
+        rows.append(np.asarray(result[output] if isinstance(result, tuple) else result))
+    return np.asarray(rows, dtype=float)
+
+
+def fit_iv_surrogate(
+    device: Callable[..., Any],
+    ranges: Mapping[str, ParameterRange | tuple[float, float]],
+    voltage: npt.ArrayLike,
+    *,
+    points: int | Mapping[str, int] = 12,
+    degree: int = 3,
+    output: int = 0,
+    transform: Transform = "asinh",
+    scale: float | None = None,
+    n_validation: int = 64,
+    seed: int = 0,
+    **fixed: Any,
+) -> SplineSurrogate:
+    """
+    Fit a tensor-product spline to `device(**params).iv_characteristic(voltage)`.
+
+    Parameters:
+    - device: device class (or factory) taking the parameters as keywords
+    - ranges: parameter name -> `ParameterRange` (log-uniform ranges are
+      gridded and interpolated in log10) or `(low, high)`
+    - voltage: strictly increasing voltage grid; becomes the last axis
+    - points: grid points per parameter axis (int, or per-name mapping)
+    - degree: spline degree on every axis (each axis needs > degree points)
+    - output: which element of a tuple-returning `iv_characteristic` to fit
+    - transform: "asinh" (default) fits asinh(I / scale); "linear" fits I
+    - scale: asinh scale; defaults to DEFAULT_ASINH_SCALE * max |I|
+    - n_validation: random parameter sets (each over `voltage` midpoints)
+      used for the validation report; 0 skips validation
+    - seed: seed for the validation samples
+    - fixed: constant keyword arguments passed to `device`
+
+    Returns:
+    - SplineSurrogate with its `validation` report filled in
+    """
+    V = np.asarray(voltage, dtype=float).ravel()
+    if V.size <= degree or np.any(np.diff(V) <= 0):
+        raise ValueError(f"voltage must be strictly increasing with more than {degree} points")
+    spaces = {
+        k: r if isinstance(r, ParameterRange) else ParameterRange(*r) for k, r in ranges.items()
+    }
+    names = tuple(spaces)
+    counts = [points if isinstance(points, int) else points[n] for n in names]
+    if any(c <= degree for c in counts):
+        raise ValueError(f"every parameter axis needs more than {degree} points")
+    if any(r.low == r.high for r in spaces.values()):
+        raise ValueError("parameter ranges must have low < high; pass constants as keywords")
+    axes = [_axis(spaces[n], c) for n, c in zip(names, counts, strict=True)]
+
+    grid = _evaluate_grid(device, names, [a[0] for a in axes], V, output=output, fixed=fixed)
+    data = grid.reshape(*counts, V.size)
+    if transform == "asinh":
+        scale = float(scale) if scale is not None else DEFAULT_ASINH_SCALE * np.max(np.abs(data))
+        scale = max(scale, np.finfo(float).tiny)
+        data = np.arcsinh(data / scale)
+    elif transform == "linear":
+        scale = 1.0
+    else:
+        raise ValueError("transform must be 'linear' or 'asinh'")
+
+    from scipy.interpolate import make_interp_spline
+
+    # Interpolating tensor-product spline: solve the 1-D collocation problem
+    # along each axis in turn (the systems are separable)
+    knots = []
+    coeffs = data
+    for axis, x in enumerate([a[1] for a in axes] + [V]):
+        spl = make_interp_spline(x, np.moveaxis(coeffs, axis, 0), k=degree)
+        knots.append(np.asarray(spl.t, dtype=float))
+        coeffs = np.moveaxis(np.asarray(spl.c, dtype=float), 0, axis)
+
+    surrogate = SplineSurrogate(
+        names=names,
+        log_axes=tuple(spaces[n].log for n in names),
+        lows=np.array([spaces[n].low for n in names], dtype=float),
+        highs=np.array([spaces[n].high for n in names], dtype=float),
+        knots=tuple(knots),
+        coefficients=np.ascontiguousarray(coeffs),
+        degree=degree,
+        transform=transform,
+        scale=scale,
+    )
+    if n_validation <= 0:
+        return surrogate
+    report = validate_surrogate(
+        surrogate, device, spaces, V, n_samples=n_validation, seed=seed, output=output, fixed=fixed
+    )
+    return replace(surrogate, validation=report)
+
+
+def validate_surrogate(
+    surrogate: SplineSurrogate,
+    device: Callable[..., Any],
+    ranges: Mapping[str, ParameterRange],
+    voltage: npt.ArrayLike,
+    *,
+    n_samples: int = 64,
+    seed: int = 0,
+    output: int = 0,
+    fixed: Mapping[str, Any] | None = None,
+) -> ValidationReport:
+    """Compare `surrogate` with `device` on random off-grid parameter sets.
+
+    Each sample is evaluated at the midpoints of `voltage`, so neither the
+    parameter nor the voltage coordinates coincide with the fitting grid.
+    """
+    V = np.asarray(voltage, dtype=float).ravel()
+    rng = np.random.default_rng(seed)
+    samples = [ranges[n].sample(rng, n_samples) for n in surrogate.names]
+    V_mid = 0.5 * (V[1:] + V[:-1])
+    rows_true, rows_pred = [], []
+    for i in range(n_samples):
+        params = {n: float(s[i]) for n, s in zip(surrogate.names, samples, strict=True)}
+        result = device(**(fixed or {}), **params).iv_characteristic(V_mid)
+        rows_true.append(np.asarray(result[output] if isinstance(result, tuple) else result))
+        rows_pred.append(surrogate(V_mid, **params))
+    truth = np.asarray(rows_true, dtype=float)
+    pred = np.asarray(rows_pred, dtype=float)
+    err = np.abs(pred - truth)
+    significant = np.abs(truth) >= REL_ERROR_FLOOR * np.max(np.abs(truth), initial=0.0)
+    rel = err[significant] / np.abs(truth[significant])
+    return ValidationReport(
+        n_points=int(err.size),
+        max_abs_error=float(np.max(err, initial=0.0)),
+        rms_abs_error=float(np.sqrt(np.mean(err**2))) if err.size else 0.0,
+        max_rel_error=float(np.max(rel, initial=0.0)),
+    )
+
+
+def load_surrogate(path: str | os.PathLike[str]) -> SplineSurrogate:
+    """Load a surrogate saved with `SplineSurrogate.save`."""
+    return SplineSurrogate.load(path)
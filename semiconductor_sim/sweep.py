@@ -0,0 +1,253 @@
+"""Chunked parameter sweeps over device IV characteristics.
+
+A `SweepSpec` names a device, the values of each swept parameter (their
+Cartesian product is the sweep), constant keyword arguments and a voltage
+grid. `run_sweep` evaluates the product in fixed-size chunks, optionally on a
+process pool, and yields the chunks in order. Only a few chunks are in memory
+at any time, so a sweep can be streamed to disk regardless of its size::
+
+    spec = SweepSpec.from_strings(
+        "pn", {"doping_p": "1e15:1e18:31:log", "temperature": "250,300,350"},
+        voltage="-0.2:0.7:91",
+    )
+    for params, current in run_sweep(spec, jobs=4):
+        ...  # params: {name: (n,)}, current: (n, 91)
+
+Devices that have a batched population class (pn, led, solar, photodiode,
+pin, schottky) evaluate each chunk in one vectorized call; the rest loop over
+the chunk.
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import math
+from collections import deque
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray: TypeAlias = npt.NDArray[np.float64]
+
+# CLI device key -> (device class, batched population class or None)
+DEVICES: dict[str, tuple[str, str | None]] = {
+    "pn": ("PNJunctionDiode", "PNJunctionPopulation"),
+    "led": ("LED", "LEDPopulation"),
+    "solar": ("SolarCell", "SolarCellPopulation"),
+    "photodiode": ("Photodiode", "PhotodiodePopulation"),
+    "pin": ("PINDiode", "PINDiodePopulation"),
+    "schottky": ("SchottkyDiode", "SchottkyDiodePopulation"),
+    "tunnel": ("TunnelDiode", None),
+    "varactor": ("VaractorDiode", None),
+    "zener": ("ZenerDiode", None),
+}
+
+# Values used for required constructor arguments that are neither swept nor set
+REQUIRED_DEFAULTS = {"doping_p": 1e17, "doping_n": 1e17}
+
+DEFAULT_CHUNK_SIZE = 1024
+
+# Chunks kept in flight per worker; bounds memory while keeping workers busy
+_PREFETCH_PER_JOB = 2
+
+# start:stop:num
+_RANGE_FIELDS = 3
+
+
+def parse_values(spec: str, *, max_points: int | None = None) -> FloatArray:
+    """
+    Parse a value list ``"a,b,c"`` or a range ``"start:stop:num[:log]"``.
+
+    Ranges include both end points; with ``log`` they are spaced
+    geometrically (start and stop must then be positive). With `max_points`,
+    longer lists and ranges are rejected before any array is allocated.
+    """
+    text = spec.strip()
+    if ":" not in text:
+        items = [v for v in text.split(",") if v.strip()]
+        _check_points(spec, len(items), max_points)
+        try:
+            return np.array([float(v) for v in items], dtype=float)
+        except ValueError as exc:
+            raise ValueError(f"invalid value list {spec!r}") from exc
+    parts = text.split(":")
+    spacing = parts.pop() if parts[-1] in {"log", "lin"} else "lin"
+    if len(parts) != _RANGE_FIELDS:
+        raise ValueError(f"invalid range {spec!r}; expected start:stop:num[:log]")
+    try:
+        start, stop, num = float(parts[0]), float(parts[1]), int(parts[2])
+    except ValueError as exc:
+        raise ValueError(f"invalid range {spec!r}; expected start:stop:num[:log]") from exc
+    if num < 1:
+        raise ValueError(f"range {spec!r} needs at least one point")
+    _check_points(spec, num, max_points)
+    if spacing == "log":
+        if start <= 0 or stop <= 0:
+            raise ValueError(f"log range {spec!r} needs positive end points")
+        return np.geomspace(start, stop, num)
+    return np.linspace(start, stop, num)
+
+
+def _check_points(spec: str, num: int, max_points: int | None) -> None:
+    if max_points is not None and num > max_points:
+        raise ValueError(f"{spec!r} has {num} values; at most {max_points} are allowed")
+
+
+def _device_class(name: str) -> type:
+    return getattr(importlib.import_module("semiconductor_sim.devices"), name)  # type: ignore[no-any-return]
+
+
+@dataclass(frozen=True, eq=False)
+class SweepSpec:
+    """A device sweep: Cartesian product of `params` over a `voltage` grid.
+
+    Attributes:
+        device: Key into `DEVICES`.
+        params: Swept parameter name -> 1-D array of values (the first name
+            varies slowest, as in `itertools.product`); at least one entry.
+        voltage: Voltage grid (V).
+        fixed: Constant constructor keyword arguments.
+    """
+
+    device: str
+    params: Mapping[str, FloatArray]
+    voltage: FloatArray
+    fixed: Mapping[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.device not in DEVICES:
+            raise ValueError(f"unknown device {self.device!r}; choose from {', '.join(DEVICES)}")
+        if not self.params:
+            # A zero-dimensional product has no row axis to chunk along
+            raise ValueError(
+                "at least one swept parameter is required (it may hold a single value)"
+            )
+        overlap = set(self.params) & set(self.fixed)
+        if overlap:
+            raise ValueError(f"parameters both swept and fixed: {sorted(overlap)}")
+        accepted = inspect.signature(self.device_class).parameters
+        unknown = [n for n in (*self.params, *self.fixed) if n not in accepted]
+        if unknown:
+            raise ValueError(f"{self.device_class.__name__} has no parameter(s) {unknown}")
+        if any(np.size(v) == 0 for v in self.params.values()) or np.size(self.voltage) == 0:
+            raise ValueError("swept parameters and voltage need at least one value")
+
+    @classmethod
+    def from_strings(
+        cls,
+        device: str,
+        params: Mapping[str, str],
+        voltage: str,
+        fixed: Mapping[str, str] | None = None,
+    ) -> SweepSpec:
+        """Build a spec from `parse_values` strings (fixed values are floats)."""
+        return cls(
+            device=device,
+            params={k: parse_values(v) for k, v in params.items()},
+            voltage=parse_values(voltage),
+            fixed={k: float(v) for k, v in (fixed or {}).items()},
+        )
+
+    @property
+    def device_class(self) -> type:
+        return _device_class(DEVICES[self.device][0])
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(int(np.size(v)) for v in self.params.values())
+
+    @property
+    def n_sets(self) -> int:
+        """Number of parameter sets (rows of the sweep)."""
+        return math.prod(self.shape)
+
+    def rows(self, start: int, stop: int) -> dict[str, FloatArray]:
+        """Parameter values of product rows ``start:stop`` without building the product."""
+        idx = np.unravel_index(np.arange(start, stop), self.shape)
+        return {
+            name: np.asarray(values, dtype=float).ravel()[i]
+            for (name, values), i in zip(self.params.items(), idx, strict=True)
+        }
+
+    def constructor_kwargs(self) -> dict[str, Any]:
+        accepted = inspect.signature(self.device_class).parameters
+        defaults = {
+            k: v
+            for k, v in REQUIRED_DEFAULTS.items()
+            if k in accepted and k not in self.params and k not in self.fixed
+        }
+        return {**defaults, **self.fixed}
+
+
+def evaluate_rows(
+    device: str,
+    params: Mapping[str, FloatArray],
+    voltage: FloatArray,
+    kwargs: Mapping[str, Any],
+) -> FloatArray:
+    """
+    Currents, shape ``(n_rows, n_voltages)``, for parameter columns `params`.
+
+    `kwargs` are constant constructor arguments. The device's population
+    class evaluates all rows in one call when it accepts every argument;
+    otherwise the rows are evaluated one device at a time.
+    """
+    voltage = np.asarray(voltage, dtype=float)
+    n_rows = len(next(iter(params.values()))) if params else 1
+    population = DEVICES[device][1]
+    if population is not None:
+        pop_cls = _device_class(population)
+        accepted = inspect.signature(pop_cls).parameters
+        if all(k in accepted for k in (*params, *kwargs)):
+            current = pop_cls(**kwargs, **params).iv_characteristic(voltage)[0]
+            return np.asarray(current, dtype=float)
+    out = np.empty((n_rows, voltage.size))
+    cls = _device_class(DEVICES[device][0])
+    for i in range(n_rows):
+        row = {k: float(v[i]) for k, v in params.items()}
+        out[i] = cls(**kwargs, **row).iv_characteristic(voltage)[0]
+    return out
+
+
+def evaluate_chunk(
+    spec: SweepSpec, start: int, stop: int
+) -> tuple[dict[str, FloatArray], FloatArray]:
+    """Currents, shape ``(stop - start, n_voltages)``, for product rows ``start:stop``."""
+    params = spec.rows(start, stop)
+    return params, evaluate_rows(spec.device, params, spec.voltage, spec.constructor_kwargs())
+
+
+def run_sweep(
+    spec: SweepSpec, *, chunk_size: int = DEFAULT_CHUNK_SIZE, jobs: int = 1
+) -> Iterator[tuple[dict[str, FloatArray], FloatArray]]:
+    """
+    Evaluate `spec` chunk by chunk, yielding `(params, current)` in row order.
+
+    With `jobs > 1` chunks run on a process pool with at most
+    ``2 * jobs`` chunks in flight, so memory stays bounded by the chunk size
+    rather than the sweep size.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    bounds = [(s, min(s + chunk_size, spec.n_sets)) for s in range(0, spec.n_sets, chunk_size)]
+    if jobs <= 1 or len(bounds) <= 1:
+        for start, stop in bounds:
+            yield evaluate_chunk(spec, start, stop)
+        return
+    pool = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        pending: deque[Future[tuple[dict[str, FloatArray], FloatArray]]] = deque()
+        for start, stop in bounds:
+            pending.append(pool.submit(evaluate_chunk, spec, start, stop))
+            if len(pending) >= _PREFETCH_PER_JOB * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Also reached when the consumer stops early: drop queued chunks
+        pool.shutdown(cancel_futures=True)
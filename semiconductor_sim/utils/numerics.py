@@ -5,23 +5,75 @@ from typing import cast
 import numpy as np
 import numpy.typing as npt
 
+from .precision import expm1_max_arg, get_precision
+
 
 def safe_expm1(
     x: npt.NDArray[np.floating] | float,
-    max_arg: float = 700.0,
-) -> npt.NDArray[np.float64]:
+    max_arg: float | None = None,
+    out: npt.NDArray[np.floating] | None = None,
+    dtype: npt.DTypeLike | None = None,
+) -> npt.NDArray[np.floating]:
     """
     Compute exp(x) - 1 safely for arrays or scalars by clipping the argument to
     avoid overflow and using numpy.expm1 for better precision near zero.
 
     Parameters:
     - x: input value(s)
-    - max_arg: maximum absolute argument allowed before clipping (float64 ~709)
+    - max_arg: maximum absolute argument allowed before clipping; defaults to
+      the overflow bound of the compute dtype (700 for float64, 80 for float32)
+    - out: optional array to write the result into (may be `x` itself); with
+      `out` the computation allocates no array temporaries and uses `out.dtype`
+    - dtype: compute dtype; defaults to the package precision
+      (see `semiconductor_sim.utils.precision`)
 
     Returns:
     - np.ndarray: exp(x) - 1 computed safely
     """
-    arr = np.asarray(x, dtype=float)
-    clipped = np.clip(arr, -max_arg, max_arg)
-    out = np.expm1(clipped)
+    if out is not None:
+        bound = expm1_max_arg(out.dtype) if max_arg is None else max_arg
+        # expm1 of any argument below -bound is already exactly -1, so only the
+        # upper clip matters; one ufunc pass also skips np.clip's Python wrapper
+        np.minimum(x, bound, out=out)
+        return cast(npt.NDArray[np.floating], np.expm1(out, out=out))
+    dt = get_precision() if dtype is None else np.dtype(dtype)
+    arr = np.asarray(x, dtype=dt)
+    bound = expm1_max_arg(dt) if max_arg is None else max_arg
+    clipped = np.clip(arr, -bound, bound)
+    result = np.expm1(clipped)
+    return cast(npt.NDArray[np.floating], result)
+
+
+def lambertw_exp(
+    log_x: npt.NDArray[np.floating] | float,
+    log_threshold: float = 600.0,
+) -> npt.NDArray[np.float64]:
+    """
+    Compute the principal-branch Lambert W of exp(log_x) without overflow.
+
+    Below `log_threshold` this evaluates ``scipy.special.lambertw(exp(log_x))``.
+    Above it, exp(log_x) would overflow, so W is found in the log domain by
+    solving w + ln(w) = log_x with a few Newton steps from the asymptotic
+    guess w ≈ log_x - ln(log_x).
+
+    Parameters:
+    - log_x: natural log of the Lambert W argument
+    - log_threshold: switch-over point to the log-domain evaluation
+
+    Returns:
+    - np.ndarray: W(exp(log_x))
+    """
+    from scipy.special import lambertw
+
+    y = np.asarray(log_x, dtype=float)
+    out = np.empty_like(y)
+    small = y < log_threshold
+    out[small] = lambertw(np.exp(y[small])).real
+    big = ~small
+    if np.any(big):
+        yb = y[big]
+        w = yb - np.log(yb)
+        for _ in range(4):
+            w = w - (w + np.log(w) - yb) / (1.0 + 1.0 / w)
+        out[big] = w
     return cast(npt.NDArray[np.float64], out)
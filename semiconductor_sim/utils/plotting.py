@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from contextlib import suppress
 
-import matplotlib
-
 
 def use_headless_backend(preferred: str = "Agg") -> None:
     """
@@ -14,6 +12,8 @@ def use_headless_backend(preferred: str = "Agg") -> None:
     Parameters:
     - preferred: Backend name to use when switching (default: 'Agg').
     """
+    import matplotlib
+
     with suppress(Exception):
         matplotlib.use(preferred, force=True)
 
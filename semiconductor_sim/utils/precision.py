@@ -0,0 +1,142 @@
+"""Package-wide floating-point precision for device and model kernels.
+
+Kernels compute in float64 by default. Monte Carlo runs and surrogate
+training sets can opt into float32 to halve memory traffic::
+
+    from semiconductor_sim.utils.precision import precision
+
+    with precision("float32"):
+        I, R = diode.iv_characteristic(v)  # float32 arrays
+
+Iterative solvers (series-resistance Newton, Lambert W) and the recombination
+models stay in float64: their tolerances and carrier-density products
+(n * p reaches 1e40 cm^-6) do not fit float32. Use `compare_precision` to
+measure the float32 error of a workload against the float64 reference.
+
+The setting lives in a `contextvars.ContextVar`, so each thread and asyncio
+task has its own: `precision("float32")` in one thread does not change the
+dtype another thread computes in, and new threads start in float64. The
+package's own worker pools (`aio`, `ThreadChunkExecutor`) run their chunks
+through `call_in_precision` so they follow the caller's setting.
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+_SUPPORTED = (np.dtype(np.float32), np.dtype(np.float64))
+
+# Largest expm1 argument per dtype, leaving headroom below log(finfo.max)
+# (709.8 for float64, 88.7 for float32) for the prefactor multiplication.
+_EXPM1_MAX_ARG = {np.dtype(np.float32): 80.0, np.dtype(np.float64): 700.0}
+
+# Default acceptable relative error of a float32 run versus float64
+DEFAULT_FLOAT32_RTOL = 1e-4
+
+_DEFAULT_PRECISION = np.dtype(np.float64)
+_precision: ContextVar[np.dtype[Any]] = ContextVar("semiconductor_sim_precision")
+
+
+class PrecisionWarning(UserWarning):
+    """Reduced-precision results deviate from the float64 reference."""
+
+
+def _as_supported(dtype: npt.DTypeLike) -> np.dtype[Any]:
+    dt = np.dtype(dtype)
+    if dt not in _SUPPORTED:
+        raise ValueError(f"Unsupported precision {dt}; use float32 or float64")
+    return dt
+
+
+def get_precision() -> np.dtype[Any]:
+    """Return the dtype kernels currently compute in (in this thread/context)."""
+    return _precision.get(_DEFAULT_PRECISION)
+
+
+def set_precision(dtype: npt.DTypeLike) -> None:
+    """Set the compute dtype (`float32` or `float64`) for the current thread/context."""
+    _precision.set(_as_supported(dtype))
+
+
+@contextmanager
+def precision(dtype: npt.DTypeLike) -> Iterator[np.dtype[Any]]:
+    """Temporarily compute in `dtype`, restoring the previous setting on exit."""
+    token = _precision.set(_as_supported(dtype))
+    try:
+        yield get_precision()
+    finally:
+        _precision.reset(token)
+
+
+def call_in_precision(dtype: npt.DTypeLike, fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Call `fn(*args)` computing in `dtype`.
+
+    Worker threads and processes do not inherit the caller's setting; submit
+    ``functools.partial(call_in_precision, get_precision(), fn, ...)`` to
+    carry it over. Picklable whenever `fn` and `args` are.
+    """
+    with precision(dtype):
+        return fn(*args)
+
+
+def as_precision(x: npt.ArrayLike) -> npt.NDArray[np.floating]:
+    """Convert `x` to an array of the current compute dtype (no copy if it already is)."""
+    return np.asarray(x, dtype=_precision.get(_DEFAULT_PRECISION))
+
+
+def expm1_max_arg(dtype: npt.DTypeLike | None = None) -> float:
+    """Overflow-safe clipping bound for `safe_expm1` in `dtype` (default: current)."""
+    dt = get_precision() if dtype is None else np.dtype(dtype)
+    return _EXPM1_MAX_ARG.get(dt, _EXPM1_MAX_ARG[np.dtype(np.float64)])
+
+
+def compare_precision(
+    fn: Callable[..., Any],
+    *args: Any,
+    dtype: npt.DTypeLike = np.float32,
+    rtol: float = DEFAULT_FLOAT32_RTOL,
+    **kwargs: Any,
+) -> list[float]:
+    """
+    Run `fn(*args, **kwargs)` in `dtype` and in float64 and compare the outputs.
+
+    The error of each output array is max |a - b| / max|b|, i.e. relative to
+    the array's scale so that values crossing zero do not blow it up.
+    Non-finite entries in the reduced-precision result (overflow) count as
+    infinite error. A `PrecisionWarning` is issued when any error exceeds `rtol`.
+
+    Returns:
+    - list of per-output errors, in the order `fn` returns them
+    """
+    with precision(dtype):
+        approx = fn(*args, **kwargs)
+    with precision(np.float64):
+        reference = fn(*args, **kwargs)
+    if not isinstance(reference, tuple):
+        approx, reference = (approx,), (reference,)
+
+    errors = []
+    for a, b in zip(approx, reference, strict=True):
+        a_arr = np.asarray(a, dtype=np.float64)
+        b_arr = np.asarray(b, dtype=np.float64)
+        if not np.all(np.isfinite(a_arr) | ~np.isfinite(b_arr)):
+            errors.append(float("inf"))
+            continue
+        scale = float(np.max(np.abs(b_arr), initial=0.0))
+        diff = float(np.max(np.abs(a_arr - b_arr), initial=0.0))
+        errors.append(diff / scale if scale > 0 else diff)
+    if max(errors, default=0.0) > rtol:
+        warnings.warn(
+            f"{np.dtype(dtype)} result deviates from float64 by {max(errors):.3g} (rtol={rtol:g})",
+            PrecisionWarning,
+            stacklevel=2,
+        )
+    return errors
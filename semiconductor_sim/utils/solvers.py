@@ -0,0 +1,285 @@
+"""Vectorized element-wise nonlinear solvers used by the device models."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from .numerics import safe_expm1
+
+FloatArray: TypeAlias = npt.NDArray[np.float64]
+IntArray: TypeAlias = npt.NDArray[np.int64]
+BoolArray: TypeAlias = npt.NDArray[np.bool_]
+
+# residual(x_active, active_indices) -> (f, df/dx) for the still-active elements
+ResidualFn: TypeAlias = Callable[[FloatArray, IntArray], tuple[FloatArray, FloatArray]]
+
+
+@dataclass(frozen=True)
+class NewtonResult:
+    """Outcome of an element-wise Newton solve.
+
+    Attributes:
+        x: Solution array.
+        iterations: Newton iterations spent on each element.
+        converged: Whether each element met the step tolerance.
+    """
+
+    x: FloatArray
+    iterations: IntArray
+    converged: BoolArray
+
+    @property
+    def total_iterations(self) -> int:
+        """Sum of iterations over all elements (the cost of the solve)."""
+        return int(self.iterations.sum())
+
+
+def damped_newton(
+    residual: ResidualFn,
+    x0: npt.ArrayLike,
+    *,
+    max_iter: int = 50,
+    rtol: float = 1e-6,
+    atol: float = 1e-18,
+    max_step: float | npt.ArrayLike | None = None,
+) -> NewtonResult:
+    """
+    Solve many independent scalar equations f_i(x_i) = 0 with array-wide Newton steps.
+
+    Each iteration evaluates `residual` only on elements that have not yet
+    converged, so easy points stop costing work as soon as they settle.
+    An element converges once ``|step| <= max(atol, rtol * |x|)``.
+
+    Parameters:
+    - residual: callable returning `(f, df)` for the active elements; it receives
+      the current active values and their flat indices into `x0`
+    - x0: initial guess (any shape; the result keeps it)
+    - max_iter: maximum Newton iterations per element
+    - rtol, atol: step tolerances
+    - max_step: optional per-element cap on |step| (damping / trust region)
+
+    Returns:
+    - NewtonResult with the solution, per-element iteration counts and a
+      convergence mask
+    """
+    x_in = np.asarray(x0, dtype=float)
+    shape = x_in.shape
+    x = x_in.ravel().copy()
+    iterations = np.zeros(x.size, dtype=np.int64)
+    converged = np.zeros(x.size, dtype=bool)
+    cap = None
+    if max_step is not None:
+        cap = np.broadcast_to(np.asarray(max_step, dtype=float), shape).ravel()
+
+    active = np.arange(x.size, dtype=np.int64)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        xa = x[active]
+        f, df = residual(xa, active)
+        step = f / df
+        if cap is not None:
+            step = np.clip(step, -cap[active], cap[active])
+        xa = xa - step
+        x[active] = xa
+        iterations[active] += 1
+        done = np.abs(step) <= np.maximum(atol, rtol * np.abs(xa))
+        converged[active[done]] = True
+        active = active[~done]
+
+    return NewtonResult(
+        x=x.reshape(shape),
+        iterations=iterations.reshape(shape),
+        converged=converged.reshape(shape),
+    )
+
+
+def is_monotonic(values: npt.ArrayLike) -> bool:
+    """True if `values` is non-decreasing or non-increasing along its last axis."""
+    arr = np.asarray(values, dtype=float)
+    if arr.ndim == 0:
+        return True
+    d = np.diff(arr, axis=-1)
+    return bool(np.all(d >= 0) or np.all(d <= 0))
+
+
+def _diode_cold_guess(V: FloatArray, Is: FloatArray, Vt: FloatArray, Rs: FloatArray) -> FloatArray:
+    # Ideal-diode current, capped by the bound I < V / R_s of any forward solution
+    guess = Is * safe_expm1(V / Vt, dtype=float)
+    return np.where(V > 0, np.minimum(guess, V / Rs), guess)
+
+
+def _diode_newton(
+    V: FloatArray,
+    Is: FloatArray,
+    Vt: FloatArray,
+    Rs: FloatArray,
+    guess: FloatArray,
+    *,
+    max_iter: int,
+    rtol: float,
+    atol: float,
+    max_step_vth: float,
+) -> NewtonResult:
+    def residual(I: FloatArray, idx: IntArray) -> tuple[FloatArray, FloatArray]:
+        Is_a, Rs_a, Vt_a = Is[idx], Rs[idx], Vt[idx]
+        em1 = safe_expm1((V[idx] - I * Rs_a) / Vt_a, dtype=float)
+        f = I - Is_a * em1
+        # derivative of expm1(x) is exp(x) = expm1(x) + 1
+        df = 1.0 + Is_a * (Rs_a / Vt_a) * (em1 + 1.0)
+        return f, df
+
+    return damped_newton(
+        residual,
+        guess,
+        max_iter=max_iter,
+        rtol=rtol,
+        atol=atol,
+        max_step=max_step_vth * Vt / Rs,
+    )
+
+
+def _diode_continuation(
+    V: FloatArray,
+    Is: FloatArray,
+    Vt: FloatArray,
+    Rs: FloatArray,
+    *,
+    n_sweep: int,
+    stride: int,
+    **newton_kw: Any,
+) -> NewtonResult:
+    """Multi-level warm-started solve along the last (sweep) axis.
+
+    Anchors every `stride` points (plus the last point) are solved from the
+    cold guess. The stride is then halved level by level; each new point is
+    seeded from its already-solved left neighbour plus a tangent prediction
+    I + dI/dV * dV. Points whose warm start fails fall back to the cold guess.
+    """
+    rows = V.size // n_sweep
+    V2, Is2, Vt2, Rs2 = (a.reshape(rows, n_sweep) for a in (V, Is, Vt, Rs))
+    x = np.zeros((rows, n_sweep))
+    iterations = np.zeros((rows, n_sweep), dtype=np.int64)
+    converged = np.zeros((rows, n_sweep), dtype=bool)
+
+    def solve(cols: IntArray, guess: FloatArray | None) -> None:
+        sub = [a[:, cols].ravel() for a in (V2, Is2, Vt2, Rs2)]
+        V_c, Is_c, Vt_c, Rs_c = sub
+        cold = _diode_cold_guess(V_c, Is_c, Vt_c, Rs_c)
+        start = cold if guess is None else guess.ravel()
+        res = _diode_newton(V_c, Is_c, Vt_c, Rs_c, start, **newton_kw)
+        sol, its, ok = res.x, res.iterations, res.converged & np.isfinite(res.x)
+        if guess is not None and not np.all(ok):
+            # Fall back to the cold-start guess wherever the warm start failed
+            bad = np.flatnonzero(~ok)
+            V_b, Is_b, Vt_b, Rs_b = (a[bad] for a in sub)
+            retry = _diode_newton(V_b, Is_b, Vt_b, Rs_b, cold[bad], **newton_kw)
+            sol[bad] = retry.x
+            its[bad] += retry.iterations
+            ok[bad] = retry.converged
+        x[:, cols] = sol.reshape(rows, cols.size)
+        iterations[:, cols] = its.reshape(rows, cols.size)
+        converged[:, cols] = ok.reshape(rows, cols.size)
+
+    anchors = np.unique(np.append(np.arange(0, n_sweep, stride), n_sweep - 1))
+    solve(anchors, None)
+    done = np.zeros(n_sweep, dtype=bool)
+    done[anchors] = True
+
+    h = stride // 2
+    while h >= 1:
+        cols = np.arange(h, n_sweep, 2 * h)
+        cols = cols[~done[cols]]
+        if cols.size:
+            left = cols - h
+            I_l = x[:, left]
+            g = Is2[:, left] * (
+                safe_expm1((V2[:, left] - I_l * Rs2[:, left]) / Vt2[:, left], dtype=float) + 1.0
+            )
+            g /= Vt2[:, left]
+            slope = g / (1.0 + g * Rs2[:, left])
+            solve(cols, I_l + slope * (V2[:, cols] - V2[:, left]))
+            done[cols] = True
+        h //= 2
+
+    return NewtonResult(x=x, iterations=iterations, converged=converged)
+
+
+def solve_diode_series_resistance(
+    voltage: npt.ArrayLike,
+    I_s: npt.ArrayLike,
+    V_th: npt.ArrayLike,
+    R_s: npt.ArrayLike,
+    *,
+    x0: npt.ArrayLike | None = None,
+    max_iter: int = 50,
+    rtol: float = 1e-6,
+    atol: float = 1e-18,
+    max_step_vth: float = 10.0,
+    continuation: bool = False,
+    stride: int = 16,
+) -> NewtonResult:
+    """
+    Solve the diode-with-series-resistance equation I = I_s * expm1((V - I R_s) / V_th).
+
+    All array arguments broadcast together, so per-element I_s, V_th (= n k_B T / q)
+    and R_s are supported. The residual is concave and increasing in I, so
+    Newton iterates approach the root monotonically from below after at most
+    one step; the cold-start guess is the ideal-diode current capped by the
+    bound I < V / R_s that any forward solution satisfies.
+
+    With `continuation=True` the voltage must be sorted along the last axis
+    (a sweep). Only every `stride`-th point is solved from the cold guess; the
+    rest are warm-started from a neighbour's converged current plus a tangent
+    prediction, which cuts total Newton iterations on fine sweeps.
+
+    Parameters:
+    - voltage: applied voltage (V)
+    - I_s: saturation current (A)
+    - V_th: effective thermal voltage n k_B T / q (V)
+    - R_s: series resistance (ohm), must be > 0
+    - x0: optional initial current guess; defaults to the capped ideal current
+    - max_iter, rtol, atol: passed to `damped_newton`
+    - max_step_vth: damping; largest junction-voltage change per iteration in
+      units of V_th
+    - continuation: warm-start along the sorted last axis (ignores `x0`)
+    - stride: anchor spacing for continuation (rounded up to a power of two)
+
+    Returns:
+    - NewtonResult whose `x` is the current (A) with the broadcast shape
+    """
+    V, Is, Vt, Rs = (
+        np.ascontiguousarray(a).ravel()
+        for a in np.broadcast_arrays(
+            *(np.asarray(a, dtype=float) for a in (voltage, I_s, V_th, R_s))
+        )
+    )
+    shape = np.broadcast_shapes(np.shape(voltage), np.shape(I_s), np.shape(V_th), np.shape(R_s))
+    newton_kw: dict[str, Any] = dict(
+        max_iter=max_iter, rtol=rtol, atol=atol, max_step_vth=max_step_vth
+    )
+
+    if continuation and len(shape) > 0 and V.size > 0:
+        if not is_monotonic(V.reshape(shape)):
+            raise ValueError("continuation requires voltages sorted along the last axis")
+        stride_pow2 = 1 << max(int(stride) - 1, 0).bit_length()
+        result = _diode_continuation(
+            V, Is, Vt, Rs, n_sweep=shape[-1], stride=stride_pow2, **newton_kw
+        )
+    else:
+        if x0 is None:
+            guess = _diode_cold_guess(V, Is, Vt, Rs)
+        else:
+            guess = np.broadcast_to(np.asarray(x0, dtype=float), shape).ravel()
+        result = _diode_newton(V, Is, Vt, Rs, guess, **newton_kw)
+
+    return NewtonResult(
+        x=result.x.reshape(shape),
+        iterations=result.iterations.reshape(shape),
+        converged=result.converged.reshape(shape),
+    )
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from semiconductor_sim import LED, PNJunctionDiode, aio
+from semiconductor_sim.sweep import SweepSpec, run_sweep
+
+V = np.linspace(-0.2, 0.7, 1000)
+CHUNK = 100
+N_DOPING = 7
+SWEEP_CHUNK = 3
+
+
+class SlowDevice:
+    """Wraps a device so each chunk takes a known time (or blocks on an event)."""
+
+    def __init__(self, delay=0.0, gate=None):
+        self.device = PNJunctionDiode(1e17, 1e17)
+        self.delay = delay
+        self.gate = gate
+        self.calls = 0
+
+    def iv_characteristic(self, voltage):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait()
+        threading.Event().wait(self.delay)
+        return self.device.iv_characteristic(voltage)
+
+
+def _spec():
+    return SweepSpec(
+        "pn", {"doping_p": np.geomspace(1e15, 1e18, N_DOPING)}, V[:5], {"doping_n": 1e17}
+    )
+
+
+def test_iv_characteristic_matches_sync():
+    device = PNJunctionDiode(1e17, 1e17)
+    result = asyncio.run(aio.iv_characteristic(device, V, chunk_size=CHUNK, n_conc=1e16))
+    expected = device.iv_characteristic(V, n_conc=1e16)
+    assert result.complete
+    assert result.n_done == V.size
+    for got, want in zip(result.outputs, expected, strict=True):
+        np.testing.assert_allclose(got, want, rtol=1e-12)
+
+
+def test_iv_keeps_zero_dimensional_outputs():
+    device = LED(1e17, 1e17)
+    result = asyncio.run(
+        aio.iv_characteristic(device, V, chunk_size=CHUNK, n_conc=1e16, p_conc=1e16)
+    )
+    expected = device.iv_characteristic(V, n_conc=1e16, p_conc=1e16)
+    for got, want in zip(result.outputs, expected, strict=True):
+        assert got.shape == np.shape(want)
+        np.testing.assert_allclose(got, want, rtol=1e-12)
+
+
+def test_iv_budget_returns_prefix():
+    device = SlowDevice(delay=0.02)
+    result = asyncio.run(aio.iv_characteristic(device, V, chunk_size=CHUNK, budget=0.05))
+    assert not result.complete
+    assert 0 < result.n_done < V.size
+    assert result.n_done % CHUNK == 0
+    np.testing.assert_array_equal(result.voltage, V[: result.n_done])
+    assert result.outputs[0].shape[-1] == result.n_done
+
+
+def test_iv_zero_budget_returns_empty_outputs():
+    result = asyncio.run(aio.iv_characteristic(PNJunctionDiode(1e17, 1e17), V, budget=0.0))
+    assert not result.complete
+    assert result.n_done == 0
+    current, recombination = result.outputs
+    assert current.shape == recombination.shape == (0,)
+    led = LED(1e17, 1e17)
+    result = asyncio.run(aio.iv_characteristic(led, V, budget=0.0, n_conc=1e16, p_conc=1e16))
+    _, emission, _ = result.outputs
+    assert emission.shape == ()
+
+
+def test_loop_stays_responsive():
+    device = SlowDevice(delay=0.01)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await aio.iv_characteristic(device, V, chunk_size=CHUNK)
+        task.cancel()
+
+    asyncio.run(main())
+    assert ticks > V.size // CHUNK
+
+
+def test_cancellation_stops_between_chunks():
+    gate = threading.Event()
+    device = SlowDevice(gate=gate)
+
+    async def main():
+        task = asyncio.create_task(aio.iv_characteristic(device, V, chunk_size=CHUNK))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        gate.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert device.calls == 1
+
+
+def test_sweeps_match_sync():
+    spec = _spec()
+    expected = np.concatenate([c for _, c in run_sweep(spec, chunk_size=SWEEP_CHUNK)])
+
+    async def collect():
+        return [c async for _, c in aio.iter_sweep(spec, chunk_size=SWEEP_CHUNK)]
+
+    np.testing.assert_allclose(np.concatenate(asyncio.run(collect())), expected)
+    result = asyncio.run(aio.run_sweep(spec, chunk_size=SWEEP_CHUNK))
+    assert result.complete
+    assert result.n_done == spec.n_sets
+    np.testing.assert_allclose(result.current, expected)
+    np.testing.assert_allclose(result.params["doping_p"], spec.params["doping_p"])
+
+
+def test_sweep_zero_budget():
+    result = asyncio.run(aio.run_sweep(_spec(), budget=0.0))
+    assert not result.complete
+    assert result.current.shape == (0, len(V[:5]))
+    assert result.params["doping_p"].size == 0
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        asyncio.run(aio.iv_characteristic(PNJunctionDiode(1e17, 1e17), V, chunk_size=0))
+    with pytest.raises(ValueError):
+        asyncio.run(aio.run_sweep(_spec(), budget=-1.0))
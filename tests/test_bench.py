@@ -0,0 +1,95 @@
+import importlib.metadata
+import inspect
+import json
+
+import numpy as np
+import pytest
+
+import semiconductor_sim
+from semiconductor_sim import devices, models
+from semiconductor_sim.bench import (
+    device_cases,
+    environment,
+    measure,
+    model_cases,
+    peak_memory,
+    run_case,
+)
+from semiconductor_sim.cli import main
+
+SIZES = (1, 250)
+MIN_TIME = 1e-4
+POPULATION_POINTS = 200
+
+
+def test_cases_cover_devices_and_models():
+    names = {c.name for c in (*device_cases(), *model_cases())}
+    for name in devices.__all__:
+        cls = getattr(devices, name)
+        if not inspect.isabstract(cls):
+            assert f"devices.{name}" in names
+    for name in models.__all__:
+        if inspect.isfunction(getattr(models, name)):
+            assert f"models.{name}" in names
+
+
+@pytest.mark.parametrize("case", [*device_cases(), *model_cases()], ids=lambda c: c.name)
+def test_every_case_runs(case):
+    report = run_case(case, SIZES, min_time=MIN_TIME)
+    assert report.overhead_s > 0
+    assert [r.size for r in report.results] == list(SIZES)
+    for r in report.results:
+        assert r.points >= 1
+        assert r.calls >= 1
+        assert r.points_per_second > 0
+        assert r.peak_bytes >= 0
+
+
+def test_population_points_match_size():
+    case = next(c for c in device_cases() if c.name == "devices.PNJunctionPopulation")
+    assert measure(case, POPULATION_POINTS, min_time=MIN_TIME).points == POPULATION_POINTS
+
+
+@pytest.mark.parametrize("name", ["BJT", "PNP"])
+def test_grid_device_points_count_every_curve(name):
+    case = next(c for c in device_cases() if c.name == f"devices.{name}")
+    fn, _ = case.setup(POPULATION_POINTS)
+    expected = np.size(fn()[0])
+    assert expected > POPULATION_POINTS
+    assert measure(case, POPULATION_POINTS, min_time=MIN_TIME).points == expected
+
+
+def test_peak_memory_sees_numpy_buffers():
+    n = 100_000
+    assert peak_memory(lambda: np.ones(n)) >= np.dtype(float).itemsize * n
+
+
+def test_environment_fingerprint():
+    info = environment()
+    for key in ("numpy", "blas", "cpu_count", "python"):
+        assert info[key]
+
+
+def test_environment_falls_back_to_source_version(monkeypatch):
+    def not_installed(name):
+        raise importlib.metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(importlib.metadata, "version", not_installed)
+    assert environment()["semiconductor_sim"] == semiconductor_sim.__version__
+
+
+def test_cli_bench(tmp_path, capsys):
+    out = tmp_path / "bench.json"
+    args = ["bench", "--sizes", "10,100", "--only", "PNJunctionDiode", "--min-time", "1e-4"]
+    assert main([*args, "--json", str(out)]) == 0
+    text = capsys.readouterr().out
+    assert "# numpy:" in text
+    assert "devices.PNJunctionDiode" in text
+    data = json.loads(out.read_text())
+    assert [c["case"] for c in data["cases"]] == ["devices.PNJunctionDiode"]
+    assert len(data["cases"][0]["results"]) == len(args[2].split(","))
+
+
+def test_cli_bench_rejects_unknown_case():
+    with pytest.raises(SystemExit):
+        main(["bench", "--only", "no-such-device"])
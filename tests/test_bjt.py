@@ -1,6 +1,7 @@
 import numpy as np
 
 from semiconductor_sim.devices import BJT
+from semiconductor_sim.utils import k_B, q
 
 NANOAMP_THRESHOLD = 5e-9
 
@@ -41,3 +42,18 @@ def test_bjt_no_early_effect_for_nonpositive_va():
         (ic_grid,) = bjt.iv_characteristic(vce)
         ic = ic_grid[0]
         assert np.allclose(ic, ic[0], rtol=0.0, atol=1e-18)
+
+
+def test_bjt_iv_grid_matches_configured_sweep_and_gummel():
+    bjt = BJT(doping_p=1e16, doping_n=1e18, early_voltage=50.0, vbe_values=[0.6, 0.7])
+    vce = np.linspace(0.0, 5.0, 11)
+    (ref,) = bjt.iv_characteristic(vce)
+    (grid,) = bjt.iv_grid([0.6, 0.7], vce)
+    np.testing.assert_array_equal(grid, ref)
+
+    vbe = np.linspace(0.3, 0.8, 51)
+    (ic,) = bjt.gummel_characteristic(vbe, vce=2.0)
+    assert ic.shape == vbe.shape
+    # Exponential in V_BE: log-slope equals 1/V_T
+    slope = np.diff(np.log(ic)) / np.diff(vbe)
+    np.testing.assert_allclose(slope, q / (k_B * bjt.temperature), rtol=1e-6)
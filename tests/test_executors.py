@@ -0,0 +1,135 @@
+import os
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from semiconductor_sim import LED, PNJunctionDiode, PNJunctionPopulation
+from semiconductor_sim.executors import SharedMemorySweepExecutor, ThreadChunkExecutor
+from semiconductor_sim.materials import get_material
+from semiconductor_sim.models import srh_recombination
+from semiconductor_sim.sweep import SweepSpec, evaluate_chunk
+
+V = np.linspace(-0.2, 0.7, 10)
+JOBS = 2
+CHUNK = 4
+N_DOPING = 9
+TEMPERATURES = (300.0, 350.0)
+THREAD_CHUNK = 100
+N_POINTS = 1001
+
+
+def _spec(device):
+    return SweepSpec(
+        device,
+        {"doping_p": np.geomspace(1e15, 1e18, N_DOPING), "temperature": np.array(TEMPERATURES)},
+        V,
+        {"doping_n": 1e17},
+    )
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with SharedMemorySweepExecutor(JOBS, warm=("pn", "tunnel")) as ex:
+        yield ex
+
+
+@pytest.mark.parametrize("device", ["pn", "tunnel"])
+def test_matches_serial_evaluation(executor, device):
+    spec = _spec(device)
+    expected_params, expected = evaluate_chunk(spec, 0, spec.n_sets)
+    with executor.run(spec, chunk_size=CHUNK) as result:
+        np.testing.assert_allclose(result.current, expected, rtol=1e-12)
+        for name, values in expected_params.items():
+            np.testing.assert_array_equal(result.params[name], values)
+
+
+def test_result_is_a_view_of_unlinked_shared_memory(executor):
+    result = executor.run(_spec("pn"), chunk_size=CHUNK)
+    assert not result.current.flags.owndata
+    # The block's name is released as soon as the run returns
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=result._shm.name)
+    result.close()
+    assert not hasattr(result, "current")
+
+
+def test_workers_persist_across_runs(executor):
+    before = {executor._pool.submit(os.getpid).result() for _ in range(JOBS * 4)}
+    with executor.run(_spec("pn"), chunk_size=CHUNK):
+        pass
+    after = {executor._pool.submit(os.getpid).result() for _ in range(JOBS * 4)}
+    assert len(before | after) <= JOBS
+
+
+def test_worker_errors_propagate(executor):
+    spec = SweepSpec("pn", {"temperature": np.array([300.0, -1.0])}, V)
+    with pytest.raises(ValueError, match="temperature"):
+        executor.run(spec)
+
+
+def test_rejects_unknown_warm_device():
+    with pytest.raises(ValueError, match="unknown device"):
+        SharedMemorySweepExecutor(1, warm=("bogus",))
+
+
+@pytest.fixture(scope="module")
+def threads():
+    with ThreadChunkExecutor(JOBS, chunk_size=THREAD_CHUNK) as ex:
+        yield ex
+
+
+def test_thread_map_matches_direct(threads):
+    n = np.geomspace(1e10, 1e18, N_POINTS)
+    np.testing.assert_allclose(
+        threads.map(srh_recombination, n, n[::-1]), srh_recombination(n, n[::-1])
+    )
+    T = np.linspace(200.0, 500.0, N_POINTS).reshape(7, -1)
+    si = get_material("Si")
+    result = threads.map(si.ni, T)
+    assert result.shape == T.shape
+    np.testing.assert_allclose(result, si.ni(T))
+    # Scalars broadcast against arrays and keyword arguments pass through
+    np.testing.assert_allclose(
+        threads.map(srh_recombination, 1e16, n, temperature=350.0),
+        srh_recombination(1e16, n, temperature=350.0),
+    )
+
+
+def test_thread_iv_matches_direct(threads):
+    V_fine = np.linspace(-0.2, 0.7, N_POINTS)
+    diode = PNJunctionDiode(1e17, 1e17)
+    for got, want in zip(
+        threads.iv_characteristic(diode, V_fine, n_conc=1e16, p_conc=1e16),
+        diode.iv_characteristic(V_fine, n_conc=1e16, p_conc=1e16),
+        strict=True,
+    ):
+        np.testing.assert_allclose(got, want, rtol=1e-12)
+    population = PNJunctionPopulation(doping_p=np.geomspace(1e15, 1e18, N_DOPING), doping_n=1e17)
+    current = threads.iv_characteristic(population, V_fine)[0]
+    assert current.shape == (N_DOPING, N_POINTS)
+    np.testing.assert_allclose(current, population.iv_characteristic(V_fine)[0], rtol=1e-12)
+
+
+def test_thread_iv_keeps_output_shapes(threads):
+    V_fine = np.linspace(0.0, 2.0, N_POINTS)
+    led = LED(1e17, 1e17)
+    expected = led.iv_characteristic(V_fine, n_conc=1e16, p_conc=1e16)
+    got = threads.iv_characteristic(led, V_fine, n_conc=1e16, p_conc=1e16)
+    assert [g.shape for g in got] == [np.shape(e) for e in expected]
+    for g, e in zip(got, expected, strict=True):
+        np.testing.assert_allclose(g, e, rtol=1e-12)
+    # A 0-d output of an elementwise function stays 0-d
+    assert threads.map(lambda x: (x, np.float64(1.0)), V_fine)[1].shape == ()
+
+
+def test_thread_errors_propagate(threads):
+    def fail_late(x):
+        if x[0] > 0:
+            raise RuntimeError("boom")
+        return x
+
+    with pytest.raises(RuntimeError, match="boom"):
+        threads.map(fail_late, np.linspace(-1.0, 1.0, N_POINTS))
+    with pytest.raises(ValueError):
+        ThreadChunkExecutor(chunk_size=0)
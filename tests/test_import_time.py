@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import semiconductor_sim
+
+# Wall-time budget for `import semiconductor_sim` plus one device, excluding
+# NumPy itself; generous enough for slow CI runners
+IMPORT_BUDGET_S = 0.5
+
+HEAVY_MODULES = ("matplotlib", "plotly", "scipy", "joblib", "sklearn")
+
+_PROBE = f"""
+import sys, time
+import numpy
+start = time.perf_counter()
+import semiconductor_sim
+from semiconductor_sim import LED, PNJunctionDiode, ZenerDiode
+elapsed = time.perf_counter() - start
+heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def _probe():
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], check=True, capture_output=True, text=True
+    ).stdout.split()
+    return float(out[0]), out[1:]
+
+
+def test_core_import_skips_heavy_backends():
+    _, heavy = _probe()
+    assert heavy == []
+
+
+def test_core_import_within_budget():
+    # Best of three to ignore one-off filesystem cache misses
+    elapsed = min(_probe()[0] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_S
+
+
+def test_cli_import_defers_subcommand_modules():
+    probe = (
+        "import sys, semiconductor_sim.cli; "
+        "print(' '.join(m for m in sys.modules if m == 'http.server' "
+        "or m.startswith(('semiconductor_sim.devices', 'semiconductor_sim.serve', "
+        "'semiconductor_sim.bench'))))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    assert out.split() == []
+
+
+def test_lazy_exports_resolve():
+    for name in semiconductor_sim.__all__:
+        assert getattr(semiconductor_sim, name).__name__ == name
+    assert semiconductor_sim.devices.Device.__name__ == "Device"
+    assert set(semiconductor_sim.__all__) <= set(dir(semiconductor_sim))
@@ -1,4 +1,15 @@
-from semiconductor_sim.materials import get_material, list_materials
+import numpy as np
+import pytest
+
+from semiconductor_sim import SolarCell, SolarCellPopulation
+from semiconductor_sim.materials import (
+    MaterialTable,
+    clear_material_cache,
+    get_alloy,
+    get_material,
+    list_materials,
+)
+from semiconductor_sim.materials.registry import _scalar_properties
 
 
 def test_list_materials_contains_known():
@@ -55,3 +66,85 @@ def test_gaas_300K_reference_ranges():
     assert NC_MIN < Nc < NC_MAX
     assert NV_MIN < Nv < NV_MAX
     assert NI_MIN < ni < NI_MAX
+
+
+def test_scalar_properties_are_memoized_and_match_arrays():
+    clear_material_cache()
+    si = get_material("Si")
+    T = np.array([250.0, 300.0, 350.0])
+    for _ in range(3):
+        scalars = [si.ni(t) for t in T]
+    info = _scalar_properties.cache_info()
+    assert info.misses == T.size
+    assert info.hits == 2 * T.size
+    np.testing.assert_array_equal(scalars, si.ni(T))
+    assert si.Eg(300) == float(si.Eg(np.array(300.0)))
+    clear_material_cache()
+    assert _scalar_properties.cache_info().currsize == 0
+
+
+def test_ni_table_error_bound_and_fallback():
+    rtol = 1e-6
+    gaas = get_material("GaAs")
+    table = gaas.ni_table(200.0, 500.0, rtol=rtol)
+    assert table is gaas.ni_table(200.0, 500.0, rtol=rtol)
+    assert table.max_rel_error <= rtol
+    T = np.linspace(200.0, 500.0, 5001)
+    rel = np.abs(table(T) / gaas.ni(T) - 1.0)
+    assert rel.max() <= rtol
+    # Outside the tabulated range the exact formula is used
+    assert table(600.0) == gaas.ni(600.0)
+    with pytest.raises(ValueError):
+        gaas.ni_table(300.0, 200.0)
+    with pytest.raises(ValueError):
+        gaas.ni_table(200.0, 500.0, rtol=1e-15, max_points=100)
+
+
+def test_material_table_matches_materials():
+    table = MaterialTable.from_registry()
+    assert table.symbols == tuple(list_materials())
+    T = np.linspace(200.0, 500.0, 31)
+    for prop in ("Eg", "Nc", "Nv", "ni"):
+        grid = getattr(table, prop)(T)
+        assert grid.shape == (len(table), T.size)
+        for row, sym in zip(grid, table.symbols, strict=True):
+            np.testing.assert_array_equal(row, getattr(get_material(sym), prop)(T))
+    idx = table.index(["GaAs", "Si"])
+    np.testing.assert_array_equal(
+        table.ni(np.array([300.0, 400.0]), idx),
+        [get_material("GaAs").ni(300.0), get_material("Si").ni(400.0)],
+    )
+    with pytest.raises(KeyError):
+        table.index("InP")
+    with pytest.raises(IndexError):
+        table.Eg(300.0, index=[len(table)])
+
+
+def test_alloy_endpoints_and_vectorized_sweep():
+    algaas = get_alloy("AlGaAs")
+    T = np.array([250.0, 300.0, 400.0])
+    for x, endpoint in ((0.0, algaas.host), (1.0, algaas.guest)):
+        np.testing.assert_allclose(algaas.ni(x, T), endpoint.ni(T), rtol=1e-12)
+    assert algaas.host is get_material("GaAs")
+    assert "AlAs" not in list_materials()
+    x = np.linspace(0.0, 0.4, 41)
+    grid = algaas.grid(x, T)
+    assert grid.Eg.shape == (x.size, T.size)
+    assert np.all(np.diff(grid.Eg[:, 1]) > 0)  # Al raises the gap
+    assert algaas.grid(x, T) is grid
+    assert not grid.ni.flags.writeable
+    np.testing.assert_allclose(grid.ni[:, 1], algaas.ni(x, 300.0), rtol=1e-14)
+    np.testing.assert_allclose(algaas.at(0.3).Eg(T), algaas.Eg(0.3, T), rtol=1e-14)
+    with pytest.raises(ValueError):
+        algaas.Eg(1.2, 300.0)
+
+
+def test_alloy_table_drives_population_composition_sweep():
+    sige = get_alloy("SiGe")
+    x = np.array([0.0, 0.2, 0.5])
+    pop = SolarCellPopulation(1e17, 1e17, material=sige.table(x), material_index=np.arange(x.size))
+    v = np.linspace(0.0, 0.5, 6)
+    (I,) = pop.iv_characteristic(v)
+    for k, xk in enumerate(x):
+        cell = SolarCell(1e17, 1e17, material=sige.at(xk))
+        np.testing.assert_allclose(I[k], cell.iv_characteristic(v)[0], rtol=1e-12)
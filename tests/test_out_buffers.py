@@ -0,0 +1,84 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from semiconductor_sim import (
+    LED,
+    Photodiode,
+    PNJunctionDiode,
+    SolarCell,
+    TunnelDiode,
+    VaractorDiode,
+)
+from semiconductor_sim.utils.numerics import safe_expm1
+
+N_POINTS = 33
+# out= paths allocate only a constant few hundred bytes of Python objects
+LARGE_N_POINTS = 65536
+OUT_ALLOC_BUDGET_BYTES = 4096
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        PNJunctionDiode(1e17, 1e17),
+        LED(1e17, 1e17),
+        Photodiode(1e17, 1e17),
+        SolarCell(1e17, 1e17),
+        SolarCell(1e17, 1e17, series_resistance_ohm=0.5, shunt_resistance_ohm=1e3),
+        TunnelDiode(1e19, 1e19),
+        VaractorDiode(1e17, 1e17),
+    ],
+)
+@pytest.mark.parametrize("conc", [None, 1e16])
+def test_out_buffers_match_allocating_path(device, conc):
+    v = np.linspace(-0.5, 0.8, N_POINTS)
+    ref = device.iv_characteristic(v, n_conc=conc, p_conc=conc)
+    bufs = tuple(np.full_like(v, np.nan) for _ in ref)
+    got = device.iv_characteristic(v, n_conc=conc, p_conc=conc, out=bufs)
+    assert device.supports_out
+    assert len(got) == len(ref)
+    for g, b, r in zip(got, bufs, ref, strict=True):
+        assert g is b
+        np.testing.assert_array_equal(g, np.broadcast_to(r, v.shape))
+
+
+@pytest.mark.parametrize(
+    "device", [PNJunctionDiode(1e17, 1e17), LED(1e17, 1e17), SolarCell(1e17, 1e17)]
+)
+def test_out_path_allocates_no_array_temporaries(device):
+    v = np.linspace(-0.5, 0.8, LARGE_N_POINTS)
+    bufs = tuple(np.empty_like(v) for _ in device.iv_characteristic(v[:1]))
+    device.iv_characteristic(v, out=bufs)  # warm up
+    tracemalloc.start()
+    try:
+        device.iv_characteristic(v, out=bufs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < OUT_ALLOC_BUDGET_BYTES
+
+
+def test_safe_expm1_out_is_in_place_and_clipped():
+    x = np.array([-1e4, 0.0, 1.0, 1e4])
+    out = np.empty_like(x)
+    res = safe_expm1(x, out=out)
+    assert res is out
+    np.testing.assert_array_equal(out, safe_expm1(x))
+    # Aliasing input and output is allowed
+    safe_expm1(x, out=x)
+    np.testing.assert_array_equal(x, out)
+
+
+def test_iter_iv_writes_into_reused_buffers():
+    d = PNJunctionDiode(1e17, 1e17)
+    v = np.linspace(-0.5, 0.8, 4 * N_POINTS)
+    ref_I, _ = d.iv_characteristic(v)
+    stream = d.iter_iv(np.split(v, 4), chunk_size=N_POINTS)
+    first = next(stream)[0]
+    got = [first.copy()]
+    for I, _ in stream:
+        assert np.shares_memory(I, first)
+        got.append(I.copy())
+    np.testing.assert_array_equal(np.concatenate(got), ref_I)
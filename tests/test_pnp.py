@@ -20,3 +20,14 @@ def test_pnp_early_effect_negative_slope():
     ic = ic_grid[0]
     # As V_CE increases towards 0 (less negative), magnitude of current reduces (less negative values)
     assert np.all(np.diff(ic) > 0)
+
+
+def test_pnp_iv_grid_and_gummel():
+    pnp = PNP(doping_p=1e18, doping_n=1e16, early_voltage=50.0, veb_values=[0.65])
+    vce = np.linspace(-5.0, 0.0, 6)
+    (ref,) = pnp.iv_characteristic(vce)
+    (grid,) = pnp.iv_grid([0.65], vce)
+    np.testing.assert_array_equal(grid, ref)
+    (ic,) = pnp.gummel_characteristic(np.linspace(0.5, 0.7, 5), vce=-1.0)
+    assert ic.shape == (5,)
+    assert np.all(ic < 0) and np.all(np.diff(ic) < 0)
@@ -0,0 +1,169 @@
+import numpy as np
+import pytest
+
+from semiconductor_sim import (
+    LED,
+    LEDPopulation,
+    Photodiode,
+    PhotodiodePopulation,
+    PINDiode,
+    PINDiodePopulation,
+    PNJunctionDiode,
+    PNJunctionPopulation,
+    SchottkyDiode,
+    SchottkyDiodePopulation,
+    SolarCell,
+    SolarCellPopulation,
+)
+from semiconductor_sim.materials import MaterialTable, get_material
+
+# Members without (0) and with series resistance (ohm) in one batch
+SERIES_RESISTANCE = np.array([0.0, 5.0, 50.0])
+# Series-resistance rows agree with the scalar Newton solve to its tolerance
+SOLVER_RTOL = 1e-6
+
+
+def test_pn_population_matches_scalar_devices():
+    doping_p = np.array([1e16, 1e17, 1e18])
+    temperature = np.array([280.0, 300.0, 350.0])
+    pop = PNJunctionPopulation(doping_p, 1e17, temperature=temperature)
+    v = np.linspace(-0.2, 0.7, 25)
+    I, R = pop.iv_characteristic(v, n_conc=1e16, p_conc=1e16)
+    assert I.shape == (3, v.size)
+    assert R.shape == (3, v.size)
+    for k in range(3):
+        d = PNJunctionDiode(doping_p[k], 1e17, temperature=temperature[k])
+        I_k, R_k = d.iv_characteristic(v, n_conc=1e16, p_conc=1e16)
+        np.testing.assert_allclose(I[k], I_k, rtol=1e-12)
+        np.testing.assert_allclose(R[k], R_k, rtol=1e-12)
+
+
+def test_population_with_material_matches_scalar():
+    si = get_material("Si")
+    area = np.array([1e-4, 2e-4])
+    pop = LEDPopulation(1e17, 1e17, area=area, efficiency=0.3, material=si)
+    v = np.linspace(0.0, 1.0, 11)
+    I, E, _ = pop.iv_characteristic(v, n_conc=1e16, p_conc=1e16)
+    for k in range(2):
+        I_k, E_k, _ = LED(1e17, 1e17, area=area[k], efficiency=0.3, material=si).iv_characteristic(
+            v, n_conc=1e16, p_conc=1e16
+        )
+        np.testing.assert_allclose(I[k], I_k, rtol=1e-12)
+        np.testing.assert_allclose(E[k], E_k, rtol=1e-12)
+
+
+def test_illuminated_populations_match_scalar():
+    v = np.linspace(0.0, 0.8, 9)
+    light = np.array([0.5, 1.0])
+    (I_sc,) = SolarCellPopulation(1e17, 1e17, light_intensity=light).iv_characteristic(v)
+    irr = np.array([1e-4, 1e-3])
+    (I_pd,) = PhotodiodePopulation(1e17, 1e17, irradiance_W_per_cm2=irr).iv_characteristic(v)
+    for k in range(2):
+        (ref_sc,) = SolarCell(1e17, 1e17, light_intensity=light[k]).iv_characteristic(v)
+        (ref_pd,) = Photodiode(1e17, 1e17, irradiance_W_per_cm2=irr[k]).iv_characteristic(v)
+        np.testing.assert_allclose(I_sc[k], ref_sc, rtol=1e-12)
+        np.testing.assert_allclose(I_pd[k], ref_pd, rtol=1e-12)
+
+
+def test_solar_population_matches_scalar_single_diode():
+    # Ideal, series-only, shunt-only and fully non-ideal members in one batch
+    r_s = np.array([0.0, 5.0, 0.0, 50.0])
+    r_sh = np.array([np.inf, np.inf, 1e3, 1e4])
+    ideality = np.array([1.0, 1.2, 1.5, 2.0])
+    pop = SolarCellPopulation(
+        1e17, 1e17, series_resistance_ohm=r_s, shunt_resistance_ohm=r_sh, ideality=ideality
+    )
+    v = np.linspace(0.0, 0.8, 17)
+    (I,) = pop.iv_characteristic(v)
+    assert I.shape == (r_s.size, v.size)
+    for k in range(r_s.size):
+        cell = SolarCell(
+            1e17,
+            1e17,
+            series_resistance_ohm=r_s[k],
+            shunt_resistance_ohm=r_sh[k],
+            ideality=ideality[k],
+        )
+        np.testing.assert_allclose(I[k], cell.iv_characteristic(v)[0], rtol=1e-12)
+        np.testing.assert_allclose(pop.V_oc[k], cell.V_oc, rtol=1e-12)
+    with pytest.raises(ValueError):
+        SolarCellPopulation(1e17, 1e17, ideality=np.array([1.0, 0.0]))
+    with pytest.raises(ValueError):
+        SolarCellPopulation(1e17, 1e17, shunt_resistance_ohm=np.array([1e3, -1.0]))
+
+
+def test_population_validation_runs_over_whole_batch():
+    with pytest.raises(ValueError):
+        PNJunctionPopulation(1e17, 1e17, area=np.array([1e-4, -1e-4]))
+    with pytest.raises(ValueError):
+        PNJunctionPopulation(1e17, 1e17, temperature=np.array([300.0, np.nan]))
+    with pytest.raises(ValueError):
+        PNJunctionPopulation(np.ones(3) * 1e17, np.ones(2) * 1e17)
+    with pytest.raises(ValueError):
+        LEDPopulation(1e17, 1e17, efficiency=np.array([0.5, 1.5]))
+
+
+def test_population_mixes_materials_via_table_index():
+    table = MaterialTable.from_registry(["Si", "Ge", "GaAs"])
+    symbols = ["GaAs", "Si", "Ge", "Si"]
+    temperature = np.array([300.0, 320.0, 280.0, 350.0])
+    pop = SolarCellPopulation(
+        1e17, 1e17, temperature=temperature, material=table, material_index=table.index(symbols)
+    )
+    v = np.linspace(0.0, 0.6, 13)
+    (I,) = pop.iv_characteristic(v)
+    for k, sym in enumerate(symbols):
+        cell = SolarCell(1e17, 1e17, temperature=temperature[k], material=get_material(sym))
+        np.testing.assert_allclose(I[k], cell.iv_characteristic(v)[0], rtol=1e-12)
+    with pytest.raises(ValueError):
+        SolarCellPopulation(1e17, 1e17, material=table)
+    with pytest.raises(ValueError):
+        SolarCellPopulation(1e17, 1e17, material=table, material_index=[len(table)])
+    with pytest.raises(ValueError):
+        SolarCellPopulation(1e17, 1e17, material=get_material("Si"), material_index=0)
+
+
+def test_pin_population_matches_scalar_with_mixed_series_resistance():
+    temperature = np.array([290.0, 300.0, 330.0])
+    width = np.array([1e-4, 5e-4, 2e-4])
+    pop = PINDiodePopulation(
+        1e17,
+        1e17,
+        intrinsic_width_cm=width,
+        temperature=temperature,
+        series_resistance_ohm=SERIES_RESISTANCE,
+    )
+    v = np.linspace(-0.2, 0.9, 45)
+    (I,) = pop.iv_characteristic(v)
+    assert I.shape == (SERIES_RESISTANCE.size, v.size)
+    for k, r_s in enumerate(SERIES_RESISTANCE):
+        diode = PINDiode(
+            1e17,
+            1e17,
+            intrinsic_width_cm=width[k],
+            temperature=temperature[k],
+            series_resistance_ohm=r_s,
+        )
+        np.testing.assert_allclose(I[k], diode.iv_characteristic(v)[0], rtol=SOLVER_RTOL)
+    with pytest.raises(ValueError):
+        PINDiodePopulation(1e17, 1e17, intrinsic_width_cm=np.array([1e-4, 0.0]))
+
+
+def test_schottky_population_matches_scalar_with_mixed_series_resistance():
+    barrier = np.array([0.5, 0.7, 0.8])
+    ideality = np.array([1.0, 1.1, 1.3])
+    pop = SchottkyDiodePopulation(barrier, ideality, series_resistance_ohm=SERIES_RESISTANCE)
+    v = np.linspace(-0.2, 0.6, 33)
+    (I,) = pop.iv_characteristic(v)
+    for k, r_s in enumerate(SERIES_RESISTANCE):
+        diode = SchottkyDiode(barrier[k], ideality[k], series_resistance_ohm=r_s)
+        np.testing.assert_allclose(I[k], diode.iv_characteristic(v)[0], rtol=SOLVER_RTOL)
+    # Without series resistance the closed form matches to rounding
+    (ideal,) = SchottkyDiodePopulation(barrier, ideality).iv_characteristic(v)
+    for k in range(barrier.size):
+        (ref,) = SchottkyDiode(barrier[k], ideality[k]).iv_characteristic(v)
+        np.testing.assert_allclose(ideal[k], ref, rtol=1e-12)
+    with pytest.raises(ValueError):
+        SchottkyDiodePopulation(np.array([0.7, 3.0]))
+    with pytest.raises(ValueError):
+        SchottkyDiodePopulation(ideality=np.array([1.1, 0.5]))
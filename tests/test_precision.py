@@ -0,0 +1,124 @@
+import functools
+import threading
+
+import numpy as np
+import pytest
+
+from semiconductor_sim import (
+    BJT,
+    PINDiode,
+    PNJunctionDiode,
+    PNJunctionPopulation,
+    SchottkyDiode,
+    SolarCell,
+)
+from semiconductor_sim.executors import ThreadChunkExecutor
+from semiconductor_sim.utils.numerics import safe_expm1
+from semiconductor_sim.utils.precision import (
+    PrecisionWarning,
+    compare_precision,
+    expm1_max_arg,
+    get_precision,
+    precision,
+    set_precision,
+)
+
+FLOAT32_RTOL = 1e-5
+OVERFLOW_BIAS_V = 3.0
+SERIES_RESISTANCE_OHM = 10.0
+
+
+def test_precision_context_restores_and_validates():
+    assert get_precision() == np.float64
+    with precision("float32") as dt:
+        assert dt == np.float32
+        assert get_precision() == np.float32
+    assert get_precision() == np.float64
+    with pytest.raises(ValueError):
+        set_precision(np.float16)
+
+
+def test_precision_is_per_thread():
+    diode = PNJunctionDiode(1e17, 1e17)
+    v = np.linspace(0.0, 0.7, 8)
+    both_inside = threading.Barrier(2)
+    dtypes = {}
+
+    def run(name, dtype):
+        with precision(dtype):
+            # Both threads hold their setting at the same time before computing
+            both_inside.wait()
+            dtypes[name] = diode.iv_characteristic(v)[0].dtype
+            both_inside.wait()
+
+    threads = [
+        threading.Thread(target=run, args=("f32", "float32")),
+        threading.Thread(target=run, args=("f64", "float64")),
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert dtypes == {"f32": np.float32, "f64": np.float64}
+    assert get_precision() == np.float64
+
+
+def test_thread_chunk_executor_follows_caller_precision():
+    diode = PNJunctionDiode(1e17, 1e17)
+    v = np.linspace(0.0, 0.7, 64)
+    with precision("float32"):
+        (ref,) = diode.iv_characteristic(v)[:1]
+        with ThreadChunkExecutor(2, chunk_size=8) as ex:
+            got = ex.iv_characteristic(diode, v)[0]
+    assert got.dtype == np.float32
+    np.testing.assert_array_equal(got, ref)
+
+
+def test_safe_expm1_uses_float32_overflow_bound():
+    bound = expm1_max_arg(np.float32)
+    assert np.isfinite(np.float32(np.exp(bound)))
+    assert expm1_max_arg(np.float64) > bound
+    with precision("float32"):
+        y = safe_expm1(np.array([1e3, -1e3]))
+    assert y.dtype == np.float32
+    assert np.all(np.isfinite(y))
+    assert safe_expm1(1e3, dtype=np.float32).dtype == np.float32
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        PNJunctionDiode(1e17, 1e17).iv_characteristic,
+        SolarCell(1e17, 1e17).iv_characteristic,
+        PNJunctionPopulation(np.logspace(15, 18, 8), 1e17).iv_characteristic,
+        PINDiode(1e17, 1e17).iv_characteristic,
+        PINDiode(1e17, 1e17, series_resistance_ohm=SERIES_RESISTANCE_OHM).iv_characteristic,
+        SchottkyDiode().iv_characteristic,
+        SchottkyDiode(series_resistance_ohm=SERIES_RESISTANCE_OHM).iv_characteristic,
+        functools.partial(
+            SchottkyDiode(series_resistance_ohm=SERIES_RESISTANCE_OHM).iv_temperature_grid,
+            temperatures=[300.0, 350.0],
+        ),
+    ],
+)
+def test_float32_outputs_track_float64_reference(fn):
+    v = np.linspace(-0.5, 0.8, 200)
+    with precision("float32"):
+        results = fn(v)
+    assert all(r.dtype == np.float32 for r in results)
+    errors = compare_precision(fn, v, rtol=FLOAT32_RTOL)
+    assert max(errors) < FLOAT32_RTOL
+
+
+def test_bjt_grid_follows_precision():
+    bjt = BJT(1e16, 1e18)
+    with precision("float32"):
+        (ic,) = bjt.iv_grid([0.6, 0.7], np.linspace(0.0, 5.0, 11))
+    assert ic.dtype == np.float32
+
+
+def test_compare_precision_warns_when_float32_clips():
+    diode = PNJunctionDiode(1e17, 1e17)
+    with pytest.warns(PrecisionWarning):
+        errors = compare_precision(diode.iv_characteristic, np.array([OVERFLOW_BIAS_V]))
+    assert errors[0] > FLOAT32_RTOL
@@ -0,0 +1,168 @@
+import http.client
+import io
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPStatus
+
+import numpy as np
+import pytest
+
+from semiconductor_sim import PNJunctionDiode, TunnelDiode, serve
+from semiconductor_sim.serve import (
+    MAX_BODY_BYTES,
+    MAX_VOLTAGE_POINTS,
+    IVRequest,
+    MicroBatcher,
+    evaluate_batch,
+    make_server,
+)
+
+V = [0.0, 0.2, 0.4, 0.6]
+DOPINGS = np.geomspace(1e15, 1e18, 16)
+WINDOW = 0.05
+
+
+@pytest.fixture
+def server():
+    srv = make_server("127.0.0.1", 0, window=WINDOW, warm=False)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{srv.server_port}"
+    srv.shutdown()
+    srv.server_close()
+
+
+def _post(url, payload):
+    req = urllib.request.Request(
+        f"{url}/iv", json.dumps(payload).encode(), {"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(req) as resp:
+        return resp.headers["Content-Type"], resp.read()
+
+
+def _get(url, path):
+    with urllib.request.urlopen(f"{url}{path}") as resp:
+        return json.loads(resp.read())
+
+
+def test_evaluate_batch_matches_devices():
+    requests = [IVRequest("pn", (("doping_p", d),), np.asarray(V)) for d in DOPINGS]
+    currents = evaluate_batch(requests)
+    for d, current in zip(DOPINGS, currents, strict=True):
+        expected = PNJunctionDiode(doping_p=d, doping_n=1e17).iv_characteristic(np.asarray(V))[0]
+        np.testing.assert_allclose(current, expected, rtol=1e-12)
+    tunnel = evaluate_batch([IVRequest("tunnel", (("temperature", 310.0),), np.asarray(V))])
+    expected = TunnelDiode(1e17, 1e17, temperature=310.0).iv_characteristic(np.asarray(V))[0]
+    np.testing.assert_allclose(tunnel[0], expected)
+
+
+def test_request_validation():
+    with pytest.raises(ValueError, match="unknown device"):
+        IVRequest.from_json({"device": "bogus", "voltage": V})
+    with pytest.raises(ValueError, match="no numeric parameter"):
+        IVRequest.from_json({"device": "pn", "params": {"foo": 1}, "voltage": V})
+    with pytest.raises(ValueError, match="voltage"):
+        IVRequest.from_json({"device": "pn", "voltage": []})
+    with pytest.raises(ValueError, match="Unknown material"):
+        IVRequest.from_json({"device": "pn", "voltage": V, "material": "unobtainium"})
+    r = IVRequest.from_json({"device": "pn", "voltage": "0:0.6:4", "material": "Si"})
+    np.testing.assert_allclose(r.voltage, V)
+    for voltage in ("0:1:1000000000", [0.0] * (MAX_VOLTAGE_POINTS + 1)):
+        with pytest.raises(ValueError, match="at most"):
+            IVRequest.from_json({"device": "pn", "voltage": voltage})
+
+
+def test_batcher_isolates_failing_request():
+    batcher = MicroBatcher(window=WINDOW)
+    good = batcher.submit(
+        IVRequest("pn", (("doping_p", 1e17), ("temperature", 300.0)), np.asarray(V))
+    )
+    bad = batcher.submit(IVRequest("pn", (("doping_p", 1e17), ("temperature", 0.0)), np.asarray(V)))
+    assert good.result(timeout=5).shape == (len(V),)
+    with pytest.raises(ValueError):
+        bad.result(timeout=5)
+    batcher.close()
+
+
+def test_concurrent_requests_are_batched(server):
+    def call(d):
+        _, body = _post(server, {"device": "pn", "params": {"doping_p": d}, "voltage": V})
+        return json.loads(body)["current"]
+
+    with ThreadPoolExecutor(len(DOPINGS)) as pool:
+        currents = list(pool.map(call, DOPINGS))
+    for d, current in zip(DOPINGS, currents, strict=True):
+        expected = PNJunctionDiode(doping_p=d, doping_n=1e17).iv_characteristic(np.asarray(V))[0]
+        np.testing.assert_allclose(current, expected, rtol=1e-12)
+    stats = _get(server, "/stats")
+    assert stats["requests"] == len(DOPINGS)
+    assert stats["batches"] < len(DOPINGS)
+
+
+def test_npy_response(server):
+    content_type, body = _post(
+        server, {"device": "zener", "params": {"temperature": 320}, "voltage": V, "format": "npy"}
+    )
+    assert content_type == "application/x-npy"
+    current = np.load(io.BytesIO(body), allow_pickle=False)
+    assert current.dtype == np.float32
+    assert current.shape == (len(V),)
+
+
+def test_errors_and_health(server):
+    assert "pn" in _get(server, "/health")["devices"]
+    with pytest.raises(urllib.error.HTTPError) as info:
+        _post(server, {"device": "bogus", "voltage": V})
+    assert info.value.code == HTTPStatus.BAD_REQUEST
+    assert "unknown device" in json.loads(info.value.read())["error"]
+    with pytest.raises(urllib.error.HTTPError) as info:
+        _get(server, "/nope")
+    assert info.value.code == HTTPStatus.NOT_FOUND
+
+
+def _status(url, payload):
+    with pytest.raises(urllib.error.HTTPError) as info:
+        _post(url, payload)
+    return info.value.code
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"dtype": ["float32"]}, {"dtype": {}}, {"dtype": "float16"}, {"format": ["npy"]}],
+)
+def test_rejects_invalid_format_and_dtype(server, options):
+    payload = {"device": "pn", "voltage": V, **options}
+    assert _status(server, payload) == HTTPStatus.BAD_REQUEST
+
+
+def test_rejects_oversized_voltage_range(server):
+    payload = {"device": "pn", "voltage": f"0:1:{MAX_VOLTAGE_POINTS + 1}"}
+    assert _status(server, payload) == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    ("length", "status"),
+    [
+        ("-1", HTTPStatus.BAD_REQUEST),
+        ("ten", HTTPStatus.BAD_REQUEST),
+        (str(MAX_BODY_BYTES + 1), HTTPStatus.REQUEST_ENTITY_TOO_LARGE),
+    ],
+)
+def test_rejects_invalid_content_length(server, length, status):
+    conn = http.client.HTTPConnection(server.removeprefix("http://"))
+    try:
+        conn.putrequest("POST", "/iv")
+        conn.putheader("Content-Length", length)
+        conn.endheaders()
+        assert conn.getresponse().status == status
+    finally:
+        conn.close()
+
+
+def test_timeout_answers_503(server, monkeypatch):
+    monkeypatch.setattr(serve, "REQUEST_TIMEOUT", 0.01)
+    monkeypatch.setattr(MicroBatcher, "submit", lambda self, request: Future())
+    assert _status(server, {"device": "pn", "voltage": V}) == HTTPStatus.SERVICE_UNAVAILABLE
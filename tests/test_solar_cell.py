@@ -6,6 +6,7 @@ import numpy as np
 
 from semiconductor_sim import SolarCell
 from semiconductor_sim.materials import get_material
+from semiconductor_sim.utils import k_B, q
 
 
 class TestSolarCell(unittest.TestCase):
@@ -36,6 +37,38 @@ class TestSolarCell(unittest.TestCase):
         # V_oc depends on I_s, so also expect a change
         self.assertNotEqual(sc_default.V_oc, sc_si.V_oc)
 
+    def test_single_diode_rs_rsh_satisfies_implicit_equation(self):
+        solar = SolarCell(
+            doping_p=1e17,
+            doping_n=1e17,
+            light_intensity=1e6,
+            series_resistance_ohm=500.0,
+            shunt_resistance_ohm=1e7,
+            ideality=1.3,
+        )
+        voltage = np.linspace(-0.5, 1.0, 151)
+        (current,) = solar.iv_characteristic(voltage)
+        a = solar.ideality * k_B * solar.temperature / q
+        v_j = voltage + current * solar.series_resistance_ohm
+        rhs = solar.I_sc - solar.I_s * np.expm1(v_j / a) - v_j / solar.shunt_resistance_ohm
+        np.testing.assert_allclose(current, rhs, rtol=1e-9, atol=1e-20)
+        # Current crosses zero at the open-circuit voltage
+        self.assertAlmostEqual(float(np.interp(0.0, -current, voltage)), solar.V_oc, places=3)
+
+    def test_single_diode_log_domain_is_finite(self):
+        solar = SolarCell(doping_p=1e17, doping_n=1e17, series_resistance_ohm=1e-3)
+        voltage = np.array([0.0, 5.0, 50.0])
+        (current,) = solar.iv_characteristic(voltage)
+        self.assertTrue(np.all(np.isfinite(current)))
+        # Deep forward bias is limited by the series resistance
+        self.assertAlmostEqual(current[-1] / (-(50.0 - 1.0) / 1e-3), 1.0, delta=0.05)
+
+    def test_single_diode_parameter_validation(self):
+        with self.assertRaises(ValueError):
+            SolarCell(doping_p=1e17, doping_n=1e17, ideality=0.0)
+        with self.assertRaises(ValueError):
+            SolarCell(doping_p=1e17, doping_n=1e17, shunt_resistance_ohm=-1.0)
+
 
 if __name__ == '__main__':
     unittest.main()
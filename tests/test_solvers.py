@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from semiconductor_sim import PINDiode, SchottkyDiode
+from semiconductor_sim.utils import k_B, q
+from semiconductor_sim.utils.solvers import damped_newton, solve_diode_series_resistance
+
+
+def test_damped_newton_elementwise_masks_and_iterations():
+    targets = np.array([0.0, 1.0, 4.0, 100.0])
+
+    def residual(x, idx):
+        return x**2 - targets[idx], 2.0 * x
+
+    res = damped_newton(residual, np.full(targets.shape, 1.0), max_iter=60, rtol=1e-12)
+    np.testing.assert_allclose(res.x[1:], np.sqrt(targets[1:]), rtol=1e-10)
+    assert res.converged[1:].all()
+    # Easy elements stop early while harder ones keep iterating
+    assert res.iterations[1] < res.iterations[3]
+    assert res.total_iterations == int(res.iterations.sum())
+
+
+def test_diode_series_resistance_satisfies_equation():
+    V = np.linspace(-1.0, 1.2, 401)
+    Is, Vt = 1e-12, k_B * 300.0 / q
+    for Rs in (1e-3, 2.0, 1e6):
+        res = solve_diode_series_resistance(V, Is, Vt, Rs, rtol=1e-12)
+        assert res.converged.all()
+        residual = res.x - Is * np.expm1((V - res.x * Rs) / Vt)
+        assert np.all(np.abs(residual) <= 1e-9 * np.maximum(np.abs(res.x), Is))
+
+
+def test_pin_and_schottky_use_vectorized_solver():
+    V = np.linspace(0.0, 0.9, 50)
+    pin = PINDiode(1e17, 1e17, series_resistance_ohm=2.0)
+    sch = SchottkyDiode(0.6, 1.2, series_resistance_ohm=10.0)
+    for dev in (pin, sch):
+        res = dev.solve_series_resistance(V)
+        (I,) = dev.iv_characteristic(V)
+        np.testing.assert_array_equal(I, res.x)
+        assert res.converged.all()
+        assert res.iterations.shape == V.shape
+
+
+def test_temperature_grid_with_series_resistance():
+    V = np.linspace(0.0, 0.8, 21)
+    temps = np.array([275.0, 325.0])
+    (grid,) = PINDiode(1e17, 1e17, series_resistance_ohm=1.0).iv_temperature_grid(V, temps)
+    for k, T in enumerate(temps):
+        (ref,) = PINDiode(1e17, 1e17, temperature=T, series_resistance_ohm=1.0).iv_characteristic(V)
+        np.testing.assert_allclose(grid[k], ref, rtol=1e-8)
+
+
+def test_continuation_cuts_iterations_and_matches_cold_start():
+    V = np.linspace(-0.5, 1.0, 4001)
+    Is, Vt = 1e-12, k_B * 300.0 / q
+    cold = solve_diode_series_resistance(V, Is, Vt, 2.0)
+    warm = solve_diode_series_resistance(V, Is, Vt, 2.0, continuation=True)
+    assert warm.converged.all()
+    np.testing.assert_allclose(warm.x, cold.x, rtol=1e-9, atol=1e-24)
+    assert warm.total_iterations < 0.6 * cold.total_iterations
+    # Descending sweeps and 2-D (rows x sweep) grids are supported too
+    desc = solve_diode_series_resistance(V[::-1], Is, Vt, 2.0, continuation=True)
+    np.testing.assert_allclose(desc.x[::-1], cold.x, rtol=1e-9, atol=1e-24)
+    grid = solve_diode_series_resistance(
+        V[None, :], np.array([[1e-12], [1e-10]]), Vt, 2.0, continuation=True
+    )
+    assert grid.x.shape == (2, V.size)
+    np.testing.assert_allclose(grid.x[0], cold.x, rtol=1e-9, atol=1e-24)
+
+
+def test_continuation_rejects_unsorted_sweeps():
+    with pytest.raises(ValueError):
+        solve_diode_series_resistance(
+            np.array([0.1, 0.5, 0.2]), 1e-12, 0.0259, 1.0, continuation=True
+        )
+    # Device auto mode simply falls back to cold starts for unsorted input
+    (I,) = PINDiode(1e17, 1e17, series_resistance_ohm=1.0).iv_characteristic(
+        np.array([0.1, 0.5, 0.2])
+    )
+    assert np.all(np.isfinite(I))
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from semiconductor_sim import BJT, LED, PNJunctionDiode
+from semiconductor_sim.utils.precision import precision
+
+CHUNK = 128
+FLOAT32_RTOL = 1e-5
+
+
+def _chunks(v, sizes):
+    pos = 0
+    for s in sizes:
+        yield v[pos : pos + s]
+        pos += s
+
+
+def test_iter_iv_matches_full_evaluation_with_uneven_chunks():
+    d = PNJunctionDiode(1e17, 1e17)
+    v = np.linspace(-0.5, 0.8, 1000)
+    full_I, full_R = d.iv_characteristic(v, n_conc=1e16, p_conc=1e16)
+    parts = list(
+        d.iter_iv(
+            _chunks(v, [1, 300, 7, 692]), chunk_size=CHUNK, n_conc=1e16, p_conc=1e16, copy=True
+        )
+    )
+    assert all(p[0].size <= CHUNK for p in parts)
+    np.testing.assert_array_equal(np.concatenate([p[0] for p in parts]), full_I)
+    np.testing.assert_array_equal(np.concatenate([p[1] for p in parts]), full_R)
+
+
+def test_iter_iv_reuses_buffers_and_handles_2d_outputs():
+    bjt = BJT(1e16, 1e18, vbe_values=[0.6, 0.7])
+    vce = np.linspace(0.0, 5.0, 50)
+    (ref,) = bjt.iv_characteristic(vce)
+    stream = bjt.iter_iv(iter(vce), chunk_size=16)
+    first = next(stream)[0]
+    got = [first.copy()]
+    for (ic,) in stream:
+        assert np.shares_memory(ic, first)
+        got.append(ic.copy())
+    np.testing.assert_array_equal(np.concatenate(got, axis=-1), ref)
+
+
+def test_iter_iv_generator_source_and_validation():
+    led = LED(1e17, 1e17)
+    n_chunks, n_per_chunk = 5, 10
+    source = (np.full(n_per_chunk, 0.1 * k) for k in range(n_chunks))
+    total = sum(I.size for I, _ in led.iter_iv(source, chunk_size=8))
+    assert total == n_chunks * n_per_chunk
+    with pytest.raises(ValueError):
+        next(led.iter_iv([np.zeros(3)], chunk_size=0))
+
+
+def test_iter_iv_passes_0d_outputs_through():
+    led = LED(1e17, 1e17)
+    v = np.linspace(0.0, 0.8, 10)
+    _, ref_emission, _ = led.iv_characteristic(v, n_conc=1e16, p_conc=1e16)
+    assert np.ndim(ref_emission) == 0
+    for copy in (False, True):
+        for I, emission, r_srh in led.iter_iv(
+            [v], chunk_size=4, n_conc=1e16, p_conc=1e16, copy=copy
+        ):
+            assert emission.shape == ()
+            assert emission == ref_emission
+            assert I.shape == r_srh.shape
+
+
+@pytest.mark.parametrize(
+    "device", [PNJunctionDiode(1e17, 1e17), BJT(1e16, 1e18, vbe_values=[0.6, 0.7])]
+)
+def test_iter_iv_buffers_follow_compute_precision(device):
+    v = np.linspace(0.0, 0.7, 300)
+    with precision("float32"):
+        ref = device.iv_characteristic(v)
+        got = [tuple(r.copy() for r in step) for step in device.iter_iv([v], chunk_size=CHUNK)]
+    for i, want in enumerate(ref):
+        merged = np.concatenate([step[i] for step in got], axis=-1)
+        assert merged.dtype == np.float32
+        np.testing.assert_allclose(merged, want, rtol=FLOAT32_RTOL)
@@ -0,0 +1,108 @@
+import functools
+
+import numpy as np
+import pytest
+
+from semiconductor_sim.devices import PNJunctionPopulation
+from semiconductor_sim.surrogates import (
+    ParameterRange,
+    PopulationIV,
+    generate_dataset,
+    iter_shards,
+    load_dataset,
+    zener_voltage_target,
+)
+
+N_SAMPLES = 1000
+CHUNK = 300
+N_CHUNKS = 4
+V = np.linspace(0.0, 0.6, 5)
+DOPING = ParameterRange(1e16, 1e20, log=True)
+T_LOW, T_HIGH = 250.0, 400.0
+
+ZENER_RANGES = {"doping_p": DOPING, "doping_n": DOPING, "temperature": (T_LOW, T_HIGH)}
+
+
+def _generate(out_dir, **kw):
+    return generate_dataset(
+        zener_voltage_target, ZENER_RANGES, N_SAMPLES, out_dir, chunk_size=CHUNK, **kw
+    )
+
+
+def _generate_and_load(out_dir, **kw):
+    _generate(out_dir, **kw)
+    return load_dataset(out_dir)
+
+
+def test_shards_cover_samples_in_range(tmp_path):
+    manifest = _generate(tmp_path)
+    assert manifest.n_chunks == N_CHUNKS
+    assert [len(s["temperature"]) for s in iter_shards(tmp_path)] == [300, 300, 300, 100]
+    data = load_dataset(tmp_path)
+    assert set(data) == {"doping_p", "doping_n", "temperature", "zener_voltage"}
+    assert np.all((data["doping_p"] >= DOPING.low) & (data["doping_p"] <= DOPING.high))
+    assert np.all((data["temperature"] >= T_LOW) & (data["temperature"] <= T_HIGH))
+
+
+def test_parallel_and_resumed_runs_are_identical(tmp_path):
+    serial = _generate_and_load(tmp_path / "serial")
+    parallel = _generate_and_load(tmp_path / "parallel", jobs=2)
+    (tmp_path / "parallel" / "shard_00002.npz").unlink()
+    resumed = _generate_and_load(tmp_path / "parallel", jobs=2)
+    for key, values in serial.items():
+        np.testing.assert_array_equal(parallel[key], values)
+        np.testing.assert_array_equal(resumed[key], values)
+
+
+def test_seed_changes_samples(tmp_path):
+    a = _generate_and_load(tmp_path / "a", seed=1)
+    b = _generate_and_load(tmp_path / "b", seed=2)
+    assert not np.array_equal(a["doping_p"], b["doping_p"])
+
+
+def test_resume_rejects_changed_configuration(tmp_path):
+    _generate(tmp_path)
+    with pytest.raises(ValueError, match="different configuration"):
+        _generate(tmp_path, seed=1)
+
+
+def test_population_iv_target_matches_population(tmp_path):
+    target = PopulationIV(PNJunctionPopulation, V, doping_n=1e17)
+    ranges = {"doping_p": ParameterRange(1e15, 1e18, log=True)}
+    generate_dataset(target, ranges, N_SAMPLES, tmp_path, chunk_size=CHUNK)
+    data = load_dataset(tmp_path)
+    assert data["current"].shape == (N_SAMPLES, V.size)
+    expected, _ = PNJunctionPopulation(data["doping_p"], 1e17).iv_characteristic(V)
+    np.testing.assert_allclose(data["current"], expected)
+
+
+def test_resume_compares_target_values(tmp_path):
+    ranges = {"doping_p": DOPING}
+
+    def run(target):
+        return generate_dataset(target, ranges, N_SAMPLES, tmp_path, chunk_size=CHUNK)
+
+    run(PopulationIV(PNJunctionPopulation, V, doping_n=1e17))
+    # An equal target built again resumes; same-length grids or fixed
+    # arguments that differ in value are rejected
+    run(PopulationIV(PNJunctionPopulation, V.copy(), doping_n=1e17))
+    with pytest.raises(ValueError, match="different configuration"):
+        run(PopulationIV(PNJunctionPopulation, V + 0.1, doping_n=1e17))
+    with pytest.raises(ValueError, match="different configuration"):
+        run(PopulationIV(PNJunctionPopulation, V, doping_n=1e18))
+
+
+def test_resume_accepts_equal_partial(tmp_path):
+    def make():
+        return functools.partial(zener_voltage_target, noise_std=0.1)
+
+    generate_dataset(make(), ZENER_RANGES, N_SAMPLES, tmp_path, chunk_size=CHUNK)
+    generate_dataset(make(), ZENER_RANGES, N_SAMPLES, tmp_path, chunk_size=CHUNK)
+    with pytest.raises(ValueError, match="different configuration"):
+        generate_dataset(
+            functools.partial(zener_voltage_target, noise_std=0.3),
+            ZENER_RANGES,
+            N_SAMPLES,
+            tmp_path,
+            chunk_size=CHUNK,
+        )
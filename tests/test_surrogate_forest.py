@@ -0,0 +1,88 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from semiconductor_sim.devices import zener_diode
+from semiconductor_sim.surrogates import TreeEnsemble, export_forest, load_forest
+
+N_ROWS = 500
+
+
+def _stump_ensemble():
+    # Tree 0: x0 <= 0.5 -> 1.0 else 3.0; tree 1: x1 <= 2.0 -> 10.0 else 20.0
+    return TreeEnsemble(
+        feature=np.array([0, 0, 0, 1, 0, 0], dtype=np.int32),
+        threshold=np.array([0.5, np.inf, np.inf, 2.0, np.inf, np.inf]),
+        left=np.array([1, 1, 2, 4, 4, 5], dtype=np.int32),
+        right=np.array([2, 1, 2, 5, 4, 5], dtype=np.int32),
+        value=np.array([0.0, 1.0, 3.0, 0.0, 10.0, 20.0]),
+        roots=np.array([0, 3], dtype=np.int32),
+        n_features=2,
+        max_depth=1,
+    )
+
+
+def _training_set(rng, n):
+    X = np.column_stack(
+        [10 ** rng.uniform(16, 19, n), 10 ** rng.uniform(16, 19, n), rng.uniform(250, 400, n)]
+    )
+    y = 5.0 + 0.1 * np.log10(X[:, 0]) - 0.05 * np.log10(X[:, 1]) + 0.01 * X[:, 2]
+    return X, y
+
+
+def test_handmade_ensemble_predicts_tree_mean():
+    X = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 5.0], [1.0, 5.0]])
+    expected = np.array([5.5, 6.5, 10.5, 11.5])
+    np.testing.assert_array_equal(_stump_ensemble().predict(X), expected)
+
+
+def test_block_size_does_not_change_result():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-1.0, 4.0, size=(N_ROWS, 2))
+    ens = _stump_ensemble()
+    np.testing.assert_array_equal(ens.predict(X, block_rows=7), ens.predict(X))
+
+
+def test_rejects_wrong_feature_count():
+    with pytest.raises(ValueError, match="shape"):
+        _stump_ensemble().predict(np.zeros((3, 3)))
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_roundtrip(tmp_path, mmap):
+    path = tmp_path / "forest.npz"
+    ens = _stump_ensemble()
+    ens.save(path)
+    loaded = load_forest(path, mmap=mmap)
+    assert isinstance(loaded.threshold, np.memmap) is mmap
+    assert (loaded.n_features, loaded.max_depth, loaded.n_trees) == (2, 1, 2)
+    X = np.random.default_rng(1).uniform(-1.0, 4.0, size=(N_ROWS, 2))
+    np.testing.assert_array_equal(loaded.predict(X), ens.predict(X))
+
+
+def test_matches_sklearn_forest(tmp_path):
+    ensemble_mod = pytest.importorskip("sklearn.ensemble")
+    rng = np.random.default_rng(42)
+    X, y = _training_set(rng, N_ROWS)
+    model = ensemble_mod.RandomForestRegressor(n_estimators=10, random_state=0).fit(X, y)
+    export_forest(model, tmp_path / "rf.npz")
+    X_test, _ = _training_set(rng, N_ROWS)
+    np.testing.assert_allclose(
+        load_forest(tmp_path / "rf.npz").predict(X_test), model.predict(X_test), rtol=1e-12
+    )
+
+
+def test_zener_prefers_compact_model(tmp_path, monkeypatch):
+    compact = tmp_path / "zener.npz"
+    _stump_ensemble().save(compact)
+    monkeypatch.setattr(zener_diode, "COMPACT_MODEL_PATH", str(compact))
+    monkeypatch.setattr(zener_diode, "MODEL_PATH", str(tmp_path / "absent.pkl"))
+    zener_diode.clear_zener_model_cache()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            model = zener_diode.get_zener_model()
+        assert isinstance(model, TreeEnsemble)
+    finally:
+        zener_diode.clear_zener_model_cache()
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from semiconductor_sim import PNJunctionDiode
+from semiconductor_sim.surrogates import (
+    ParameterRange,
+    fit_iv_surrogate,
+    load_surrogate,
+)
+
+V = np.linspace(0.0, 0.7, 36)
+RANGES = {
+    "doping_p": ParameterRange(1e15, 1e18, log=True),
+    "temperature": ParameterRange(250.0, 400.0),
+}
+MAX_REL_ERROR = 1e-3
+
+
+@pytest.fixture(scope="module")
+def surrogate():
+    return fit_iv_surrogate(PNJunctionDiode, RANGES, V, doping_n=1e17, n_validation=16)
+
+
+def test_validation_report_within_tolerance(surrogate):
+    report = surrogate.validation
+    assert report.n_points == 16 * (V.size - 1)
+    assert report.max_rel_error < MAX_REL_ERROR
+
+
+def test_off_grid_evaluation_matches_device(surrogate):
+    v = np.linspace(0.2, 0.7, 101)
+    expected, _ = PNJunctionDiode(3e16, 1e17, temperature=310.0).iv_characteristic(v)
+    np.testing.assert_allclose(
+        surrogate(v, doping_p=3e16, temperature=310.0), expected, rtol=MAX_REL_ERROR
+    )
+
+
+def test_broadcasts_parameters_against_voltage(surrogate):
+    T = np.array([[260.0], [300.0], [390.0]])
+    assert surrogate(V, doping_p=1e16, temperature=T).shape == (3, V.size)
+
+
+def test_outside_declared_range_is_nan(surrogate):
+    assert np.isnan(surrogate(0.5, doping_p=1e19, temperature=300.0))
+
+
+def test_parameter_names_are_checked(surrogate):
+    with pytest.raises(TypeError, match="expected parameters"):
+        surrogate(V, doping_p=1e16)
+
+
+def test_save_load_roundtrip(surrogate, tmp_path):
+    path = tmp_path / "pn.npz"
+    surrogate.save(path)
+    loaded = load_surrogate(path)
+    assert loaded.names == surrogate.names
+    assert loaded.validation == surrogate.validation
+    np.testing.assert_array_equal(
+        loaded(V, doping_p=2e16, temperature=330.0),
+        surrogate(V, doping_p=2e16, temperature=330.0),
+    )
+
+
+def test_linear_transform_and_invalid_grid():
+    sur = fit_iv_surrogate(
+        PNJunctionDiode,
+        {"temperature": (280.0, 320.0)},
+        V,
+        doping_p=1e17,
+        doping_n=1e17,
+        transform="linear",
+        n_validation=0,
+    )
+    assert sur.validation is None
+    with pytest.raises(ValueError, match="strictly increasing"):
+        fit_iv_surrogate(PNJunctionDiode, RANGES, V[::-1], doping_n=1e17)
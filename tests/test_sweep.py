@@ -0,0 +1,94 @@
+import csv
+
+import numpy as np
+import pytest
+
+from semiconductor_sim import PNJunctionDiode, TunnelDiode
+from semiconductor_sim.cli import main
+from semiconductor_sim.sweep import SweepSpec, parse_values, run_sweep
+
+V = np.linspace(0.0, 0.6, 4)
+N_DOPING = 5
+TEMPERATURES = (300.0, 350.0)
+MAX_POINTS = 3
+
+
+def _spec(device="pn"):
+    return SweepSpec(
+        device,
+        {"doping_p": np.geomspace(1e15, 1e18, N_DOPING), "temperature": np.array(TEMPERATURES)},
+        V,
+        {"doping_n": 1e17},
+    )
+
+
+def test_parse_values():
+    np.testing.assert_array_equal(parse_values("1, 2,3"), [1.0, 2.0, 3.0])
+    np.testing.assert_allclose(parse_values("0:1:5"), np.linspace(0.0, 1.0, 5))
+    np.testing.assert_allclose(parse_values("1e15:1e18:4:log"), [1e15, 1e16, 1e17, 1e18])
+    for bad in ("1:2", "a,b", "0:1:0", "-1:1:3:log"):
+        with pytest.raises(ValueError):
+            parse_values(bad)
+    assert parse_values("0:1:3", max_points=MAX_POINTS).size == MAX_POINTS
+    for too_long in ("0:1:1000000000", "1,2,3,4"):
+        with pytest.raises(ValueError, match=f"at most {MAX_POINTS}"):
+            parse_values(too_long, max_points=MAX_POINTS)
+
+
+def test_spec_validation():
+    with pytest.raises(ValueError, match="unknown device"):
+        SweepSpec("bogus", {}, V)
+    with pytest.raises(ValueError, match="at least one swept parameter"):
+        SweepSpec("pn", {}, V, {"doping_p": 1e17})
+    with pytest.raises(ValueError, match="no parameter"):
+        SweepSpec("pn", {"foo": np.ones(2)}, V)
+    with pytest.raises(ValueError, match="both swept and fixed"):
+        SweepSpec("pn", {"doping_n": np.ones(2)}, V, {"doping_n": 1e17})
+
+
+@pytest.mark.parametrize(("device", "cls"), [("pn", PNJunctionDiode), ("tunnel", TunnelDiode)])
+def test_chunks_match_scalar_devices(device, cls):
+    spec = _spec(device)
+    chunks = list(run_sweep(spec, chunk_size=3))
+    assert [c[1].shape[0] for c in chunks] == [3, 3, 3, 1]
+    current = np.concatenate([c[1] for c in chunks])
+    temperature = np.concatenate([c[0]["temperature"] for c in chunks])
+    np.testing.assert_array_equal(temperature, np.tile(TEMPERATURES, N_DOPING))
+    row = 7  # doping index 3, second temperature
+    expected, _ = cls(
+        spec.params["doping_p"][3], 1e17, temperature=TEMPERATURES[1]
+    ).iv_characteristic(V)
+    np.testing.assert_allclose(current[row], expected, rtol=1e-12)
+
+
+def test_parallel_run_preserves_order():
+    spec = _spec()
+    serial = np.concatenate([c for _, c in run_sweep(spec, chunk_size=2)])
+    parallel = np.concatenate([c for _, c in run_sweep(spec, chunk_size=2, jobs=2)])
+    np.testing.assert_array_equal(parallel, serial)
+
+
+def test_cli_sweep_writes_csv_and_npy(tmp_path, capsys):
+    args = ["sweep", "pn", "-p", "doping_p=1e15:1e18:5:log", "-p", "temperature=300,350"]
+    args += ["-s", "doping_n=1e17", "-V=0:0.6:4", "--chunk-size", "3"]
+    assert main([*args, "-o", str(tmp_path / "out.npy")]) == 0
+    assert main([*args, "-o", str(tmp_path / "out.csv")]) == 0
+    assert "10 parameter sets x 4 voltages" in capsys.readouterr().err
+
+    wide = np.load(tmp_path / "out.npy")
+    assert wide.shape == (10, 2 + V.size)
+    expected = np.concatenate([c for _, c in run_sweep(_spec())])
+    np.testing.assert_allclose(wide[:, 2:], expected, rtol=1e-9)
+
+    with open(tmp_path / "out.csv", newline="") as fh:
+        rows = list(csv.reader(fh))
+    assert rows[0] == ["doping_p", "temperature", "voltage", "current"]
+    long = np.array(rows[1:], dtype=float)
+    np.testing.assert_allclose(long[:, 3], expected.ravel(), rtol=1e-9)
+
+
+def test_cli_sweep_rejects_bad_parameter():
+    with pytest.raises(SystemExit):
+        main(["sweep", "pn", "-p", "foo=1,2"])
+    with pytest.raises(SystemExit):
+        main(["sweep", "pn", "-V=0:0.5:3"])
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from semiconductor_sim import (
+    LED,
+    MOSCapacitor,
+    Photodiode,
+    PINDiode,
+    PNJunctionDiode,
+    SchottkyDiode,
+    SolarCell,
+    TunnelDiode,
+    VaractorDiode,
+)
+from semiconductor_sim.materials import get_material
+
+TEMPS = np.array([250.0, 300.0, 350.0, 400.0])
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda T: PNJunctionDiode(1e17, 1e17, temperature=T, material=get_material("Si")),
+        lambda T: LED(1e17, 1e17, temperature=T),
+        lambda T: SolarCell(1e17, 1e17, temperature=T),
+        lambda T: Photodiode(1e17, 1e17, temperature=T),
+        lambda T: PINDiode(1e17, 1e17, temperature=T),
+        lambda T: SchottkyDiode(0.7, 1.1, temperature=T),
+        lambda T: TunnelDiode(1e19, 1e19, temperature=T),
+        lambda T: VaractorDiode(1e17, 1e17, temperature=T),
+    ],
+)
+def test_temperature_grid_matches_rebuilt_devices(factory):
+    v = np.linspace(-0.2, 0.6, 17)
+    (grid,) = factory(300.0).iv_temperature_grid(v, TEMPS)
+    assert grid.shape == (TEMPS.size, v.size)
+    for k, T in enumerate(TEMPS):
+        ref = factory(float(T)).iv_characteristic(v)[0]
+        np.testing.assert_allclose(grid[k], ref, rtol=1e-9, atol=1e-30)
+
+
+def test_temperature_grid_validation_and_unsupported():
+    d = PNJunctionDiode(1e17, 1e17)
+    with pytest.raises(ValueError):
+        d.iv_temperature_grid(np.array([0.1]), np.array([300.0, -5.0]))
+    with pytest.raises(NotImplementedError):
+        MOSCapacitor(1e17).iv_temperature_grid(np.array([0.1]), TEMPS)
@@ -0,0 +1,59 @@
+# tests/test_total_recombination.py
+
+import unittest
+
+import numpy as np
+
+from semiconductor_sim.models import (
+    auger_recombination,
+    radiative_recombination,
+    srh_recombination,
+    total_recombination,
+)
+
+RTOL = 1e-12
+SMALL_BLOCK = 7
+
+
+def separate(n, p, **kw):
+    return (
+        srh_recombination(n, p, temperature=kw.get('temperature', 300))
+        + radiative_recombination(n, p)
+        + auger_recombination(n, p)
+    )
+
+
+class TestTotalRecombination(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.n = 10 ** rng.uniform(8, 19, (40, 30))
+        self.p = 10 ** rng.uniform(8, 19, (40, 30))
+
+    def test_matches_separate_models_across_blocks(self):
+        ref = separate(self.n, self.p)
+        got = total_recombination(self.n, self.p, block_size=SMALL_BLOCK)
+        np.testing.assert_allclose(got, ref, rtol=RTOL)
+
+    def test_components_and_out(self):
+        out = np.empty_like(self.n)
+        comps = total_recombination(self.n, self.p, out=out, return_components=True)
+        self.assertIs(comps.total, out)
+        np.testing.assert_allclose(comps.srh, srh_recombination(self.n, self.p), rtol=RTOL)
+        np.testing.assert_allclose(comps.radiative, radiative_recombination(self.n, self.p))
+        np.testing.assert_allclose(comps.auger, auger_recombination(self.n, self.p), rtol=RTOL)
+        np.testing.assert_allclose(comps.total, comps.srh + comps.radiative + comps.auger)
+
+    def test_broadcasting_and_scalars(self):
+        col, row = self.n[:, :1], self.p[:1, :]
+        got = total_recombination(col, row, temperature=350.0)
+        self.assertEqual(got.shape, self.n.shape)
+        np.testing.assert_allclose(got, separate(col, row, temperature=350.0), rtol=RTOL)
+        scalar = total_recombination(1e17, 1e16)
+        self.assertIsInstance(scalar, float)
+        self.assertAlmostEqual(scalar, separate(1e17, 1e16), delta=abs(scalar) * RTOL)
+        with self.assertRaises(ValueError):
+            total_recombination(self.n, self.p, block_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
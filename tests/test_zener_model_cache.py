@@ -0,0 +1,115 @@
+import sys
+import warnings
+
+import joblib
+import numpy as np
+import pytest
+
+from semiconductor_sim import ZenerDiode
+from semiconductor_sim.devices import zener_diode
+from semiconductor_sim.devices.zener_diode import clear_zener_model_cache, get_zener_model
+
+PREDICTED_VZ = 6.2
+DEFAULT_VZ = 4.0
+
+
+class _ConstantModel:
+    def predict(self, X):
+        return np.full(len(X), PREDICTED_VZ)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_zener_model_cache()
+    yield
+    clear_zener_model_cache()
+
+
+def test_construction_does_not_touch_model(monkeypatch):
+    calls = []
+    monkeypatch.setattr(zener_diode, "get_zener_model", lambda path=None: calls.append(path))
+    z = ZenerDiode(1e17, 1e17)
+    assert calls == []
+    assert z.model is None
+    assert calls == [None]
+
+
+def test_model_loaded_once_and_shared(tmp_path, monkeypatch):
+    path = tmp_path / "model.pkl"
+    joblib.dump(_ConstantModel(), path)
+    monkeypatch.setattr(zener_diode, "MODEL_PATH", str(path))
+    loads = []
+    real_load = joblib.load
+    monkeypatch.setattr(joblib, "load", lambda p: loads.append(p) or real_load(p))
+
+    diodes = [ZenerDiode(1e17, 1e17) for _ in range(3)]
+    models = {id(d.model) for d in diodes}
+    assert len(loads) == 1
+    assert len(models) == 1
+    assert diodes[0].predict_zener_voltage() == PREDICTED_VZ
+
+    clear_zener_model_cache()
+    assert get_zener_model() is not diodes[0].model
+    assert len(loads) == len(models) + 1
+
+
+def test_missing_model_warns_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(zener_diode, "MODEL_PATH", str(tmp_path / "absent.pkl"))
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        for _ in range(3):
+            assert (
+                ZenerDiode(1e17, 1e17, zener_voltage=DEFAULT_VZ).predict_zener_voltage()
+                == DEFAULT_VZ
+            )
+        get_zener_model(str(tmp_path / "other.pkl"))
+    assert len([w for w in caught if "not found" in str(w.message)]) == 1
+
+
+def test_joblib_not_imported_for_missing_model(tmp_path, monkeypatch):
+    monkeypatch.setattr(zener_diode, "MODEL_PATH", str(tmp_path / "absent.pkl"))
+    monkeypatch.delitem(sys.modules, "joblib")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        ZenerDiode(1e17, 1e17).iv_characteristic(np.array([0.0, 1.0]))
+    assert "joblib" not in sys.modules
+
+
+class _CountingModel:
+    def __init__(self):
+        self.rows = []
+
+    def predict(self, X):
+        self.rows.append(len(X))
+        return X[:, 2] / 100.0
+
+
+def test_batch_prediction_broadcasts_and_dedupes():
+    model = _CountingModel()
+    T = np.array([300.0, 350.0, 300.0])
+    vz = zener_diode.predict_zener_voltages(1e17, np.array([[1e17], [2e17]]), T, model=model)
+    assert vz.shape == (2, 3)
+    np.testing.assert_allclose(vz, np.broadcast_to(T / 100.0, (2, 3)))
+    # Six broadcast rows, four distinct parameter sets, one model call
+    assert model.rows == [4]
+
+
+def test_batch_prediction_without_model_uses_fallback():
+    vz = zener_diode.predict_zener_voltages(
+        np.full(3, 1e17), 1e17, 300.0, model=None, zener_voltage=DEFAULT_VZ
+    )
+    np.testing.assert_array_equal(vz, np.full(3, DEFAULT_VZ))
+
+
+def test_iv_memoizes_prediction_per_parameter_set():
+    model = _CountingModel()
+    z = ZenerDiode(1e17, 1e17, temperature=300.0)
+    z.model = model
+    v = np.linspace(0.0, 5.0, 11)
+    for _ in range(5):
+        z.iv_characteristic(v)
+    assert len(model.rows) == 1
+    assert z.zener_voltage == pytest.approx(3.0)
+    z.temperature = 320.0
+    z.iv_characteristic(v)
+    assert model.rows == [1, 1]